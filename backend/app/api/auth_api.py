@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, Any
+from fastapi.security import HTTPAuthorizationCredentials
 
 from app.models.user import (
     UserSignupRequest,
@@ -10,22 +9,18 @@ from app.models.user import (
     UserResponse
 )
 from app.services.auth_service import AuthService
-from app.services.token_service import TokenService
 from app.repository.user_repository import UserRepository
 from app.core.database import users_collection
-from app.core.config import JWT_SECRET_KEY, JWT_ALGORITHM
+from app.middleware.auth_middleware import token_service, security
 
-# Initialize services
+# Initialize services (token_service is shared with the auth middleware so
+# both use one prepared key and one verification cache)
 user_repository = UserRepository(users_collection)
-token_service = TokenService(JWT_SECRET_KEY, JWT_ALGORITHM)
 auth_service = AuthService(user_repository, token_service)
 
 # Create router
 router = APIRouter()
 
-# Security scheme for protected routes
-security = HTTPBearer()
-
 
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def signup(request: UserSignupRequest):
@@ -41,7 +36,7 @@ async def signup(request: UserSignupRequest):
     Raises:
         HTTPException: If email already exists or signup fails
     """
-    success, data, error = auth_service.signup(request)
+    success, data, error = await auth_service.signup(request)
 
     if not success:
         raise HTTPException(
@@ -66,7 +61,7 @@ async def login(request: UserLoginRequest):
     Raises:
         HTTPException: If credentials are invalid
     """
-    success, data, error = auth_service.login(request)
+    success, data, error = await auth_service.login(request)
 
     if not success:
         raise HTTPException(
@@ -91,7 +86,7 @@ async def refresh_token(request: RefreshTokenRequest):
     Raises:
         HTTPException: If refresh token is invalid or expired
     """
-    success, data, error = auth_service.refresh_access_token(request.refresh_token)
+    success, data, error = await auth_service.refresh_access_token(request.refresh_token)
 
     if not success:
         raise HTTPException(
@@ -131,7 +126,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         HTTPException: If token is invalid or user not found
     """
     token = credentials.credentials
-    success, user_data, error = auth_service.verify_token(token)
+    success, user_data, error = await auth_service.verify_token(token)
 
     if not success:
         raise HTTPException(
@@ -142,29 +137,3 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
     return user_data
 
-
-# Dependency for protected routes
-async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    """
-    Dependency to extract user ID from JWT token
-
-    Args:
-        credentials: Bearer token from Authorization header
-
-    Returns:
-        User ID
-
-    Raises:
-        HTTPException: If token is invalid
-    """
-    token = credentials.credentials
-    payload = token_service.verify_access_token(token)
-
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-
-    return payload["user_id"]
@@ -1,14 +1,15 @@
-import asyncio
 from fastapi import APIRouter, File, UploadFile, Form, Depends
 from typing import Optional
 from pydantic import BaseModel
 from app.services.fact_check_service import FactCheckService
-from app.services.professional_fact_check_service import ProfessionalFactCheckService
 from app.middleware.auth_middleware import get_current_user_id
+from app.core.concurrency import fact_check_executor
 
 router = APIRouter()
 service = FactCheckService()
-professional_service = ProfessionalFactCheckService()
+# Every endpoint runs through the one FactCheckService pipeline, so there is a
+# single ProfessionalFactCheckService (and Perplexity/X clients) per process
+professional_service = service.professional_service
 
 class ClaimInput(BaseModel):
     claim_text: str
@@ -18,11 +19,8 @@ class URLInput(BaseModel):
 
 @router.post("/")
 async def check_claim(data: ClaimInput):
-    # Run blocking check_fact in threadpool to prevent blocking event loop
     # Using professional service with full pipeline
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, professional_service.check_fact, data.claim_text)
-    return result
+    return await service.run_pipeline(data.claim_text)
 
 @router.post("/multimodal")
 async def check_multimodal_claim(
@@ -35,24 +33,14 @@ async def check_multimodal_claim(
     if not claim_text and not file:
         return {"error": "Either claim_text or file must be provided"}
 
-    loop = asyncio.get_event_loop()
-
     if file:
-        # Read file content
-        file_content = await file.read()
-        result = await loop.run_in_executor(
-            None,
-            service.check_multimodal_fact,
-            claim_text or "",
-            file_content,
-            file.content_type,
-            file.filename
-        )
-    else:
-        # Text only
-        result = await loop.run_in_executor(None, service.check_fact, claim_text)
+        # Pass the upload's spooled file object through instead of reading it
+        # into memory; the extractor streams it to disk in chunks
+        await file.seek(0)
+        return await service.run_pipeline(claim_text, media=(file.file, file.content_type, file.filename))
 
-    return result
+    # Text only: a single Gemini prompt, fully async
+    return await service.run_pipeline(claim_text, professional=False)
 
 @router.post("/url")
 async def check_url_claim(data: URLInput):
@@ -60,6 +48,4 @@ async def check_url_claim(data: URLInput):
     Handle fact checking from a URL/link.
     Extracts article content and fact-checks the main claims.
     """
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, service.check_url_fact, data.url)
-    return result
+    return await service.run_pipeline(url=data.url)
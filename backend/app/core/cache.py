@@ -0,0 +1,104 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+import orjson
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry expiry and LRU eviction.
+
+    Services run inside the threadpool executor, so all access is guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        """
+        Args:
+            maxsize (int): Maximum number of entries before the least recently used is evicted
+            ttl (float): Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None):
+        """Store value under key, expiring after ttl seconds (defaults to the cache TTL)."""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove key and return its value, or default if it was not cached."""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return item[1] if item is not None else default
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        """Whether key is cached and unexpired (does not count as a use for LRU)."""
+        with self._lock:
+            item = self._data.get(key)
+            return item is not None and time.monotonic() < item[0]
+
+    def __len__(self):
+        return len(self._data)
+
+
+class Snapshot:
+    """orjson encoding of a cached dict/list; every thaw() decodes a fresh, independent copy."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+# Types orjson would silently turn into strings (datetimes, dataclasses, str/dict
+# subclasses) raise instead, so those values fall back to deepcopy unchanged
+_SNAPSHOT_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+
+def freeze(value):
+    """
+    Copy a value for storing in a cache, so later changes by the caller can't
+    leak into it. JSON-shaped dicts/lists are encoded with orjson, which is
+    much cheaper than deepcopy on both store and read.
+    """
+    if isinstance(value, (dict, list)):
+        try:
+            return Snapshot(orjson.dumps(value, option=_SNAPSHOT_OPTIONS))
+        except TypeError:
+            return copy.deepcopy(value)
+    return value
+
+
+def thaw(value):
+    """Return a caller-owned copy of a value stored with freeze()."""
+    if isinstance(value, Snapshot):
+        return orjson.loads(value.data)
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
@@ -0,0 +1,206 @@
+import asyncio
+import copy
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from app.core.config import FACT_CHECK_WORKERS
+
+log = logging.getLogger(__name__)
+
+# Dedicated pool for the blocking pipelines. They spend nearly all their time
+# waiting on HTTP calls, so threads (not processes) are the right fit, and a
+# separate pool keeps long fact-checks from starving the default executor.
+fact_check_executor = ThreadPoolExecutor(max_workers=FACT_CHECK_WORKERS, thread_name_prefix="fact-check")
+
+# Work a running fact-check starts ahead of time (e.g. structuring while the
+# cache lookup is in flight). Kept apart from fact_check_executor so a pipeline
+# never waits on a task queued behind other pipelines in its own pool.
+prefetch_executor = ThreadPoolExecutor(max_workers=FACT_CHECK_WORKERS, thread_name_prefix="prefetch")
+
+# Claim saves that finish after the response has been returned; drained at shutdown
+save_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="claim-save")
+
+
+async def coalesce(inflight: dict, key, make_call):
+    """
+    Collapse concurrent identical calls into one.
+
+    The first caller for a key starts make_call(); callers arriving while it
+    is still running await the same task instead of issuing their own. The
+    task is shielded, so a cancelled caller doesn't cancel it for the others.
+
+    Args:
+        inflight (dict): Per-owner map of key -> running task
+        key: Hashable identity of the call (e.g. a prompt cache key)
+        make_call (callable): Zero-argument function returning the coroutine to run
+
+    Returns:
+        The call's result; callers that joined a running call get a deep copy,
+        so no two callers share a mutable result
+    """
+    task = inflight.get(key)
+    if task is not None:
+        return copy.deepcopy(await asyncio.shield(task))
+
+    task = asyncio.ensure_future(make_call())
+    inflight[key] = task
+    task.add_done_callback(lambda _: inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+class MicroBatcher:
+    """
+    Groups blocking calls that arrive close together into one batched call.
+
+    The first caller to arrive opens a batch and becomes its leader: it waits
+    up to `window` seconds (or until `max_size` items have joined), runs
+    run_many on everything collected, and hands each caller its own result.
+    Callers block either way, so batching needs no extra thread. An item that
+    run_many can't answer (None in its slot, or run_many raising) is run with
+    run_one by its own caller, so a bad batch never costs more than the solo
+    calls it replaced. Items are only batched with items of the same group.
+    """
+
+    def __init__(self, run_one, run_many, max_size: int = 8, window: float = 0.05):
+        """
+        Args:
+            run_one (callable): item -> result, for a single item
+            run_many (callable): list of items -> list of results (None where an item wasn't answered)
+            max_size (int): Most items per batch; 1 or less disables batching
+            window (float): Seconds the leader waits for other items to join
+        """
+        self.run_one = run_one
+        self.run_many = run_many
+        self.max_size = max_size
+        self.window = window
+        self._lock = threading.Lock()
+        # Open (collecting) batch per group
+        self._open = {}
+
+    def call(self, item, group=None):
+        """
+        Run item, batched with other items of the same group submitted within the window.
+
+        Args:
+            item: Work item passed to run_one/run_many
+            group: Hashable key; only items with equal groups share a batch
+        """
+        if self.max_size <= 1:
+            return self.run_one(item)
+
+        future = Future()
+        with self._lock:
+            batch = self._open.get(group)
+            is_leader = batch is None
+            if is_leader:
+                batch = self._open[group] = ([], threading.Event())
+            items, full = batch
+            items.append((item, future))
+            if len(items) >= self.max_size:
+                # Closed: later callers start a new batch
+                del self._open[group]
+                full.set()
+
+        if is_leader:
+            full.wait(self.window)
+            with self._lock:
+                if self._open.get(group) is batch:
+                    del self._open[group]
+            self._dispatch(items)
+
+        result = future.result()
+        return self.run_one(item) if result is None else result
+
+    def _dispatch(self, items: list):
+        if len(items) == 1:
+            items[0][1].set_result(None)
+            return
+        try:
+            results = self.run_many([item for item, _ in items])
+        except Exception as e:
+            log.warning("[MicroBatcher] Batch of %d failed, running items individually: %s", len(items), e)
+            results = [None] * len(items)
+        for (_, future), result in zip(items, results):
+            future.set_result(result)
+
+
+class AIMDLimiter:
+    """
+    Async concurrency limiter for calls to a rate-limited provider.
+
+    The number of in-flight calls adapts AIMD-style: each successful call adds
+    a fraction of a slot (additive increase), and an overload error halves the
+    limit (multiplicative decrease). If a target latency is set, the limit also
+    stops growing while recent calls are slower than the target.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 32,
+                 increase: float = 0.5, decrease: float = 0.5,
+                 target_latency: float = None, window: int = 50):
+        """
+        Args:
+            initial (int): Starting concurrency limit
+            minimum (int): Lowest the limit can drop to
+            maximum (int): Highest the limit can grow to
+            increase (float): Slots added per successful call
+            decrease (float): Factor applied to the limit on overload
+            target_latency (float): Optional latency (seconds) above which the limit stops growing
+            window (int): Number of recent latencies kept for the target comparison
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._latencies = deque(maxlen=window)
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return max(self.minimum, int(self._limit))
+
+    @asynccontextmanager
+    async def slot(self, is_overload=lambda exc: False):
+        """
+        Hold one concurrency slot for the duration of the block.
+
+        Args:
+            is_overload (callable): Predicate deciding whether an exception raised
+                inside the block signals provider overload
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as exc:
+            await self._release(started, overloaded=is_overload(exc))
+            raise
+        else:
+            await self._release(started, latency=time.monotonic() - started)
+
+    async def _release(self, started: float, overloaded: bool = False, latency: float = None):
+        async with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                # Only back off once per congestion event: calls that started
+                # before the last decrease were already accounted for
+                if started >= self._last_decrease:
+                    self._limit = max(self.minimum, self._limit * self.decrease)
+                    self._last_decrease = time.monotonic()
+            elif latency is not None:
+                self._latencies.append(latency)
+                too_slow = (self.target_latency is not None
+                            and statistics.median(self._latencies) > self.target_latency)
+                if not too_slow:
+                    self._limit = min(self.maximum, self._limit + self.increase)
+            self._cond.notify_all()
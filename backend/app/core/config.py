@@ -1,7 +1,9 @@
 import os
+import secrets
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
+# Load environment variables from .env file (the only place .env is read;
+# every other module imports its settings from here)
 load_dotenv()
 
 # Configuration settings for the app (Mongo URI etc.)
@@ -16,6 +18,12 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # Perplexity API Configuration
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
+# Async research requests allowed in flight at once per process, so gathered
+# calls queue locally instead of tripping the API's rate limit
+PERPLEXITY_MAX_CONCURRENCY = int(os.getenv("PERPLEXITY_MAX_CONCURRENCY", "10"))
+# Send research request bodies gzip-compressed (Content-Encoding: gzip); off unless
+# the endpoint is known to accept compressed bodies
+PERPLEXITY_GZIP_REQUESTS = os.getenv("PERPLEXITY_GZIP_REQUESTS", "false").lower() == "true"
 
 # X (Twitter) Analysis Configuration — RapidAPI Twttr API
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY", "")
@@ -23,12 +31,77 @@ RAPIDAPI_HOST = os.getenv("RAPIDAPI_HOST", "twitter241.p.rapidapi.com")
 X_ANALYSIS_ENABLED = os.getenv("X_ANALYSIS_ENABLED", "true").lower() == "true"
 X_SEARCH_LIMIT = int(os.getenv("X_SEARCH_LIMIT", "20"))
 
+# In-process claim cache (sits in front of the MongoDB claim cache)
+CLAIM_CACHE_TTL_SECONDS = int(os.getenv("CLAIM_CACHE_TTL_SECONDS", "86400"))
+CLAIM_CACHE_MAX_SIZE = int(os.getenv("CLAIM_CACHE_MAX_SIZE", "1024"))
+# Reworded claims: a claim whose embedding is at least this similar to a saved claim's
+# (and that has the same language, numbers, dates and negation) gets that claim's
+# stored fact-check. The verdict is reused as is, so the bar is high and it is opt-in.
+CLAIM_SEMANTIC_CACHE_ENABLED = os.getenv("CLAIM_SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+CLAIM_SEMANTIC_THRESHOLD = float(os.getenv("CLAIM_SEMANTIC_THRESHOLD", "0.95"))
+# Most recently saved claims kept in the in-process similarity index (scanned linearly)
+CLAIM_SEMANTIC_INDEX_SIZE = int(os.getenv("CLAIM_SEMANTIC_INDEX_SIZE", "1000"))
+
+# In-process cache of Gemini claim-structuring results (exact-match repeats skip the API call)
+STRUCTURING_CACHE_TTL_SECONDS = int(os.getenv("STRUCTURING_CACHE_TTL_SECONDS", "3600"))
+STRUCTURING_CACHE_MAX_SIZE = int(os.getenv("STRUCTURING_CACHE_MAX_SIZE", "1024"))
+
+# In-process cache of LLM/research responses keyed by (model, prompt) hash
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+LLM_CACHE_MAX_SIZE = int(os.getenv("LLM_CACHE_MAX_SIZE", "4096"))
+
+# Perplexity research cache keyed by the claim (exact), plus an opt-in embedding-similarity
+# tier that matches reworded claims with the same type, scope, location and time period
+# (and the same numbers, dates and negation)
+RESEARCH_CACHE_TTL_SECONDS = int(os.getenv("RESEARCH_CACHE_TTL_SECONDS", "21600"))
+RESEARCH_CACHE_MAX_SIZE = int(os.getenv("RESEARCH_CACHE_MAX_SIZE", "1000"))
+RESEARCH_SEMANTIC_CACHE_ENABLED = os.getenv("RESEARCH_SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+RESEARCH_SEMANTIC_THRESHOLD = float(os.getenv("RESEARCH_SEMANTIC_THRESHOLD", "0.92"))
+GEMINI_EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "text-embedding-004")
+# Claims whose research found nothing are not re-researched with the same query for this
+# long; kept short so a claim is checked again once news about it has had time to appear
+RESEARCH_NEGATIVE_TTL_SECONDS = int(os.getenv("RESEARCH_NEGATIVE_TTL_SECONDS", "900"))
+# Redis shared by all worker processes as a second exact-match research cache tier (off when empty)
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+# Worker threads for the blocking fact-check pipelines (I/O-bound: Gemini/Perplexity/X calls)
+FACT_CHECK_WORKERS = int(os.getenv("FACT_CHECK_WORKERS", "32"))
+# Multimodal (upload) fact-checks allowed in flight at once
+FACT_CHECK_CONCURRENCY = int(os.getenv("FACT_CHECK_CONCURRENCY", "16"))
+# Media extractions (audio conversion, frame/file handling) run at once; defaults to the core count
+EXTRACT_CONCURRENCY = int(os.getenv("EXTRACT_CONCURRENCY", str(os.cpu_count() or 4)))
+# Claims sent to Gemini per prompt by FactCheckService.check_facts_batch
+FACT_CHECK_BATCH_SIZE = int(os.getenv("FACT_CHECK_BATCH_SIZE", "8"))
+# Opt-in: professional verdicts in the same language requested within this window
+# share one Gemini call (up to VERDICT_BATCH_SIZE claims per prompt). Off by default
+# (1) because a batched verdict can depend on the other claims in its batch, while
+# the claim caches assume the same claim and evidence always get the same verdict.
+VERDICT_BATCH_SIZE = int(os.getenv("VERDICT_BATCH_SIZE", "1"))
+VERDICT_BATCH_WINDOW_SECONDS = float(os.getenv("VERDICT_BATCH_WINDOW_SECONDS", "0.05"))
+
+# Deadline and retry attempts for short one-shot Gemini prompts (fact check, moderation)
+GEMINI_TIMEOUT_SECONDS = int(os.getenv("GEMINI_TIMEOUT_SECONDS", "15"))
+GEMINI_MAX_RETRIES = int(os.getenv("GEMINI_MAX_RETRIES", "3"))
+
+# Share of short, unsuspicious inputs still sent to the Gemini moderation check
+LLM_MODERATION_RATIO = float(os.getenv("LLM_MODERATION_RATIO", "0.05"))
+# Inputs at least this long always get the Gemini moderation check
+LLM_MODERATION_MIN_LENGTH = int(os.getenv("LLM_MODERATION_MIN_LENGTH", "500"))
+
+# Background claim saves: rows per insert_many and how long to wait for a batch to fill
+SAVE_BATCH_SIZE = int(os.getenv("SAVE_BATCH_SIZE", "50"))
+SAVE_BATCH_DELAY_SECONDS = float(os.getenv("SAVE_BATCH_DELAY_SECONDS", "0.2"))
+
+# Keep-alive connections opened to each external API at startup
+WARMUP_CONNECTIONS = int(os.getenv("WARMUP_CONNECTIONS", "4"))
+
 # Server Configuration
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 BACKEND_PORT = int(os.getenv("BACKEND_PORT", "8000"))
 BACKEND_HOST = os.getenv("BACKEND_HOST", "0.0.0.0")
+# Root log level; WARNING in production skips the per-request INFO/DEBUG diagnostics
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
 # JWT Authentication Configuration
-import secrets
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", secrets.token_urlsafe(32))
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
@@ -1,18 +1,17 @@
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
-from dotenv import load_dotenv
-import os
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Get MongoDB URI from environment variables
-MONGO_URI = os.getenv("MONGO_URI")
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import MONGO_URI
 
 # Connect to MongoDB client
 client = MongoClient(MONGO_URI)
 db = client["factchecker_db"]  # Specify database name for MongoDB Atlas
 
+# Async client for repositories awaited directly from request handlers
+# (the sync client above serves the threadpool-based fact-check pipeline)
+async_client = AsyncIOMotorClient(MONGO_URI)
+async_db = async_client["factchecker_db"]
+
 # Check MongoDB connection
 try:
     client.admin.command('ping')
@@ -22,4 +21,4 @@ except ConnectionFailure:
 
 # Collections
 claims_collection = db["claims"]
-users_collection = db["users"]
+users_collection = async_db["users"]
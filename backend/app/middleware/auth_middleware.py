@@ -5,7 +5,7 @@ from typing import Dict, Optional
 from app.services.token_service import TokenService
 from app.core.config import JWT_SECRET_KEY, JWT_ALGORITHM
 
-# Initialize token service
+# Initialize token service (single shared instance, also used by auth_api)
 token_service = TokenService(JWT_SECRET_KEY, JWT_ALGORITHM)
 
 # Security scheme
@@ -1,6 +1,19 @@
 from pydantic import BaseModel
+from typing import List
 
 class Claim(BaseModel):
     claim_text: str
     verdict: str  # 'true', 'false', 'unverified'
     evidence: list
+
+class StructuredClaim(BaseModel):
+    """Response schema Gemini must follow when structuring a raw claim"""
+    task: str
+    claim: str
+    claim_type: str  # protest_arrest, accident_death, government_scheme, heritage_environment, politics, crime, health_science, other
+    geographic_scope: str  # local, district, state, national, international
+    location: str
+    context: str
+    entities: List[str]
+    time_period: str
+    output_format: str
@@ -1,7 +1,12 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional
-from datetime import datetime
-import re
+from datetime import datetime, timezone
+import string
+
+# Character classes required by the password strength check
+_PW_UPPER = frozenset(string.ascii_uppercase)
+_PW_LOWER = frozenset(string.ascii_lowercase)
+_PW_DIGIT = frozenset(string.digits)
 
 
 class UserSignupRequest(BaseModel):
@@ -14,13 +19,13 @@ class UserSignupRequest(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
+        # Minimum length is already enforced by Field(min_length=8).
+        # isdisjoint() scans the password in C and stops at the first match.
+        if _PW_UPPER.isdisjoint(v):
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if _PW_LOWER.isdisjoint(v):
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'[0-9]', v):
+        if _PW_DIGIT.isdisjoint(v):
             raise ValueError('Password must contain at least one digit')
         return v
 
@@ -58,5 +63,5 @@ class User(BaseModel):
     name: str
     email: str
     password_hash: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
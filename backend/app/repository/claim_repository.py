@@ -1,17 +1,68 @@
 from ..core.database import claims_collection
-from datetime import datetime
-import uuid
+from ..core.cache import TTLCache
+from ..core.config import (
+    CLAIM_CACHE_TTL_SECONDS, CLAIM_CACHE_MAX_SIZE, CLAIM_SEMANTIC_CACHE_ENABLED,
+    CLAIM_SEMANTIC_INDEX_SIZE, CLAIM_SEMANTIC_THRESHOLD,
+)
+from datetime import datetime, timezone
+from bson import Binary, ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import hashlib
+import logging
+import threading
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+# Process-wide front cache keyed by claim hash, shared by every repository instance
+_claim_cache = TTLCache(maxsize=CLAIM_CACHE_MAX_SIZE, ttl=CLAIM_CACHE_TTL_SECONDS)
+
+# Similarity index over recently saved claims: a ring buffer of unit
+# embeddings (one float32 row per claim) with the matching claim hashes,
+# oldest overwritten first. Embeddings are also stored on the claim
+# documents (as float32 bytes) so the index is rebuilt on startup.
+_claim_index = {"matrix": None, "hashes": [None] * CLAIM_SEMANTIC_INDEX_SIZE, "next": 0, "count": 0}
+_embeddings_lock = threading.Lock()
+_semantic_stats = {"lookups": 0, "hits": 0}
+
+
+def _index_embedding(embedding, claim_hash):
+    """Add a claim embedding to the similarity index (caller holds _embeddings_lock)."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    matrix = _claim_index["matrix"]
+    if matrix is None or matrix.shape[1] != vector.shape[0]:
+        # First embedding, or the embedding model changed: start a fresh index
+        matrix = _claim_index["matrix"] = np.zeros((CLAIM_SEMANTIC_INDEX_SIZE, vector.shape[0]), dtype=np.float32)
+        _claim_index["next"] = _claim_index["count"] = 0
+    row = _claim_index["next"]
+    matrix[row] = vector
+    _claim_index["hashes"][row] = claim_hash
+    _claim_index["next"] = (row + 1) % CLAIM_SEMANTIC_INDEX_SIZE
+    _claim_index["count"] = min(_claim_index["count"] + 1, CLAIM_SEMANTIC_INDEX_SIZE)
 
 
 class ClaimRepository:
     def __init__(self):
         self.collection = claims_collection
 
+    def create_indexes(self):
+        """
+        Create the indexes required by the repository.
+        Called once from the application startup event.
+        """
+        # Unique over binary hashes only, so legacy hex-string hashes (which may
+        # contain duplicates) don't block index creation
+        self.collection.create_index(
+            "claim_hash",
+            unique=True,
+            partialFilterExpression={"claim_hash": {"$type": "binData"}}
+        )
+
     def find_cached_claim(self, claim_text: str):
         """
         Check if an exact claim already exists in the database.
-        Uses a hash for efficient lookup.
+        Uses a hash for efficient lookup; hot claims are served from an
+        in-process cache without a MongoDB round-trip.
 
         Args:
             claim_text (str): The claim to search for
@@ -21,16 +72,87 @@ class ClaimRepository:
         """
         claim_hash = self._hash_claim(claim_text)
 
+        cached = _claim_cache.get(claim_hash)
+        if cached:
+            log.debug("Memory cache hit for claim: %.50s...", claim_text)
+            return cached
+
         try:
-            cached = self.collection.find_one({"claim_hash": claim_hash})
+            # The $type predicate matches the partial index filter so the
+            # planner can use the claim_hash index
+            cached = self.collection.find_one({"claim_hash": {"$eq": claim_hash, "$type": "binData"}})
             if cached:
-                print(f"Cache hit for claim: {claim_text[:50]}...")
+                log.debug("Cache hit for claim: %.50s...", claim_text)
+                _claim_cache.set(claim_hash, cached)
             return cached
         except Exception as e:
-            print(f"Error checking cache: {str(e)}")
+            log.error("Error checking cache: %s", e)
             return None
 
-    def save(self, claim_text: str, response_text: str, structured_data: dict = None, research_data: dict = None):
+    def find_similar_claim(self, embedding: list, threshold: float = CLAIM_SEMANTIC_THRESHOLD, accept=None):
+        """
+        Find the saved claim most similar to a new (e.g. reworded) claim.
+
+        Args:
+            embedding (list): Unit-length embedding of the new claim
+            threshold (float): Minimum cosine similarity for a match
+            accept (callable): Caller's claim -> bool check that the match really is the same claim
+
+        Returns:
+            tuple: (cached claim data or None, best cosine similarity found)
+        """
+        best_hash, best_score = None, 0.0
+        with _embeddings_lock:
+            count = _claim_index["count"]
+            matrix = _claim_index["matrix"]
+            if count and matrix.shape[1] == len(embedding):
+                scores = matrix[:count] @ np.asarray(embedding, dtype=np.float32)
+                best = int(scores.argmax())
+                best_hash, best_score = _claim_index["hashes"][best], float(scores[best])
+
+        cached = None
+        if best_hash is not None and best_score >= threshold:
+            cached = _claim_cache.get(best_hash)
+            if cached is None:
+                try:
+                    cached = self.collection.find_one({"claim_hash": {"$eq": best_hash, "$type": "binData"}})
+                except Exception as e:
+                    log.error("Error checking cache: %s", e)
+        if cached and accept is not None and not accept(cached):
+            log.debug("Similar claim rejected (similarity %.3f)", best_score)
+            cached = None
+
+        _semantic_stats["lookups"] += 1
+        if cached:
+            _semantic_stats["hits"] += 1
+            _claim_cache.set(best_hash, cached)
+        log.debug("Similar-claim cache %s (best similarity %.3f, hit rate %d/%d)", "hit" if cached else "miss",
+                  best_score, _semantic_stats["hits"], _semantic_stats["lookups"])
+        return cached, best_score
+
+    def load_embeddings(self):
+        """
+        Rebuild the similar-claim index from the most recently saved claims.
+        Called once from the application startup event.
+        """
+        if not CLAIM_SEMANTIC_CACHE_ENABLED:
+            return
+        try:
+            docs = list(
+                self.collection.find({"embedding": {"$exists": True}}, {"claim_hash": 1, "embedding": 1})
+                .sort("created_at", -1)
+                .limit(CLAIM_SEMANTIC_INDEX_SIZE)
+            )
+        except Exception as e:
+            log.error("Error loading claim embeddings: %s", e)
+            return
+        with _embeddings_lock:
+            for doc in reversed(docs):
+                _index_embedding(np.frombuffer(doc["embedding"], dtype=np.float32), doc["claim_hash"])
+        log.info("Loaded %d claim embeddings", len(docs))
+
+    def save(self, claim_text: str, response_text: str, structured_data: dict = None, research_data: dict = None,
+             embedding: list = None):
         """
         Save the claim, response, and research data into MongoDB.
 
@@ -39,29 +161,77 @@ class ClaimRepository:
             response_text (str): Formatted fact-check result
             structured_data (dict): Structured claim data
             research_data (dict): Perplexity research results
+            embedding (list): Unit-length claim embedding for find_similar_claim (optional)
         """
-        claim_hash = self._hash_claim(claim_text)
+        claim_doc = self._build_doc(claim_text, response_text, structured_data, research_data)
+        if embedding is not None:
+            claim_doc["embedding"] = Binary(np.asarray(embedding, dtype=np.float32).tobytes())
 
-        claim_doc = {
-            "_id": str(uuid.uuid4()),
-            "claim_hash": claim_hash,
+        try:
+            result = self.collection.insert_one(claim_doc)
+            _claim_cache.set(claim_doc["claim_hash"], claim_doc)
+            if embedding is not None:
+                with _embeddings_lock:
+                    _index_embedding(embedding, claim_doc["claim_hash"])
+            log.info("Saved claim to database: %.50s...", claim_text)
+            return str(result.inserted_id)
+        except DuplicateKeyError:
+            # A concurrent request for the same claim saved it first
+            log.debug("Claim already cached: %.50s...", claim_text)
+            return None
+        except Exception as e:
+            log.error("Error saving claim: %s", e)
+            return None
+
+    def save_many(self, records: list):
+        """
+        Save several claims in one bulk insert.
+
+        Args:
+            records (list): (claim_text, response_text) tuples
+
+        Returns:
+            int: Number of claims inserted
+        """
+        if not records:
+            return 0
+
+        docs = [self._build_doc(claim_text, response_text) for claim_text, response_text in records]
+
+        try:
+            # Unordered so one duplicate doesn't stop the rest of the batch
+            result = self.collection.insert_many(docs, ordered=False)
+            inserted = len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Duplicates were saved by an earlier request; everything else went in
+            inserted = e.details.get("nInserted", 0)
+            failed = {err["index"] for err in e.details.get("writeErrors", [])}
+            docs = [doc for i, doc in enumerate(docs) if i not in failed]
+        except Exception as e:
+            log.error("Error saving claims: %s", e)
+            return 0
+
+        for doc in docs:
+            _claim_cache.set(doc["claim_hash"], doc)
+        log.info("Saved %d claims to database", inserted)
+        return inserted
+
+    def _build_doc(self, claim_text: str, response_text: str, structured_data: dict = None, research_data: dict = None) -> dict:
+        now = datetime.now(timezone.utc)
+
+        # _id is left to MongoDB: ObjectIds are 12 bytes and increase
+        # monotonically, so inserts append to the right edge of the _id index
+        return {
+            "claim_hash": self._hash_claim(claim_text),
             "prompt": claim_text,
             "response": response_text,
             "structured_data": structured_data or {},
             "research_data": research_data or {},
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
 
-        try:
-            self.collection.insert_one(claim_doc)
-            print(f"Saved claim to database: {claim_text[:50]}...")
-            return claim_doc["_id"]
-        except Exception as e:
-            print(f"Error saving claim: {str(e)}")
-            return None
-
-    def _hash_claim(self, claim_text: str) -> str:
+    def _hash_claim(self, claim_text: str) -> Binary:
         """
         Create a hash of the claim for efficient lookup.
         Normalizes the text before hashing.
@@ -70,15 +240,24 @@ class ClaimRepository:
             claim_text (str): Claim to hash
 
         Returns:
-            str: SHA256 hash of normalized claim
+            Binary: 16-byte BLAKE2b digest of the normalized claim, stored as
+            BSON binary (a quarter of the size of a SHA-256 hex string)
         """
-        # Normalize: lowercase, strip whitespace, remove extra spaces
-        normalized = " ".join(claim_text.lower().strip().split())
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        # Normalize: casefold, collapse whitespace (split() also strips the ends)
+        normalized = " ".join(claim_text.casefold().split())
+        # Cache key only (no cryptographic requirement): BLAKE2b is faster than
+        # SHA-256 and the shorter digest keeps the claim_hash index small
+        return Binary(hashlib.blake2b(normalized.encode(), digest_size=16).digest())
 
     def get_by_id(self, claim_id: str):
         """Get claim by ID."""
-        return self.collection.find_one({"_id": claim_id})
+        try:
+            # Claims saved before the ObjectId switch use UUID strings as _id
+            if ObjectId.is_valid(claim_id):
+                return self.collection.find_one({"_id": ObjectId(claim_id)})
+            return self.collection.find_one({"_id": claim_id})
+        except Exception:
+            return None
 
     def get_all(self):
         """Get all claims."""
@@ -97,5 +276,5 @@ class ClaimRepository:
         try:
             return list(self.collection.find().sort("created_at", -1).limit(limit))
         except Exception as e:
-            print(f"Error retrieving recent claims: {str(e)}")
+            log.error("Error retrieving recent claims: %s", e)
             return []
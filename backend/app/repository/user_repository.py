@@ -1,24 +1,30 @@
-from pymongo.collection import Collection
+from motor.motor_asyncio import AsyncIOMotorCollection
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from bson import ObjectId
 
 
 class UserRepository:
     """Repository for user data operations in MongoDB"""
 
-    def __init__(self, collection: Collection):
+    def __init__(self, collection: AsyncIOMotorCollection):
         """
         Initialize the repository with a MongoDB collection
 
         Args:
-            collection: MongoDB collection for users
+            collection: Async (Motor) MongoDB collection for users
         """
         self.collection = collection
+
+    async def create_indexes(self) -> None:
+        """
+        Create the indexes required by the repository.
+        Called once from the application startup event.
+        """
         # Create unique index on email
-        self.collection.create_index("email", unique=True)
+        await self.collection.create_index("email", unique=True)
 
-    def create_user(self, name: str, email: str, password_hash: str) -> Dict[str, Any]:
+    async def create_user(self, name: str, email: str, password_hash: str) -> Dict[str, Any]:
         """
         Create a new user in the database
 
@@ -30,46 +36,49 @@ class UserRepository:
         Returns:
             Created user document
         """
+        now = datetime.now(timezone.utc)
         user_doc = {
             "name": name,
             "email": email.lower(),  # Store emails in lowercase for consistency
             "password_hash": password_hash,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
 
-        result = self.collection.insert_one(user_doc)
+        result = await self.collection.insert_one(user_doc)
         user_doc["_id"] = result.inserted_id
         return user_doc
 
-    def find_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+    async def find_by_email(self, email: str, projection: Optional[Dict[str, int]] = None) -> Optional[Dict[str, Any]]:
         """
         Find a user by email
 
         Args:
             email: User's email
+            projection: Optional MongoDB projection limiting the returned fields
 
         Returns:
             User document if found, None otherwise
         """
-        return self.collection.find_one({"email": email.lower()})
+        return await self.collection.find_one({"email": email.lower()}, projection)
 
-    def find_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+    async def find_by_id(self, user_id: str, projection: Optional[Dict[str, int]] = None) -> Optional[Dict[str, Any]]:
         """
         Find a user by ID
 
         Args:
             user_id: User's ObjectId as string
+            projection: Optional MongoDB projection limiting the returned fields
 
         Returns:
             User document if found, None otherwise
         """
         try:
-            return self.collection.find_one({"_id": ObjectId(user_id)})
+            return await self.collection.find_one({"_id": ObjectId(user_id)}, projection)
         except Exception:
             return None
 
-    def email_exists(self, email: str) -> bool:
+    async def email_exists(self, email: str) -> bool:
         """
         Check if an email already exists
 
@@ -79,9 +88,12 @@ class UserRepository:
         Returns:
             True if email exists, False otherwise
         """
-        return self.collection.count_documents({"email": email.lower()}) > 0
+        # Projecting only the indexed field makes this a covered query on the
+        # unique email index (no document fetch, stops at the first match)
+        user = await self.collection.find_one({"email": email.lower()}, {"_id": 0, "email": 1})
+        return user is not None
 
-    def update_password(self, user_id: str, new_password_hash: str) -> bool:
+    async def update_password(self, user_id: str, new_password_hash: str) -> bool:
         """
         Update user's password
 
@@ -93,12 +105,12 @@ class UserRepository:
             True if update successful, False otherwise
         """
         try:
-            result = self.collection.update_one(
+            result = await self.collection.update_one(
                 {"_id": ObjectId(user_id)},
                 {
                     "$set": {
                         "password_hash": new_password_hash,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -106,7 +118,7 @@ class UserRepository:
         except Exception:
             return False
 
-    def delete_user(self, user_id: str) -> bool:
+    async def delete_user(self, user_id: str) -> bool:
         """
         Delete a user
 
@@ -117,7 +129,7 @@ class UserRepository:
             True if delete successful, False otherwise
         """
         try:
-            result = self.collection.delete_one({"_id": ObjectId(user_id)})
+            result = await self.collection.delete_one({"_id": ObjectId(user_id)})
             return result.deleted_count > 0
         except Exception:
             return False
@@ -0,0 +1,127 @@
+from app.core.config import (
+    GEMINI_API_KEY, GEMINI_EMBEDDING_MODEL, GEMINI_MAX_RETRIES, GEMINI_TIMEOUT_SECONDS, WARMUP_CONNECTIONS,
+)
+from functools import lru_cache
+from google import genai
+from google.genai import types
+import asyncio
+import httpx
+import logging
+import math
+import random
+import time
+
+log = logging.getLogger(__name__)
+
+# Request config for short one-shot prompts: a hung call fails after the
+# deadline instead of holding a worker indefinitely
+TIMEOUT_CONFIG = types.GenerateContentConfig(
+    http_options=types.HttpOptions(timeout=GEMINI_TIMEOUT_SECONDS * 1000)
+)
+
+
+@lru_cache(maxsize=1)
+def get_client() -> genai.Client:
+    """
+    Process-wide Gemini client shared by every service.
+
+    One client means one HTTP connection pool and one auth setup for the
+    whole app instead of one per service instance.
+    """
+    return genai.Client(api_key=GEMINI_API_KEY)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check if a Gemini error is transient: overload, rate limit or timeout."""
+    if isinstance(error, httpx.TimeoutException):
+        return True
+    error_msg = str(error)
+    return ("503" in error_msg or "UNAVAILABLE" in error_msg or "overload" in error_msg.lower()
+            or "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg
+            or "504" in error_msg or "DEADLINE_EXCEEDED" in error_msg)
+
+
+def _backoff(attempt: int) -> float:
+    """Jittered exponential backoff: about 1, 2, 4... seconds, capped at 8."""
+    return min(2 ** attempt + random.random(), 8)
+
+
+def call_with_retry(func, retries: int = GEMINI_MAX_RETRIES):
+    """
+    Call a Gemini request function, retrying transient errors with backoff.
+
+    Args:
+        func: Zero-argument function making the request
+        retries (int): Maximum number of attempts
+
+    Returns:
+        The function result
+
+    Raises:
+        The last error if every attempt fails, or any non-transient error immediately
+    """
+    for attempt in range(retries):
+        try:
+            return func()
+        except Exception as e:
+            if not is_retryable(e) or attempt == retries - 1:
+                raise
+            wait_time = _backoff(attempt)
+            log.warning("[Gemini] Transient error (attempt %d/%d), retrying in %.1fs: %s", attempt + 1, retries, wait_time, e)
+            time.sleep(wait_time)
+
+
+async def call_with_retry_async(func, retries: int = GEMINI_MAX_RETRIES):
+    """
+    Async variant of call_with_retry.
+
+    Args:
+        func: Zero-argument function returning an awaitable request
+        retries (int): Maximum number of attempts
+
+    Returns:
+        The awaited result
+    """
+    for attempt in range(retries):
+        try:
+            return await func()
+        except Exception as e:
+            if not is_retryable(e) or attempt == retries - 1:
+                raise
+            wait_time = _backoff(attempt)
+            log.warning("[Gemini] Transient error (attempt %d/%d), retrying in %.1fs: %s", attempt + 1, retries, wait_time, e)
+            await asyncio.sleep(wait_time)
+
+
+def embed(text: str):
+    """
+    Unit-length embedding of text, so similarity is a plain dot product.
+
+    Returns:
+        list or None: Embedding values, or None if the embedding call fails
+    """
+    try:
+        response = get_client().models.embed_content(model=GEMINI_EMBEDDING_MODEL, contents=text)
+        values = response.embeddings[0].values
+    except Exception as e:
+        log.warning("[Gemini] Embedding failed, skipping similarity lookup: %s", e)
+        return None
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+async def warm_up(connections: int = WARMUP_CONNECTIONS) -> None:
+    """
+    Open connections to the Gemini API at startup so the first request
+    doesn't pay the TCP/TLS handshake.
+
+    Issues cheap model-list calls in parallel on both the sync client's pool
+    (from worker threads) and the async client's pool. Failures are only logged.
+    """
+    client = get_client()
+    calls = [asyncio.to_thread(client.models.list, config={"page_size": 1}) for _ in range(connections)]
+    calls += [client.aio.models.list(config={"page_size": 1}) for _ in range(connections)]
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        log.warning("[Gemini] Connection warm-up failed: %s", errors[0])
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Optional, Tuple
 from app.repository.user_repository import UserRepository
 from app.services.password_service import PasswordService
@@ -6,6 +7,11 @@ from app.models.user import UserSignupRequest, UserLoginRequest, UserResponse
 from datetime import datetime
 from pymongo.errors import DuplicateKeyError
 
+# Fields needed to authenticate a user and build a UserResponse
+LOGIN_PROJECTION = {"name": 1, "email": 1, "password_hash": 1, "created_at": 1}
+# Fields needed to build a UserResponse (never ships the password hash)
+PROFILE_PROJECTION = {"name": 1, "email": 1, "created_at": 1}
+
 
 class AuthService:
     """Service for authentication operations (signup, login, token refresh)"""
@@ -22,7 +28,7 @@ class AuthService:
         self.token_service = token_service
         self.password_service = PasswordService()
 
-    def signup(self, request: UserSignupRequest) -> Tuple[bool, Optional[Dict], Optional[str]]:
+    async def signup(self, request: UserSignupRequest) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Register a new user
 
@@ -33,15 +39,15 @@ class AuthService:
             Tuple of (success, user_data_with_tokens, error_message)
         """
         # Check if email already exists
-        if self.user_repo.email_exists(request.email):
+        if await self.user_repo.email_exists(request.email):
             return False, None, "Email already registered"
 
         try:
-            # Hash the password
-            password_hash = self.password_service.hash_password(request.password)
+            # Hash the password (Argon2 is CPU-bound, keep it off the event loop)
+            password_hash = await asyncio.to_thread(self.password_service.hash_password, request.password)
 
             # Create user in database
-            user_doc = self.user_repo.create_user(
+            user_doc = await self.user_repo.create_user(
                 name=request.name,
                 email=request.email,
                 password_hash=password_hash
@@ -74,7 +80,7 @@ class AuthService:
         except Exception as e:
             return False, None, f"Signup failed: {str(e)}"
 
-    def login(self, request: UserLoginRequest) -> Tuple[bool, Optional[Dict], Optional[str]]:
+    async def login(self, request: UserLoginRequest) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Authenticate a user and generate tokens
 
@@ -85,16 +91,25 @@ class AuthService:
             Tuple of (success, user_data_with_tokens, error_message)
         """
         # Find user by email
-        user_doc = self.user_repo.find_by_email(request.email)
+        user_doc = await self.user_repo.find_by_email(request.email, projection=LOGIN_PROJECTION)
         if not user_doc:
             return False, None, "Invalid email or password"
 
-        # Verify password
-        if not self.password_service.verify_password(request.password, user_doc["password_hash"]):
+        # Verify password (hashing is CPU-bound, keep it off the event loop)
+        password_valid = await asyncio.to_thread(
+            self.password_service.verify_password, request.password, user_doc["password_hash"]
+        )
+        if not password_valid:
             return False, None, "Invalid email or password"
 
-        # Generate tokens
         user_id = str(user_doc["_id"])
+
+        # Upgrade legacy bcrypt (or outdated Argon2) hashes now that we have the plain password
+        if self.password_service.needs_rehash(user_doc["password_hash"]):
+            new_hash = await asyncio.to_thread(self.password_service.hash_password, request.password)
+            await self.user_repo.update_password(user_id, new_hash)
+
+        # Generate tokens
         access_token = self.token_service.create_access_token(user_id, user_doc["email"])
         refresh_token = self.token_service.create_refresh_token(user_id, user_doc["email"])
 
@@ -115,7 +130,7 @@ class AuthService:
 
         return True, response_data, None
 
-    def refresh_access_token(self, refresh_token: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
+    async def refresh_access_token(self, refresh_token: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Generate a new access token using a refresh token
 
@@ -132,7 +147,7 @@ class AuthService:
 
         # Get user from database
         user_id = payload["user_id"]
-        user_doc = self.user_repo.find_by_id(user_id)
+        user_doc = await self.user_repo.find_by_id(user_id, projection={"email": 1})
         if not user_doc:
             return False, None, "User not found"
 
@@ -146,7 +161,7 @@ class AuthService:
 
         return True, response_data, None
 
-    def verify_token(self, access_token: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
+    async def verify_token(self, access_token: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Verify an access token and return user data
 
@@ -163,7 +178,7 @@ class AuthService:
 
         # Get user from database
         user_id = payload["user_id"]
-        user_doc = self.user_repo.find_by_id(user_id)
+        user_doc = await self.user_repo.find_by_id(user_id, projection=PROFILE_PROJECTION)
         if not user_doc:
             return False, None, "User not found"
 
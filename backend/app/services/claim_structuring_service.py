@@ -1,56 +1,194 @@
-from app.core.config import GEMINI_API_KEY, GEMINI_MODEL
-from google import genai
+from app.core.cache import TTLCache
+from app.core.concurrency import AIMDLimiter
+from app.core.config import GEMINI_API_KEY, GEMINI_MODEL, STRUCTURING_CACHE_MAX_SIZE, STRUCTURING_CACHE_TTL_SECONDS
+from app.models.claim import StructuredClaim
+from app.services._gemini import get_client
+from google.genai import types
+from pydantic import ValidationError
+import asyncio
+import hashlib
 import json
+import logging
+import random
 import re
+import threading
 import time
 
-class ClaimStructuringService:
+log = logging.getLogger(__name__)
+
+# Structured results keyed by the digest of the normalized claim text (casefolded,
+# whitespace collapsed, as for the claim cache); values are JSON strings so
+# callers always get a fresh dict they can mutate freely
+_structure_cache = TTLCache(maxsize=STRUCTURING_CACHE_MAX_SIZE, ttl=STRUCTURING_CACHE_TTL_SECONDS)
+
+# Structured results keyed by claim *template* (capitalised names and numbers
+# masked out), so claims that differ only by numbers/dates can reuse the
+# previous structure with the new values slotted in
+_template_cache = TTLCache(maxsize=512, ttl=STRUCTURING_CACHE_TTL_SECONDS)
+_TEMPLATE_SLOT_RE = re.compile(r'[A-Z][a-z]+(?:\s[A-Z][a-z]+)*|\d+')
+_TEMPLATE_PUNCT_RE = re.compile(r'[^\w\s{}]')
+# Capitalised spans that may differ between a cached template and a new claim:
+# only numbers and dates are swapped in, never names or places, whose change
+# can alter the claim type, scope, location and context Gemini inferred
+_TEMPLATE_DATE_WORDS = frozenset({
+    "January", "February", "March", "April", "May", "June", "July", "August",
+    "September", "October", "November", "December",
+    "Jan", "Feb", "Mar", "Apr", "Jun", "Jul", "Aug", "Sep", "Sept", "Oct", "Nov", "Dec",
+})
+# Negation markers (English, and Tamil: இல்லை / the -இல்லை verb suffix, அல்ல, மாட்டா-)
+_NEGATION_RE = re.compile(
+    r"n['’]t\b|\b(?:not|no|never|none|nobody|nothing|neither|nor|cannot)\b|இல்லை|ில்லை|அல்ல|மாட்டா",
+    re.IGNORECASE,
+)
+
+# Alternative search queries keyed by the canonical JSON of the structured claim
+_query_cache = TTLCache(maxsize=512, ttl=STRUCTURING_CACHE_TTL_SECONDS)
+
+# Successful Gemini translations keyed by the source text. Failed translations
+# (which fall back to the untranslated text) are never stored, so one transient
+# error doesn't pin an untranslated search query for the cache TTL
+_translation_cache = TTLCache(maxsize=512, ttl=STRUCTURING_CACHE_TTL_SECONDS)
+
+# Ask Gemini for bare, schema-conformant JSON so every field is always present
+# and the response can usually be parsed without the regex
+_JSON_RESPONSE_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=StructuredClaim,
+)
+_WORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9-]+\b')
+# Whitespace-separated tokens of 4+ characters (significant original-language words)
+_LONG_WORD_RE = re.compile(r'\S{4,}')
+# Time periods too vague to help a search query
+_VAGUE_TIMES = frozenset({"recent", "now", "current"})
+
+# Backoff for overloaded/rate-limited Gemini calls: jittered exponential delay,
+# never shorter than a server-provided Retry-After / retryDelay, and bounded by
+# a total sleep budget per call
+_BACKOFF_INITIAL_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 30
+_RETRY_BUDGET_SECONDS = 45
+_RETRY_AFTER_RE = re.compile(r'(?:retry[-_ ]?after|retryDelay)\W*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# Shared across requests so concurrent async structuring calls back off together
+_structuring_limiter = AIMDLimiter(initial=8, maximum=32)
+
+
+def _is_date_or_number(span: str) -> bool:
+    """True for a template span that is a number or made up of month names."""
+    return span.isdigit() or all(word in _TEMPLATE_DATE_WORDS for word in span.split())
+
+
+def claim_signature(text: str) -> tuple:
     """
-    Converts unstructured or vague user input into a clean, structured prompt
-    that follows a standardized schema for fact-checking.
+    The parts of a claim that embedding similarity can't be trusted to tell
+    apart: its numbers and dates (the spans template reuse may swap, in order)
+    and whether it is negated. Two claims whose signatures differ are
+    different claims however similar their embeddings are.
+
+    Args:
+        text (str): Claim text
+
+    Returns:
+        tuple: (numbers and dates, negated)
     """
+    figures = tuple(span for span in _TEMPLATE_SLOT_RE.findall(text) if _is_date_or_number(span))
+    return figures, _NEGATION_RE.search(text) is not None
 
-    def __init__(self):
-        if not GEMINI_API_KEY:
-            raise ValueError("GEMINI_API_KEY environment variable is not set")
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
-        self.model = GEMINI_MODEL
 
-    def structure_claim(self, claim_text: str, max_retries: int = 3) -> dict:
-        """
-        Structure any free-form user query or statement into a standardized format.
+def _parse_retry_after(error: Exception, error_msg: str):
+    """
+    Extract a server-suggested retry delay (seconds) from a Gemini API error, if any.
 
-        For long non-English text (>200 chars), pre-translates to English first
-        to prevent hallucinations in entity/location extraction.
+    Args:
+        error (Exception): The raised error (may carry an HTTP response with headers)
+        error_msg (str): str(error), searched for retryDelay / Retry-After hints
 
-        Args:
-            claim_text (str): Raw claim or question from user
-            max_retries (int): Maximum number of retry attempts for API overload
+    Returns:
+        float or None: Suggested delay in seconds
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+    match = _RETRY_AFTER_RE.search(error_msg)
+    return float(match.group(1)) if match else None
 
-        Returns:
-            dict: Structured claim following the schema
-        """
-        # For long non-English text, pre-translate to English to prevent
-        # Gemini from hallucinating wrong locations/entities from Tamil/Hindi text
-        is_non_english = any(ord(c) > 127 for c in claim_text.replace(' ', ''))
-        working_text = claim_text
-        if is_non_english and len(claim_text) > 200:
-            print(f"[Structuring] Pre-translating long non-English text ({len(claim_text)} chars)...")
-            translated = self.translate_to_english(claim_text)
-            if translated and translated != claim_text and len(translated) > len(claim_text) * 0.2:
-                working_text = translated
-                print(f"[Structuring] Using English translation for structuring ({len(translated)} chars)")
-            else:
-                if translated and len(translated) <= len(claim_text) * 0.2:
-                    print(f"[Structuring] Translation too short ({len(translated)} vs {len(claim_text)} chars) — using original text")
 
-        last_error = None
+def _first_json_object(text: str):
+    """
+    Return the first balanced {...} object in text, ignoring braces inside strings.
 
-        for attempt in range(max_retries):
-            try:
-                chat = self.client.chats.create(model=self.model)
+    Single left-to-right pass that stops at the closing brace, unlike a greedy
+    DOTALL regex that runs to the end of the text and backtracks.
 
-                structuring_prompt = f"""
+    Args:
+        text (str): Model output that may wrap a JSON object in extra prose
+
+    Returns:
+        str or None: The JSON object substring, or None if there is no complete object
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+# Common English words that carry no search value in key-term extraction
+_STOPWORDS = frozenset({
+    # Articles, pronouns, determiners
+    "the", "a", "an", "this", "that", "these", "those",
+    "it", "its", "he", "she", "they", "his", "her", "their",
+    "him", "them", "we", "our", "you", "your", "i", "my",
+    # Prepositions
+    "in", "on", "at", "to", "for", "of", "with", "by", "from",
+    "up", "about", "into", "through", "during", "before", "after",
+    "above", "below", "between", "under", "over", "out",
+    # Conjunctions & misc
+    "and", "but", "or", "nor", "not", "so", "yet",
+    "if", "then", "than", "too", "very", "just",
+    "also", "only", "own", "same", "other", "each", "every",
+    "all", "both", "few", "more", "most", "some", "such",
+    "no", "any", "many", "much", "several",
+    "which", "who", "whom", "what", "where", "when", "how", "why",
+    "there", "here", "now", "once",
+    # Common verbs (too generic for search)
+    "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did",
+    "will", "would", "shall", "should", "may", "might",
+    "must", "can", "could",
+    "said", "stated", "announced", "declared", "reported",
+    "according", "mentioned", "noted",
+    # Generic adjectives
+    "new", "old", "first", "last", "next",
+    "upcoming", "recent", "current", "present",
+})
+
+
+# Prompt templates are built once; only the claim/text placeholder varies per
+# call, so the long instruction prefix is byte-identical across requests
+_STRUCTURING_PROMPT_TEMPLATE = """
 You are an LLM whose job is to convert unstructured or vague user input into a clean, structured prompt that can be used for fact-checking.
 
 ### Your Goal
@@ -125,68 +263,314 @@ Output:
 }}
 
 Now convert this user input:
-"{working_text}"
+"{claim}"
 """
 
-                response = chat.send_message(structuring_prompt)
-                result_text = response.text.strip()
-
-                # Extract JSON from response (in case there's extra text)
-                json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-                if json_match:
-                    structured_data = json.loads(json_match.group())
-
-                    # Ensure all required keys are present with proper defaults
-                    required_schema = {
-                        "task": "fact_check",
-                        "claim": claim_text,
-                        "claim_type": "other",
-                        "geographic_scope": "national",
-                        "location": "",
-                        "context": "",
-                        "entities": [],
-                        "time_period": "",
-                        "output_format": "json"
-                    }
-
-                    # Merge AI response with required schema
-                    for key, default_value in required_schema.items():
-                        if key not in structured_data or structured_data[key] is None:
-                            structured_data[key] = default_value
-
-                    # Store original input for reference
-                    structured_data["original_input"] = claim_text
-
-                    return structured_data
-                else:
-                    # Fallback if JSON parsing fails
-                    return self._create_fallback_structure(claim_text)
+# Long non-English input: translate and structure in one call instead of two.
+# The extra instruction sits just before the input so the shared prefix is unchanged.
+_STRUCTURING_PROMPT_WITH_TRANSLATE_TEMPLATE = _STRUCTURING_PROMPT_TEMPLATE.replace(
+    "Now convert this user input:",
+    "The input below is not in English. First translate it to English internally, then extract "
+    "every field in English from that translation. Take names, locations and entities only from "
+    "the text itself — do not guess them. Output only the JSON.\n\n"
+    "Now convert this user input:",
+)
+
+_TRANSLATE_PROMPT_TEMPLATE = """Translate the following text to English. If it's already in English, return it as-is.
+Only output the translation, nothing else.
+
+Text: {text}"""
+
+
+class ClaimStructuringService:
+    """
+    Converts unstructured or vague user input into a clean, structured prompt
+    that follows a standardized schema for fact-checking.
+    """
+
+    def __init__(self):
+        if not GEMINI_API_KEY:
+            raise ValueError("GEMINI_API_KEY environment variable is not set")
+        self.client = get_client()
+        self.model = GEMINI_MODEL
+
+    def structure_claim(self, claim_text: str, max_retries: int = 3, bypass_cache: bool = False) -> dict:
+        """
+        Structure any free-form user query or statement into a standardized format.
+
+        For long non-English text (>200 chars), the prompt asks Gemini to translate
+        to English before extracting fields (one call) to prevent hallucinations
+        in entity/location extraction.
+
+        Args:
+            claim_text (str): Raw claim or question from user
+            max_retries (int): Maximum number of retry attempts for API overload
+            bypass_cache (bool): Force a fresh Gemini call even if this exact claim was structured recently
+
+        Returns:
+            dict: Structured claim following the schema
+        """
+        cached, cache_keys, structuring_prompt = self._prepare_structuring(claim_text, bypass_cache)
+        if cached is not None:
+            return cached
+
+        last_error = None
+        slept = 0.0
 
+        for attempt in range(max_retries):
+            try:
+                # Single-shot prompt: stateless generate_content, no chat session/history
+                response = self.client.models.generate_content(
+                    model=self.model,
+                    contents=structuring_prompt,
+                    config=_JSON_RESPONSE_CONFIG,
+                )
             except Exception as e:
                 last_error = e
                 error_msg = str(e)
 
-                # Check if it's a 503 (overload) error
-                if "503" in error_msg or "UNAVAILABLE" in error_msg or "overload" in error_msg.lower():
-                    if attempt < max_retries - 1:
-                        # Exponential backoff: wait 2^attempt seconds
-                        wait_time = 2 ** attempt
-                        print(f"Gemini API overloaded (attempt {attempt + 1}/{max_retries}). Retrying in {wait_time}s...")
+                if self._is_overload_error(error_msg):
+                    wait_time = self._backoff_delay(e, error_msg, attempt)
+                    if attempt < max_retries - 1 and slept + wait_time <= _RETRY_BUDGET_SECONDS:
+                        log.warning("Gemini API overloaded (attempt %d/%d). Retrying in %.1fs...", attempt + 1, max_retries, wait_time)
                         time.sleep(wait_time)
+                        slept += wait_time
                         continue
                     else:
-                        print(f"Gemini API overloaded after {max_retries} attempts. Using fallback structure.")
+                        log.warning("Gemini API overloaded after %d attempts. Using fallback structure.", attempt + 1)
+                        return self._create_fallback_structure(claim_text)
                 else:
-                    print(f"Claim structuring error: {error_msg}")
+                    log.error("Claim structuring error: %s", error_msg)
 
                 # If last attempt or non-retriable error, use fallback
                 if attempt == max_retries - 1:
                     return self._create_fallback_structure(claim_text)
+                continue
+
+            # Response handling stays outside the try: only the API call is guarded
+            return self._parse_structuring_response(response.text, claim_text, cache_keys)
 
         # If all retries failed, return fallback
-        print(f"All {max_retries} attempts failed. Using fallback structure.")
+        log.warning("All %d attempts failed. Using fallback structure.", max_retries)
         return self._create_fallback_structure(claim_text)
 
+    async def structure_claim_async(self, claim_text: str, max_retries: int = 3, bypass_cache: bool = False) -> dict:
+        """
+        Async variant of structure_claim for callers running on the event loop.
+
+        Uses the SDK's async client so no thread is blocked on network I/O, and
+        bounds concurrent Gemini calls with a shared AIMD limiter that backs off
+        when the API reports overload.
+
+        Args:
+            claim_text (str): Raw claim or question from user
+            max_retries (int): Maximum number of retry attempts for API overload
+            bypass_cache (bool): Force a fresh Gemini call even if this exact claim was structured recently
+
+        Returns:
+            dict: Structured claim following the schema
+        """
+        cached, cache_keys, structuring_prompt = self._prepare_structuring(claim_text, bypass_cache)
+        if cached is not None:
+            return cached
+
+        slept = 0.0
+
+        for attempt in range(max_retries):
+            try:
+                async with _structuring_limiter.slot(lambda exc: self._is_overload_error(str(exc))):
+                    response = await self.client.aio.models.generate_content(
+                        model=self.model,
+                        contents=structuring_prompt,
+                        config=_JSON_RESPONSE_CONFIG,
+                    )
+            except Exception as e:
+                error_msg = str(e)
+
+                if self._is_overload_error(error_msg):
+                    wait_time = self._backoff_delay(e, error_msg, attempt)
+                    if attempt < max_retries - 1 and slept + wait_time <= _RETRY_BUDGET_SECONDS:
+                        log.warning("Gemini API overloaded (attempt %d/%d, limit %d). Retrying in %.1fs...",
+                                    attempt + 1, max_retries, _structuring_limiter.limit, wait_time)
+                        await asyncio.sleep(wait_time)
+                        slept += wait_time
+                        continue
+                    log.warning("Gemini API overloaded after %d attempts. Using fallback structure.", attempt + 1)
+                    return self._create_fallback_structure(claim_text)
+
+                log.error("Claim structuring error: %s", error_msg)
+                continue
+
+            return self._parse_structuring_response(response.text, claim_text, cache_keys)
+
+        log.warning("All %d attempts failed. Using fallback structure.", max_retries)
+        return self._create_fallback_structure(claim_text)
+
+    def _prepare_structuring(self, claim_text: str, bypass_cache: bool) -> tuple:
+        """
+        Resolve cache hits and build the structuring prompt for a claim.
+
+        Args:
+            claim_text (str): Raw claim or question from user
+            bypass_cache (bool): Skip the exact-match and template caches
+
+        Returns:
+            tuple: (cached structure or None, cache keys, structuring prompt)
+        """
+        normalized = " ".join(claim_text.casefold().split())
+        cache_key = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+        if not bypass_cache:
+            cached = _structure_cache.get(cache_key)
+            if cached is not None:
+                log.debug("[Structuring] Using cached structure for identical claim (ignoring case and spacing)")
+                return json.loads(cached), None, None
+
+        template_key, template_spans = self._template_key(claim_text)
+        if not bypass_cache:
+            cached_template = _template_cache.get(template_key)
+            if cached_template is not None:
+                filled = self._fill_template(cached_template, template_spans, claim_text)
+                if filled is not None:
+                    log.debug("[Structuring] Reusing cached structure for same-template claim")
+                    return filled, None, None
+
+        # For long non-English text, have Gemini translate before extracting fields
+        # (in the same call) to prevent hallucinating wrong locations/entities
+        # from Tamil/Hindi text
+        if not claim_text.isascii() and len(claim_text) > 200:
+            log.info("[Structuring] Structuring long non-English text with inline translation (%d chars)", len(claim_text))
+            structuring_prompt = _STRUCTURING_PROMPT_WITH_TRANSLATE_TEMPLATE.format(claim=claim_text)
+        else:
+            structuring_prompt = _STRUCTURING_PROMPT_TEMPLATE.format(claim=claim_text)
+
+        return None, (cache_key, template_key, template_spans), structuring_prompt
+
+    def _parse_structuring_response(self, response_text: str, claim_text: str, cache_keys: tuple) -> dict:
+        """
+        Parse Gemini's structuring output, caching it on success.
+
+        Args:
+            response_text (str): Raw response text from Gemini (may be None)
+            claim_text (str): Raw claim the response was generated for
+            cache_keys (tuple): (exact key, template key, template spans) from _prepare_structuring
+
+        Returns:
+            dict: Structured claim, or the fallback structure if the response is unusable
+        """
+        # response.text is None when the candidate was blocked or empty
+        result_text = (response_text or "").strip()
+
+        # Fast path: JSON mode normally returns a bare object; only scan
+        # for the first embedded {...} block when there's extra text around it.
+        # Validating against the schema also rejects incomplete objects.
+        try:
+            if result_text.startswith('{') and result_text.endswith('}'):
+                structured_data = StructuredClaim.model_validate_json(result_text).model_dump()
+            else:
+                json_block = _first_json_object(result_text)
+                structured_data = StructuredClaim.model_validate_json(json_block).model_dump() if json_block else None
+        except ValidationError:
+            structured_data = None
+
+        if structured_data is None:
+            # Fallback if JSON parsing fails
+            return self._create_fallback_structure(claim_text)
+
+        # Store original input for reference
+        structured_data["original_input"] = claim_text
+
+        # Only successful structurings are cached, never fallbacks
+        cache_key, template_key, template_spans = cache_keys
+        cached_json = json.dumps(structured_data)
+        _structure_cache.set(cache_key, cached_json)
+        _template_cache.set(template_key, (template_spans, cached_json))
+
+        return structured_data
+
+    @staticmethod
+    def _is_overload_error(error_msg: str) -> bool:
+        """Check if a Gemini error is a 503 (overload) or 429 (rate limit) error."""
+        return ("503" in error_msg or "UNAVAILABLE" in error_msg or "overload" in error_msg.lower()
+                or "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg)
+
+    @staticmethod
+    def _backoff_delay(error: Exception, error_msg: str, attempt: int) -> float:
+        """Jittered exponential backoff, never shorter than a server-provided retry delay."""
+        base = min(_BACKOFF_MAX_SECONDS, _BACKOFF_INITIAL_SECONDS * (2 ** attempt))
+        wait_time = base * random.uniform(0.75, 1.25)
+        retry_after = _parse_retry_after(error, error_msg)
+        if retry_after:
+            wait_time = max(wait_time, retry_after)
+        return wait_time
+
+    @staticmethod
+    def _template_key(text: str) -> tuple:
+        """
+        Mask capitalised name runs and numbers so structurally identical claims share a key.
+
+        Args:
+            text (str): Raw claim text
+
+        Returns:
+            tuple: (template digest, list of the masked spans in order)
+        """
+        spans = []
+
+        def mask(match):
+            spans.append(match.group())
+            return "{NUM}" if match.group()[0].isdigit() else "{ENT}"
+
+        masked = _TEMPLATE_SLOT_RE.sub(mask, text)
+        masked = " ".join(_TEMPLATE_PUNCT_RE.sub(" ", masked).split())
+        return hashlib.blake2b(masked.encode("utf-8"), digest_size=16).digest(), spans
+
+    @staticmethod
+    def _fill_template(cached_template: tuple, spans: list, claim_text: str):
+        """
+        Re-inject the current claim's names/numbers into a cached same-template structure.
+
+        Args:
+            cached_template (tuple): (spans of the cached claim, cached structure as JSON)
+            spans (list): Masked spans of the current claim, in order
+            claim_text (str): Current raw claim text
+
+        Returns:
+            dict or None: Filled structure, or None if the cached one can't be safely reused
+        """
+        cached_spans, cached_json = cached_template
+        if len(cached_spans) != len(spans):
+            return None
+
+        substitutions = {}
+        for old, new in zip(cached_spans, spans):
+            if substitutions.setdefault(old, new) != new:
+                return None  # Same span maps to two different values
+        substitutions = {old: new for old, new in substitutions.items() if old != new}
+        if not all(_is_date_or_number(old) and _is_date_or_number(new) for old, new in substitutions.items()):
+            return None  # A name or place changed; only Gemini can restructure that
+
+        structured_data = json.loads(cached_json)
+        if substitutions:
+            # Every changed span must appear verbatim in the cached claim, otherwise
+            # Gemini reformulated it and a plain substitution would be wrong
+            claim = structured_data.get("claim", "")
+            if not all(old in claim for old in substitutions):
+                return None
+
+            pattern = re.compile(
+                r'\b(?:' + "|".join(re.escape(old) for old in sorted(substitutions, key=len, reverse=True)) + r')\b'
+            )
+
+            def substitute(value):
+                return pattern.sub(lambda m: substitutions[m.group()], value) if isinstance(value, str) else value
+
+            for field in ("claim", "context", "location", "time_period"):
+                structured_data[field] = substitute(structured_data.get(field, ""))
+            structured_data["entities"] = [substitute(e) for e in structured_data.get("entities", [])]
+
+        structured_data["original_input"] = claim_text
+        return structured_data
+
     def _create_fallback_structure(self, claim_text: str) -> dict:
         """
         Create a basic structure if AI structuring fails.
@@ -214,29 +598,29 @@ Now convert this user input:
         Returns:
             str: English translation or original text if already English
         """
-        try:
-            # Check if text contains non-ASCII characters (likely non-English)
-            if all(ord(char) < 128 for char in text.replace(' ', '').replace('\n', '')):
-                return text  # Already English/ASCII
+        # Check if text contains non-ASCII characters (likely non-English)
+        if text.isascii():
+            return text  # Already English/ASCII
 
-            chat = self.client.chats.create(model=self.model)
+        cached = _translation_cache.get(text)
+        if cached is not None:
+            return cached
 
-            translate_prompt = f"""Translate the following text to English. If it's already in English, return it as-is.
-Only output the translation, nothing else.
-
-Text: {text}"""
+        try:
+            translate_prompt = _TRANSLATE_PROMPT_TEMPLATE.format(text=text)
 
-            response = chat.send_message(translate_prompt)
+            response = self.client.models.generate_content(model=self.model, contents=translate_prompt)
             translated = response.text.strip()
 
             # Remove quotes if present
             if translated.startswith('"') and translated.endswith('"'):
                 translated = translated[1:-1]
 
+            _translation_cache.set(text, translated)
             return translated
 
         except Exception as e:
-            print(f"Translation error: {e}")
+            log.warning("Translation error: %s", e)
             return text  # Return original on error
 
     def classify_claim(self, structured_claim: dict) -> str:
@@ -332,58 +716,93 @@ Text: {text}"""
             english_query = self._build_focused_query(
                 entities, location, time_period, claim, claim_type
             )
-            print(f"[Search Query] Focused query for long claim: {english_query[:80]}")
+            log.info("[Search Query] Focused query for long claim: %.80s", english_query)
         else:
-            # Build English query from structured components (short claims)
+            # Build English query from structured components (short claims),
+            # tracking the joined length so the string is only built once
             query_parts = []
+            query_len = -1  # each part adds its length plus one separator
 
             # Start with the main claim (most important)
             if claim:
                 query_parts.append(claim)
+                query_len += len(claim) + 1
 
             # Add time period if specified and not vague
-            if time_period and time_period.lower() not in ["recent", "now", "current"]:
+            if time_period and time_period.lower() not in _VAGUE_TIMES:
                 query_parts.append(time_period)
+                query_len += len(time_period) + 1
 
             # Add context if it provides additional useful information
             if context and len(context) < 100:
                 query_parts.append(context)
+                query_len += len(context) + 1
 
             # If query is too short, add entities for more context
-            english_query = " ".join(query_parts)
-            if len(english_query) < 50 and entities:
+            if query_len < 50 and entities:
                 entity_text = " ".join(entities[:3])  # Limit to first 3 entities
-                english_query = f"{english_query} {entity_text}"
+                query_parts.append(entity_text)
+                query_len += len(entity_text) + 1
 
             # If query is too long, use just the claim
-            if len(english_query) > 200:
+            if query_len > 200:
                 english_query = claim[:200]
+            else:
+                english_query = " ".join(query_parts)
 
         # Fallback to original input if all else fails
         if not english_query.strip():
             english_query = original_input[:200]
 
-        # Ensure english_query is actually in English
-        english_query = self.translate_to_english(english_query.strip())
+        # Ensure english_query is actually in English (only non-ASCII text
+        # needs the Gemini round-trip)
+        english_query = english_query.strip()
+        if not english_query.isascii():
+            english_query = self.translate_to_english(english_query)
 
         # For local/district/state claims with non-English original input,
         # create a bilingual query so Perplexity can match regional language content
         if geographic_scope in ("local", "district", "state") and original_input:
-            is_non_english = any(ord(char) > 127 for char in original_input.replace(' ', ''))
+            is_non_english = not original_input.isascii()
             if is_non_english:
                 # Extract key terms from original language (significant words only)
-                original_words = [w for w in original_input.split() if len(w) > 3][:8]
+                original_words = _LONG_WORD_RE.findall(original_input)[:8]
                 original_key_terms = " ".join(original_words)
-                # Combine: English query first, then original language key terms
+                # Cap total length at 400 by trimming the original language terms
+                # (English query first, then " | ", then the terms)
+                budget = 400 - len(english_query) - 3
+                if len(original_key_terms) > budget:
+                    original_key_terms = original_key_terms[:max(budget, 0)]
                 search_query = f"{english_query} | {original_key_terms}"
-                # Cap total length
-                if len(search_query) > 400:
-                    search_query = search_query[:400]
-                print(f"[Search Query] Bilingual query for {geographic_scope} claim")
+                log.info("[Search Query] Bilingual query for %s claim", geographic_scope)
                 return search_query
 
         return english_query
 
+    @staticmethod
+    def _cached_query(kind: str, structured_claim: dict, compute) -> str:
+        """
+        Memoise a query builder on the canonical JSON of the structured claim.
+
+        Only for builders that make no API calls (so the result is deterministic
+        for a given structured claim); the pipeline may ask for the same query
+        more than once.
+
+        Args:
+            kind (str): Which query builder this is, to keep cache keys apart
+            structured_claim (dict): Structured claim data
+            compute (callable): Builds the query on a cache miss
+
+        Returns:
+            str: Search query
+        """
+        key = (kind, json.dumps(structured_claim, sort_keys=True, default=str))
+        query = _query_cache.get(key)
+        if query is None:
+            query = compute(structured_claim)
+            _query_cache.set(key, query)
+        return query
+
     def _build_focused_query(self, entities: list, location: str, time_period: str, claim: str, claim_type: str) -> str:
         """
         Build a short, focused search query from key claim components.
@@ -403,38 +822,37 @@ Text: {text}"""
             str: Focused search query (typically 60-120 chars)
         """
         query_parts = []
+        seen = set()
+
+        def add(term):
+            term_lower = term.lower()
+            if term_lower and term_lower not in seen:
+                query_parts.append(term)
+                seen.add(term_lower)
 
         # Add entities (top 3)
-        query_parts.extend(entities[:3])
+        for entity in entities[:3]:
+            add(entity)
 
         # Add primary location if not already in entities
-        if location:
-            primary_location = location.split(",")[0].strip()
-            if not any(primary_location.lower() in e.lower() for e in entities):
-                query_parts.append(primary_location)
+        primary_location = location.split(",", 1)[0].strip() if location else ""
+        if primary_location:
+            primary_lower = primary_location.lower()
+            if not any(primary_lower in e.lower() for e in entities):
+                add(primary_location)
 
         # Extract key subject terms from the claim text itself
         # This captures domain-specific terms like "budget", "interim", "protest"
-        # that predefined keyword lists would miss
-        already_included = list(entities[:3])
-        if location:
-            already_included.append(location.split(",")[0].strip())
-        if time_period:
-            already_included.append(time_period)
-        key_terms = self._extract_key_terms(claim, exclude_terms=already_included)
-
-        # Add top 3 subject terms that aren't already in the query
-        added_subject_terms = 0
-        for term in key_terms:
-            if added_subject_terms >= 3:
-                break
-            if not any(term.lower() in p.lower() for p in query_parts):
-                query_parts.append(term)
-                added_subject_terms += 1
+        # that predefined keyword lists would miss. Words of the entities,
+        # location and time period are excluded at word level, so the top 3
+        # remaining terms only need the exact-match check in add().
+        already_included = entities[:3] + [t for t in (primary_location, time_period) if t]
+        for term in self._extract_key_terms(claim, exclude_terms=already_included)[:3]:
+            add(term)
 
         # Add time period
-        if time_period and time_period.lower() not in ["recent", "now", "current"]:
-            query_parts.append(time_period)
+        if time_period and time_period.lower() not in _VAGUE_TIMES:
+            add(time_period)
 
         return " ".join(query_parts)
 
@@ -451,56 +869,23 @@ Text: {text}"""
         Returns:
             list: Key terms ordered by appearance (up to 5)
         """
-        stopwords = {
-            # Articles, pronouns, determiners
-            "the", "a", "an", "this", "that", "these", "those",
-            "it", "its", "he", "she", "they", "his", "her", "their",
-            "him", "them", "we", "our", "you", "your", "i", "my",
-            # Prepositions
-            "in", "on", "at", "to", "for", "of", "with", "by", "from",
-            "up", "about", "into", "through", "during", "before", "after",
-            "above", "below", "between", "under", "over", "out",
-            # Conjunctions & misc
-            "and", "but", "or", "nor", "not", "so", "yet",
-            "if", "then", "than", "too", "very", "just",
-            "also", "only", "own", "same", "other", "each", "every",
-            "all", "both", "few", "more", "most", "some", "such",
-            "no", "any", "many", "much", "several",
-            "which", "who", "whom", "what", "where", "when", "how", "why",
-            "there", "here", "now", "once",
-            # Common verbs (too generic for search)
-            "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did",
-            "will", "would", "shall", "should", "may", "might",
-            "must", "can", "could",
-            "said", "stated", "announced", "declared", "reported",
-            "according", "mentioned", "noted",
-            # Generic adjectives
-            "new", "old", "first", "last", "next",
-            "upcoming", "recent", "current", "present",
-        }
-
-        exclude_lower = set()
-        if exclude_terms:
-            for term in exclude_terms:
-                for word in term.lower().split():
-                    exclude_lower.add(word)
-
-        # Extract English words (alphanumeric, at least 3 chars)
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9-]+\b', text)
-
-        key_terms = []
-        seen = set()
-        for word in words:
+        exclude_lower = frozenset(
+            word for term in (exclude_terms or ()) for word in term.lower().split()
+        )
+
+        # Extract English words (alphanumeric, at least 3 chars); the dict keeps
+        # first-seen order and original casing while deduplicating on lowercase
+        key_terms = {}
+        for word in _WORD_RE.findall(text):
             w_lower = word.lower()
-            if (w_lower not in stopwords and
-                w_lower not in exclude_lower and
-                w_lower not in seen and
-                len(word) > 2):
-                key_terms.append(word)
-                seen.add(w_lower)
+            if (len(word) > 2 and
+                    w_lower not in _STOPWORDS and
+                    w_lower not in exclude_lower):
+                key_terms.setdefault(w_lower, word)
+                if len(key_terms) == 5:
+                    break
 
-        return key_terms[:5]
+        return list(key_terms.values())
 
     def create_alternative_query(self, structured_claim: dict) -> str:
         """
@@ -513,6 +898,10 @@ Text: {text}"""
         Returns:
             str: Simplified search query, or empty string if can't generate one
         """
+        return self._cached_query("alternative", structured_claim, self._compute_alternative_query)
+
+    def _compute_alternative_query(self, structured_claim: dict) -> str:
+        """Uncached body of create_alternative_query."""
         entities = structured_claim.get("entities", [])
         location = structured_claim.get("location", "")
         time_period = structured_claim.get("time_period", "")
@@ -521,11 +910,11 @@ Text: {text}"""
 
         # For regional language claims, try a purely regional language query
         # (local media publishes in Tamil, not English)
-        if original_input and any(ord(c) > 127 for c in original_input.replace(' ', '')):
-            key_words = [w for w in original_input.split() if len(w) > 3][:6]
+        if original_input and not original_input.isascii():
+            key_words = _LONG_WORD_RE.findall(original_input)[:6]
             if key_words:
                 alt_query = " ".join(key_words)
-                print(f"[Search Query] Alternative regional language query: {alt_query[:60]}")
+                log.info("[Search Query] Alternative regional language query: %.60s", alt_query)
                 return alt_query
 
         # English fallback: entities + key subject terms + location
@@ -546,3 +935,22 @@ Text: {text}"""
 
         alt_query = " ".join(parts)
         return alt_query if alt_query.strip() else ""
+
+
+_service_instance = None
+_service_lock = threading.Lock()
+
+
+def get_claim_structuring_service() -> ClaimStructuringService:
+    """
+    Return the process-wide ClaimStructuringService.
+
+    Sharing one instance means one genai.Client, so its HTTP connection pool
+    (and TLS sessions) are reused across requests and pipelines.
+    """
+    global _service_instance
+    if _service_instance is None:
+        with _service_lock:
+            if _service_instance is None:
+                _service_instance = ClaimStructuringService()
+    return _service_instance
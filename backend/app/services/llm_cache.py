@@ -0,0 +1,37 @@
+from app.core.cache import TTLCache, freeze, thaw
+from app.core.config import LLM_CACHE_MAX_SIZE, LLM_CACHE_TTL_SECONDS
+import hashlib
+
+# Process-wide cache of LLM/research responses keyed by a hash of (model, prompt),
+# so repeated prompts skip the network round-trip entirely. Shared by every service.
+_responses = TTLCache(maxsize=LLM_CACHE_MAX_SIZE, ttl=LLM_CACHE_TTL_SECONDS)
+
+
+def prompt_key(model: str, *parts) -> bytes:
+    """
+    Build a cache key from the model name and the prompt parts.
+
+    Args:
+        model (str): Model the prompt is sent to
+        *parts: Prompt text (or other request inputs, e.g. a serialized request
+            body as bytes) that determine the response
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(model.encode("utf-8"), digest_size=16)
+    for part in parts:
+        digest.update(b"\x00")
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+    return digest.digest()
+
+
+def get(key: bytes):
+    """Return a copy of the cached response for key, or None on a miss."""
+    # Callers may mutate returned dicts, so never hand out the shared object
+    return thaw(_responses.get(key))
+
+
+def put(key: bytes, value, ttl: float = None):
+    """Cache a successful response under key (for ttl seconds, default LLM_CACHE_TTL_SECONDS)."""
+    _responses.set(key, freeze(value), ttl)
@@ -1,6 +1,21 @@
-from app.core.config import GEMINI_API_KEY, GEMINI_MODEL
-from google import genai
-import re
+from app.core.config import GEMINI_API_KEY, GEMINI_MODEL, LLM_MODERATION_MIN_LENGTH, LLM_MODERATION_RATIO
+from app.services import llm_cache
+from app.services._gemini import TIMEOUT_CONFIG, call_with_retry, get_client
+import random
+
+try:
+    # RE2 matches in linear time, so crafted input can't make the PII/harm
+    # scans backtrack; fall back to the stdlib engine where no wheel exists
+    import re2 as re
+except ImportError:
+    import re
+
+# Patterns that might indicate PII
+PII_PATTERNS = [
+    r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
+    r'\b\d{16}\b',  # Credit card
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email (partial check)
+]
 
 class ModerationService:
     """
@@ -10,7 +25,7 @@ class ModerationService:
     def __init__(self):
         if not GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable is not set")
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
+        self.client = get_client()
         self.model = GEMINI_MODEL
 
         # Patterns for basic harmful content detection
@@ -19,6 +34,18 @@ class ModerationService:
             r'\b(how to|guide to)\s+(make|create|build)\s+(bomb|weapon|explosive)',
             r'\b(steal|hack|break into)',
         ]
+        # Each pattern set is fused into one alternation compiled once, so the
+        # claim is scanned a single time per set; an inline (?i) replaces
+        # lowercasing and works the same in both regex engines
+        self._harmful_union = re.compile("(?i)" + "|".join(f"(?:{p})" for p in self.harmful_patterns))
+        self._pii_union = re.compile("|".join(f"(?:{p})" for p in PII_PATTERNS))
+
+        # Words that don't block on their own but make an input worth a Gemini review
+        self.suspicious_terms = [
+            "kill", "murder", "attack", "bomb", "weapon", "explosive",
+            "poison", "drug", "hack", "password", "address", "phone",
+        ]
+        self._suspicious_union = re.compile(r'(?i)\b(?:' + "|".join(self.suspicious_terms) + r')')
 
     def moderate_input(self, claim_text: str) -> dict:
         """
@@ -28,12 +55,11 @@ class ModerationService:
             dict: {"is_safe": bool, "reason": str or None}
         """
         # Basic pattern matching for obvious harmful content
-        for pattern in self.harmful_patterns:
-            if re.search(pattern, claim_text.lower()):
-                return {
-                    "is_safe": False,
-                    "reason": "This request contains restricted or unsafe content and cannot be processed."
-                }
+        if self._harmful_union.search(claim_text):
+            return {
+                "is_safe": False,
+                "reason": "This request contains restricted or unsafe content and cannot be processed."
+            }
 
         # Check for potential PII (simplified check)
         if self._contains_pii(claim_text):
@@ -42,9 +68,13 @@ class ModerationService:
                 "reason": "This request contains private or sensitive information and cannot be processed."
             }
 
+        # The regex tier passed; only send the input on to Gemini when it is
+        # worth the extra round-trip
+        if not self._needs_llm_review(claim_text):
+            return {"is_safe": True, "reason": None}
+
         # Use Gemini for more nuanced moderation
         try:
-            chat = self.client.chats.create(model=self.model)
             moderation_prompt = f"""
 You are a content moderator. Analyze the following claim and determine if it contains:
 - Harmful, violent, or illegal content
@@ -55,8 +85,14 @@ Claim: "{claim_text}"
 
 Respond with ONLY "SAFE" or "UNSAFE: [brief reason]"
 """
-            response = chat.send_message(moderation_prompt)
-            result = response.text.strip()
+            cache_key = llm_cache.prompt_key(self.model, moderation_prompt)
+            result = llm_cache.get(cache_key)
+            if result is None:
+                response = call_with_retry(lambda: self.client.models.generate_content(
+                    model=self.model, contents=moderation_prompt, config=TIMEOUT_CONFIG
+                ))
+                result = response.text.strip()
+                llm_cache.put(cache_key, result)
 
             if result.startswith("UNSAFE"):
                 return {
@@ -94,19 +130,20 @@ Respond with ONLY "SAFE" or "UNSAFE: [brief reason]"
             "cleaned_output": cleaned
         }
 
+    def _needs_llm_review(self, claim_text: str) -> bool:
+        """
+        Decide whether an input that passed the regex checks also gets the
+        Gemini moderation check: long or suspicious inputs always do, and a
+        sampled fraction (LLM_MODERATION_RATIO) of the rest.
+        """
+        if len(claim_text) >= LLM_MODERATION_MIN_LENGTH:
+            return True
+        if self._suspicious_union.search(claim_text):
+            return True
+        return random.random() < LLM_MODERATION_RATIO
+
     def _contains_pii(self, text: str) -> bool:
         """
         Check for potential PII (simplified version).
         """
-        # Check for patterns that might indicate PII
-        pii_patterns = [
-            r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
-            r'\b\d{16}\b',  # Credit card
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email (partial check)
-        ]
-
-        for pattern in pii_patterns:
-            if re.search(pattern, text):
-                return True
-
-        return False
+        return self._pii_union.search(text) is not None
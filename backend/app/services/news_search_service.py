@@ -11,6 +11,7 @@ discovered and used as evidence.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import xml.etree.ElementTree as ET
 from urllib.parse import quote_plus, urlparse
@@ -28,6 +29,11 @@ class NewsSearchService:
         self.google_news_rss_url = "https://news.google.com/rss/search"
         self.timeout = 15
 
+        # Pooled keep-alive session so fallback searches reuse the Google News connection
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+        self.session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; FactChecker/1.0)"})
+
         # Tamil Nadu news domains — articles from these are credible evidence
         self.tn_news_domains = {
             # Tamil newspapers (online)
@@ -167,9 +173,7 @@ class NewsSearchService:
 
         print(f"[NewsSearch] Searching Google News RSS: {query[:60]}...")
 
-        response = requests.get(url, timeout=self.timeout, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; FactChecker/1.0)"
-        })
+        response = self.session.get(url, timeout=self.timeout)
 
         if response.status_code != 200:
             print(f"[NewsSearch] Google News RSS error: {response.status_code}")
@@ -1,13 +1,17 @@
 import bcrypt
+from argon2 import PasswordHasher
+
+# Shared Argon2id hasher (OWASP-recommended minimum: m=19 MiB, t=2, p=1)
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
 
 class PasswordService:
-    """Service for password hashing and verification using bcrypt"""
+    """Service for password hashing and verification using Argon2id (bcrypt for legacy hashes)"""
 
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash a password using bcrypt
+        Hash a password using Argon2id
 
         Args:
             password: Plain text password
@@ -15,10 +19,7 @@ class PasswordService:
         Returns:
             Hashed password as string
         """
-        # Generate salt and hash password
-        salt = bcrypt.gensalt(rounds=12)  # 12 rounds is secure and performant
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        return _password_hasher.hash(password)
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
@@ -27,15 +28,41 @@ class PasswordService:
 
         Args:
             password: Plain text password to verify
-            password_hash: Stored password hash
+            password_hash: Stored password hash (Argon2id or legacy bcrypt)
 
         Returns:
             True if password matches, False otherwise
         """
         try:
-            return bcrypt.checkpw(
-                password.encode('utf-8'),
-                password_hash.encode('utf-8')
-            )
+            if PasswordService._is_bcrypt_hash(password_hash):
+                return bcrypt.checkpw(
+                    password.encode('utf-8'),
+                    password_hash.encode('utf-8')
+                )
+            # Raises VerifyMismatchError / InvalidHashError on failure
+            return _password_hasher.verify(password_hash, password)
+        except Exception:
+            return False
+
+    @staticmethod
+    def needs_rehash(password_hash: str) -> bool:
+        """
+        Check whether a stored hash should be upgraded on the next successful login
+
+        Args:
+            password_hash: Stored password hash
+
+        Returns:
+            True for legacy bcrypt hashes or Argon2 hashes with outdated parameters
+        """
+        if PasswordService._is_bcrypt_hash(password_hash):
+            return True
+        try:
+            return _password_hasher.check_needs_rehash(password_hash)
         except Exception:
             return False
+
+    @staticmethod
+    def _is_bcrypt_hash(password_hash: str) -> bool:
+        """bcrypt hashes use the $2a$/$2b$/$2y$ modular crypt prefixes"""
+        return password_hash.startswith("$2")
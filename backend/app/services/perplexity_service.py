@@ -1,69 +1,203 @@
-from app.core.config import PERPLEXITY_API_KEY
+from app.core.config import (
+    PERPLEXITY_API_KEY, PERPLEXITY_GZIP_REQUESTS, PERPLEXITY_MAX_CONCURRENCY, RESEARCH_NEGATIVE_TTL_SECONDS,
+    WARMUP_CONNECTIONS,
+)
+from app.core.concurrency import coalesce
+from app.services import llm_cache, research_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from types import MappingProxyType
+import asyncio
+import gzip
+import httpx
+import logging
 import requests
-import json
+import orjson
+import re
 
-class PerplexityService:
+log = logging.getLogger(__name__)
+
+# Section headers in the research response
+_SECTION_HEADERS = (
+    ("SUMMARY:", "summary"),
+    ("SCOPE:", "scope"),
+    ("FINDINGS:", "findings"),
+    ("SOURCES:", "sources"),
+    ("RESEARCH_LIMITATIONS:", "research_limitations"),
+    ("RESEARCH LIMITATIONS:", "research_limitations"),
+)
+# Lets a single startswith() call rule out non-header lines
+_HEADER_PREFIXES = tuple(prefix for prefix, _ in _SECTION_HEADERS)
+# Each prefix ends at its only colon, so a matched header's prefix is
+# everything up to the first ":" and the section is one dict lookup away
+_SECTION_BY_PREFIX = dict(_SECTION_HEADERS)
+
+class _ResponseParser:
     """
-    Integrates with Perplexity AI for deep research and fact verification.
+    Incremental parser for Perplexity research text.
+
+    Content is fed in chunks as it streams in; complete lines are parsed into
+    summary/findings/sources/scope/research_limitations as they arrive, so the
+    full response text is never held in memory.
     """
 
     def __init__(self):
-        if not PERPLEXITY_API_KEY:
-            print("WARNING: PERPLEXITY_API_KEY not set. Research functionality will be limited.")
-            self.api_key = None
-        else:
-            self.api_key = PERPLEXITY_API_KEY
+        # Summary and limitations lines are collected and joined once in
+        # close() rather than concatenated line by line
+        self.summary = []
+        self.findings = []
+        self.sources = []
+        self.scope = ""
+        self.research_limitations = []
+        self.sections_seen = set()
+        self.chars = 0
+        self.head = ""
+        self._section = None
+        self._partial = ""
+        self._raw_body = []
+        self._streamed = False
 
-        self.base_url = "https://api.perplexity.ai/chat/completions"
-        self.model = "sonar-pro"  # Perplexity's online research model
+    def feed(self, text: str):
+        """Feed a chunk of research text (may end mid-line)."""
+        self.chars += len(text)
+        if len(self.head) < 500:
+            self.head += text[:500 - len(self.head)]
+
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._parse_line(line)
 
-    def deep_research(self, search_query: str, structured_claim: dict, x_evidence: list = None) -> dict:
+    def feed_event(self, line: str):
         """
-        Perform deep research using Perplexity AI.
+        Feed one line of a streamed (server-sent events) API response.
 
-        Args:
-            search_query (str): Optimized search query
-            structured_claim (dict): Structured claim data
-            x_evidence (list): Optional list of X posts to use as research leads
+        Lines that aren't SSE events are kept so a non-streamed JSON body can
+        still be parsed in close().
+        """
+        if not line:
+            return
+        if not line.startswith("data:"):
+            self._raw_body.append(line)
+            return
+
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        self._streamed = True
+        delta = orjson.loads(data)['choices'][0].get('delta', {})
+        content = delta.get('content')
+        if content:
+            self.feed(content)
+
+    def close(self) -> dict:
+        """
+        Flush any buffered partial line and return the parsed research.
 
         Returns:
-            dict: Research results with findings and sources
+            dict: Parsed research with summary, findings, sources
         """
-        if not self.api_key:
-            return self._fallback_research(search_query, reason="API key not configured. Set PERPLEXITY_API_KEY in .env")
+        if not self._streamed and self._raw_body:
+            # The API answered with a plain JSON body instead of an event stream
+            result = orjson.loads("\n".join(self._raw_body))
+            self._raw_body = []
+            self.feed(result['choices'][0]['message']['content'])
 
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+        if self._partial:
+            self._parse_line(self._partial)
+            self._partial = ""
+
+        return {
+            "summary": " ".join(self.summary).strip(),
+            "findings": self.findings,
+            "sources": self.sources,
+            "scope": self.scope,
+            "research_limitations": " ".join(self.research_limitations).strip()
+        }
+
+    def _parse_line(self, line: str):
+        line = line.strip()
+        if not line:
+            return
+        # Remove markdown bold formatting (**text** -> text)
+        clean_line = line.replace("**", "") if "**" in line else line
+
+        if clean_line.startswith(_HEADER_PREFIXES):
+            prefix = clean_line[:clean_line.index(":") + 1]
+            section = self._section = _SECTION_BY_PREFIX[prefix]
+            if section == "summary":
+                self.sections_seen.add("SUMMARY")
+                self.summary = [clean_line.replace(prefix, "").strip()]
+            elif section == "scope":
+                self.scope = clean_line.replace(prefix, "").strip()
+            elif section == "findings":
+                self.sections_seen.add("FINDINGS")
+            elif section == "research_limitations":
+                self.research_limitations = [clean_line[len(prefix):].strip()]
+        elif line[0] in "-•*":
+            # Handle bullet points (-, •, or * for markdown lists)
+            content = line.lstrip("-•*").strip()
+            # Also remove any leading ** from bold bullets
+            if content.startswith("**"):
+                content = content[2:]
+            if not content:
+                return
+            if self._section == "findings":
+                self.findings.append(content)
+            elif self._section == "sources":
+                self.sources.append(content)
+            elif self._section == "research_limitations":
+                self.research_limitations.append(content)
+        elif self._section == "summary":
+            if not clean_line.startswith("Verdict"):
+                self.summary.append(line)
+        elif self._section == "research_limitations":
+            self.research_limitations.append(line)
 
-            # Extract components from new schema
-            claim = structured_claim.get('claim', search_query)
-            entities = structured_claim.get('entities', [])
-            context = structured_claim.get('context', '')
-            time_period = structured_claim.get('time_period', '')
-            claim_type = structured_claim.get('claim_type', 'other')
-            geographic_scope = structured_claim.get('geographic_scope', 'national')
-            location = structured_claim.get('location', '')
+class _BatchResponseParser(_ResponseParser):
+    """
+    Parser for a batched research response: "### CLAIM <n>" lines switch to
+    that claim's own _ResponseParser, and every other line is routed to the
+    current one. Lines before the first claim header are dropped.
 
-            original_input = structured_claim.get('original_input', '')
+    The indexes of the claims whose header appeared are kept in `seen`; a
+    claim the model left out (or never reached before max_tokens) has an
+    empty parser that must not be taken as an empty result.
+    """
 
-            # Format entities for display
-            entities_text = ', '.join(entities) if entities else 'N/A'
+    def __init__(self, count: int):
+        super().__init__()
+        self.claims = [_ResponseParser() for _ in range(count)]
+        self.seen = set()
+        self._current = None
 
-            # Check if original input is in a regional language
-            is_regional_language = any(ord(c) > 127 for c in original_input.replace(' ', '')) if original_input else False
+    def _parse_line(self, line: str):
+        match = _BATCH_CLAIM_RE.match(line)
+        if match:
+            index = int(match.group(1)) - 1
+            if 0 <= index < len(self.claims):
+                self._current = self.claims[index]
+                self.seen.add(index)
+            else:
+                self._current = None
+        elif self._current is not None:
+            self._current.feed(line + "\n")
 
-            # Build domain-specific source guidance based on claim type
-            source_guidance = self._get_source_guidance(claim_type, geographic_scope, location)
+    def close(self) -> list:
+        """Flush buffered input and return the per-claim parsers (not yet closed; see `seen`)."""
+        super().close()
+        return self.claims
 
-            research_prompt = f"""
+# Research prompt sent to Perplexity; the variable slots are filled with
+# str.format_map so only the per-claim values are built on each call
+_RESEARCH_PROMPT_TEMPLATE = """
 You are a professional fact-checker. Research the following claim using the DOMAIN-APPROPRIATE sources listed below.
 
-CLAIM TYPE: {claim_type.replace('_', ' ').upper()}
-GEOGRAPHIC SCOPE: {geographic_scope.upper()}
-LOCATION: {location if location else 'Not specified'}
+CLAIM TYPE: {claim_type}
+GEOGRAPHIC SCOPE: {geographic_scope}
+LOCATION: {location}
 
 {source_guidance}
 
@@ -87,18 +221,18 @@ B) For GENERAL KNOWLEDGE / ESTABLISHED FACTS (economic data, geographic facts, i
    - Example: "Tamil Nadu is a manufacturing hub" can be verified via government economic data, IBEF reports, Make in India portal, industry association data — these ARE credible sources even if they're not "news articles"
 
 Claim (English): {claim}
-{"" if not is_regional_language else f"Claim (Original Language): {original_input[:300]}"}
+{original_language_line}
 
 Additional Details:
-- Key Entities: {entities_text}
-- Time Period: {time_period if time_period else 'Not specified'}
-- Context: {context if context else 'None provided'}
+- Key Entities: {entities}
+- Time Period: {time_period}
+- Context: {context}
 
 Search Query: {search_query}
 
-{"IMPORTANT: This claim is originally in a regional language. Search for this claim using BOTH the English translation AND the original regional language text. Regional newspapers and news websites publish in the regional language, so searching only in English will miss most relevant coverage. Try searching key names and terms in the original language on regional news websites." if is_regional_language else ""}
+{regional_language_note}
 
-{self._format_x_evidence(x_evidence) if x_evidence else ""}
+{x_evidence}
 
 Provide:
 1. A summary of what was ACTUALLY FOUND (not what sources exist in general)
@@ -120,175 +254,132 @@ SOURCES:
 RESEARCH_LIMITATIONS: [what sources were inaccessible or not searched that would be relevant]
 """
 
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional fact-checking assistant with access to real-time information. Match your source selection to the SCOPE of the claim: use regional/local language media for district-level events, state-level outlets for state events, and national/international sources for national/international events. For Indian local events, prioritize regional language newspapers (Tamil, Hindi, Telugu, etc.), district police/administration releases, and local TV channels. Never dismiss a local claim simply because international outlets don't cover it. IMPORTANT: When a search query contains both English and regional language text (separated by |), search using BOTH languages. Regional language keywords help you find articles in local media that publish in that language (e.g., Tamil newspapers publish in Tamil, not English). Search the regional language terms on regional news sites."
-                    },
-                    {
-                        "role": "user",
-                        "content": research_prompt
-                    }
-                ],
-                "temperature": 0.2,  # Lower temperature for more factual responses
-                "max_tokens": 2000
-            }
+_REGIONAL_LANGUAGE_NOTE = (
+    "IMPORTANT: This claim is originally in a regional language. Search for this claim using BOTH the "
+    "English translation AND the original regional language text. Regional newspapers and news websites "
+    "publish in the regional language, so searching only in English will miss most relevant coverage. "
+    "Try searching key names and terms in the original language on regional news websites."
+)
 
-            print(f"[Perplexity] Making API request for: {search_query[:50]}...")
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+# Async research retries on rate limiting/overload, waiting as long as the
+# API's Retry-After asks (capped) or backing off exponentially without one
+_ASYNC_RETRY_STATUSES = frozenset({429, 503})
+_ASYNC_MAX_RETRIES = 3
+_MAX_RETRY_AFTER_SECONDS = 30.0
 
-            print(f"[Perplexity] Response status: {response.status_code}")
-
-            if response.status_code == 200:
-                result = response.json()
-                research_text = result['choices'][0]['message']['content']
-                print(f"[Perplexity] Got response ({len(research_text)} chars)")
-                print(f"[Perplexity] First 500 chars: {research_text[:500]}")
-
-                # Parse the response
-                parsed_result = self._parse_research_response(research_text)
-                print(f"[Perplexity] Parsed: {len(parsed_result.get('findings', []))} findings, {len(parsed_result.get('sources', []))} sources")
-
-                # Debug: if parsing failed, show why
-                if len(parsed_result.get('findings', [])) == 0:
-                    print(f"[Perplexity] DEBUG - Has SUMMARY: {'SUMMARY:' in research_text}")
-                    print(f"[Perplexity] DEBUG - Has FINDINGS: {'FINDINGS:' in research_text}")
-                    print(f"[Perplexity] DEBUG - Has bullet (-): {'-' in research_text}")
-
-                return parsed_result
-            elif response.status_code == 401:
-                print(f"[Perplexity] API error: 401 Unauthorized")
-                return self._fallback_research(search_query, reason="Invalid or expired API key (401 Unauthorized). Check your PERPLEXITY_API_KEY credits.")
-            elif response.status_code == 429:
-                print(f"[Perplexity] API error: 429 Rate limit")
-                return self._fallback_research(search_query, reason="Rate limit exceeded (429). Perplexity API quota reached.")
-            else:
-                print(f"[Perplexity] API error: {response.status_code} - {response.text}")
-                return self._fallback_research(search_query, reason=f"API returned error {response.status_code}")
 
-        except requests.exceptions.Timeout:
-            print("Perplexity API timeout")
-            return self._fallback_research(search_query, reason="Request timed out after 30s")
-        except Exception as e:
-            print(f"Perplexity research error: {str(e)}")
-            return self._fallback_research(search_query, reason=str(e))
+def _retry_delay(retry_after: str, attempt: int) -> float:
+    try:
+        return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER_SECONDS)
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
 
-    def _get_source_guidance(self, claim_type: str, geographic_scope: str, location: str) -> str:
-        """
-        Generate domain-specific and scope-specific source guidance for the research prompt.
 
-        Args:
-            claim_type (str): Type of claim (protest_arrest, accident_death, etc.)
-            geographic_scope (str): Geographic scope (local, district, state, national, international)
-            location (str): Specific location
+# Batched research: each claim's own prompt goes under a numbered header and
+# the answer comes back under the same headers. Capped so N answers still fit
+# the completion token limit.
+_BATCH_MAX_CLAIMS = 5
+_BATCH_TOKENS_PER_CLAIM = 1500
+_BATCH_CLAIM_RE = re.compile(r"\s*(?:\*\*)?#{2,}\s*(?:\*\*)?CLAIM\s+(\d+)\b")
+_BATCH_PROMPT_HEADER = """
+Fact-check the following {count} claims independently. Each claim has its own section with its research instructions.
 
-        Returns:
-            str: Formatted source guidance for the prompt
-        """
-        # Determine if location is in India (for regional language media guidance)
-        is_india = any(term in location.lower() for term in [
-            "india", "tamil nadu", "kerala", "karnataka", "andhra",
-            "telangana", "maharashtra", "delhi", "uttar pradesh",
-            "bihar", "bengal", "rajasthan", "gujarat", "punjab",
-            "haryana", "madhya pradesh", "odisha", "assam",
-            "jharkhand", "chhattisgarh", "goa", "manipur",
-            "meghalaya", "mizoram", "nagaland", "sikkim",
-            "tripura", "arunachal", "himachal", "uttarakhand",
-        ]) if location else False
-
-        is_tamil_nadu = any(term in location.lower() for term in [
-            "tamil nadu", "chennai", "coimbatore", "madurai", "trichy",
-            "salem", "tirunelveli", "erode", "vellore", "thanjavur",
-            "dindigul", "kanchipuram", "tiruppur", "cuddalore",
-            "perambalur", "pudukkottai", "karur", "ariyalur",
-            "nagapattinam", "ramanathapuram", "sivaganga",
-            "virudhunagar", "theni", "tenkasi", "tirupattur",
-            "ranipet", "chengalpattu", "kallakurichi", "villupuram",
-            "krishnagiri", "dharmapuri", "nilgiris", "namakkal",
-        ]) if location else False
-
-        # Domain-specific source hierarchy
-        # NOTE: News reports and press releases are prioritized ABOVE gazette
-        # documents because policies/schemes are announced in news BEFORE
-        # being gazetted (lag of days to weeks).
-        domain_sources = {
-            "protest_arrest": {
-                "priority_1": "Tamil Nadu news channels and newspapers: Dinamalar, Dinathanthi (Daily Thanthi), Dinamani, Maalai Malar, Vikatan, Tamil Murasu, Kumudham, Ananda Vikatan, Junior Vikatan, Nakkheeran, Kumudam Reporter, Thuglak, DT Next, The New Indian Express (TN edition), The Hindu (TN section)",
-                "priority_2": "Tamil Nadu TV news channels: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, Kalaignar TV News, Jaya TV News, News18 Tamil Nadu, Captain News, Vasanth TV, Raj News Tamil, Lotus News, Malai Murasu TV, Adithya TV, Peppers TV",
-                "priority_3": "District police press releases, SP/Commissioner statements, FIR records, District Collector/administration statements",
-                "priority_4": "Wire services (PTI, ANI), state-level and national media (NDTV, India Today, Times of India)",
-                "priority_5": "Tamil online news portals: Oneindia Tamil, Samayam Tamil, Tamil Guardian, Asianet News Tamil, ABP Nadu, Zee Tamil News, News Tamil 24x7",
-            },
-            "accident_death": {
-                "priority_1": "Tamil Nadu news channels: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil (TV channels are often FIRST to report accidents with footage)",
-                "priority_2": "Tamil newspapers: Dinamalar, Dinathanthi, Dinamani, Maalai Malar, DT Next, Tamil Murasu with district reporters",
-                "priority_3": "FIR records, police station reports, traffic police statements, hospital statements",
-                "priority_4": "State-level media, PTI/ANI wire service reports, The Hindu, TNIE",
-                "priority_5": "Tamil online portals: Oneindia Tamil, Samayam Tamil, ABP Nadu, News18 Tamil Nadu",
-            },
-            "government_scheme": {
-                "priority_1": "Tamil Nadu news articles and reports: The Hindu (Tamil Nadu section), The New Indian Express (TN edition), DT Next, Dinamalar, Dinathanthi, Dinamani, Times of India (Chennai edition), Deccan Chronicle (Chennai), Business Line, Financial Express",
-                "priority_2": "PIB India releases, Tamil Nadu state government press releases, CM press conferences, minister statements reported in media",
-                "priority_3": "Tamil TV news coverage: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, News18 Tamil Nadu",
-                "priority_4": "District Collectorate press releases, official social media, department websites (tn.gov.in)",
-                "priority_5": "Government gazette notifications and official G.O.s (NOTE: gazettes often lag behind announcements by days to weeks — absence from gazette does NOT mean the policy is false)",
-            },
-            "heritage_environment": {
-                "priority_1": "Tamil Nadu news coverage: The Hindu, TNIE, Dinamalar, Dinathanthi, Dinamani, Vikatan reporting on heritage/environment",
-                "priority_2": "ASI (Archaeological Survey of India) or State Archaeology Department statements, Forest Department",
-                "priority_3": "Expert statements from historians, archaeologists, environmental scientists",
-                "priority_4": "Heritage/environment journalism outlets, specialized publications",
-                "priority_5": "Regional TV news channels (Sun News, Puthiya Thalaimurai, Thanthi TV) and national media",
-            },
-            "politics": {
-                "priority_1": "Tamil Nadu news media: Dinamalar, Dinathanthi, Dinamani, The Hindu, TNIE, DT Next, Vikatan, Nakkheeran, Thuglak for TN politics",
-                "priority_2": "Tamil TV news: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, News18 Tamil Nadu, Kalaignar TV",
-                "priority_3": "PTI, ANI wire services, official party statements",
-                "priority_4": "National media (NDTV, India Today, Times of India), Election Commission records",
-                "priority_5": "Tamil online news: Oneindia Tamil, Samayam Tamil, ABP Nadu, Tamil Guardian",
-            },
-            "crime": {
-                "priority_1": "Tamil Nadu crime reporting: Dinamalar, Dinathanthi, Nakkheeran (known for crime journalism), Dinamani, DT Next",
-                "priority_2": "Tamil TV news crime coverage: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil",
-                "priority_3": "Police press releases, FIR records, court records, ecourts.gov.in",
-                "priority_4": "National media for high-profile cases (NDTV, India Today, The Hindu)",
-                "priority_5": "Wire services (PTI, ANI), fact-checking organizations",
-            },
-            "health_science": {
-                "priority_1": "WHO, ICMR, relevant health ministry statements, peer-reviewed journals",
-                "priority_2": "Tamil Nadu health news: The Hindu, TNIE, Dinamalar reporting on health/science, DT Next health section",
-                "priority_3": "Tamil TV health coverage: Sun News, Puthiya Thalaimurai, News7 Tamil health segments",
-                "priority_4": "Science/health journalists at major outlets, institutional press releases",
-                "priority_5": "Fact-checking organizations (Alt News, Boom Live)",
-            },
-        }
+For EACH claim, start its answer with a line containing exactly "### CLAIM <number>" (e.g. "### CLAIM 1"), followed by the SUMMARY/SCOPE/FINDINGS/SOURCES/RESEARCH_LIMITATIONS block in the format its section asks for. Answer every claim, in order.
+"""
+
+# Locations whose claims get the full Tamil Nadu media list in the scope note
+_TAMIL_NADU_TERMS = frozenset({
+    "tamil nadu", "chennai", "coimbatore", "madurai", "trichy",
+    "salem", "tirunelveli", "erode", "vellore", "thanjavur",
+    "dindigul", "kanchipuram", "tiruppur", "cuddalore",
+    "perambalur", "pudukkottai", "karur", "ariyalur",
+    "nagapattinam", "ramanathapuram", "sivaganga",
+    "virudhunagar", "theni", "tenkasi", "tirupattur",
+    "ranipet", "chengalpattu", "kallakurichi", "villupuram",
+    "krishnagiri", "dharmapuri", "nilgiris", "namakkal",
+})
+# One alternation over the terms: the same substring test as
+# any(term in location ...), done in a single regex search
+_TAMIL_NADU_RE = re.compile("|".join(map(re.escape, sorted(_TAMIL_NADU_TERMS))))
+
+# Domain-specific source hierarchy
+# NOTE: News reports and press releases are prioritized ABOVE gazette
+# documents because policies/schemes are announced in news BEFORE
+# being gazetted (lag of days to weeks).
+_DOMAIN_SOURCES = MappingProxyType({
+    "protest_arrest": {
+        "priority_1": "Tamil Nadu news channels and newspapers: Dinamalar, Dinathanthi (Daily Thanthi), Dinamani, Maalai Malar, Vikatan, Tamil Murasu, Kumudham, Ananda Vikatan, Junior Vikatan, Nakkheeran, Kumudam Reporter, Thuglak, DT Next, The New Indian Express (TN edition), The Hindu (TN section)",
+        "priority_2": "Tamil Nadu TV news channels: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, Kalaignar TV News, Jaya TV News, News18 Tamil Nadu, Captain News, Vasanth TV, Raj News Tamil, Lotus News, Malai Murasu TV, Adithya TV, Peppers TV",
+        "priority_3": "District police press releases, SP/Commissioner statements, FIR records, District Collector/administration statements",
+        "priority_4": "Wire services (PTI, ANI), state-level and national media (NDTV, India Today, Times of India)",
+        "priority_5": "Tamil online news portals: Oneindia Tamil, Samayam Tamil, Tamil Guardian, Asianet News Tamil, ABP Nadu, Zee Tamil News, News Tamil 24x7",
+    },
+    "accident_death": {
+        "priority_1": "Tamil Nadu news channels: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil (TV channels are often FIRST to report accidents with footage)",
+        "priority_2": "Tamil newspapers: Dinamalar, Dinathanthi, Dinamani, Maalai Malar, DT Next, Tamil Murasu with district reporters",
+        "priority_3": "FIR records, police station reports, traffic police statements, hospital statements",
+        "priority_4": "State-level media, PTI/ANI wire service reports, The Hindu, TNIE",
+        "priority_5": "Tamil online portals: Oneindia Tamil, Samayam Tamil, ABP Nadu, News18 Tamil Nadu",
+    },
+    "government_scheme": {
+        "priority_1": "Tamil Nadu news articles and reports: The Hindu (Tamil Nadu section), The New Indian Express (TN edition), DT Next, Dinamalar, Dinathanthi, Dinamani, Times of India (Chennai edition), Deccan Chronicle (Chennai), Business Line, Financial Express",
+        "priority_2": "PIB India releases, Tamil Nadu state government press releases, CM press conferences, minister statements reported in media",
+        "priority_3": "Tamil TV news coverage: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, News18 Tamil Nadu",
+        "priority_4": "District Collectorate press releases, official social media, department websites (tn.gov.in)",
+        "priority_5": "Government gazette notifications and official G.O.s (NOTE: gazettes often lag behind announcements by days to weeks — absence from gazette does NOT mean the policy is false)",
+    },
+    "heritage_environment": {
+        "priority_1": "Tamil Nadu news coverage: The Hindu, TNIE, Dinamalar, Dinathanthi, Dinamani, Vikatan reporting on heritage/environment",
+        "priority_2": "ASI (Archaeological Survey of India) or State Archaeology Department statements, Forest Department",
+        "priority_3": "Expert statements from historians, archaeologists, environmental scientists",
+        "priority_4": "Heritage/environment journalism outlets, specialized publications",
+        "priority_5": "Regional TV news channels (Sun News, Puthiya Thalaimurai, Thanthi TV) and national media",
+    },
+    "politics": {
+        "priority_1": "Tamil Nadu news media: Dinamalar, Dinathanthi, Dinamani, The Hindu, TNIE, DT Next, Vikatan, Nakkheeran, Thuglak for TN politics",
+        "priority_2": "Tamil TV news: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, News18 Tamil Nadu, Kalaignar TV",
+        "priority_3": "PTI, ANI wire services, official party statements",
+        "priority_4": "National media (NDTV, India Today, Times of India), Election Commission records",
+        "priority_5": "Tamil online news: Oneindia Tamil, Samayam Tamil, ABP Nadu, Tamil Guardian",
+    },
+    "crime": {
+        "priority_1": "Tamil Nadu crime reporting: Dinamalar, Dinathanthi, Nakkheeran (known for crime journalism), Dinamani, DT Next",
+        "priority_2": "Tamil TV news crime coverage: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil",
+        "priority_3": "Police press releases, FIR records, court records, ecourts.gov.in",
+        "priority_4": "National media for high-profile cases (NDTV, India Today, The Hindu)",
+        "priority_5": "Wire services (PTI, ANI), fact-checking organizations",
+    },
+    "health_science": {
+        "priority_1": "WHO, ICMR, relevant health ministry statements, peer-reviewed journals",
+        "priority_2": "Tamil Nadu health news: The Hindu, TNIE, Dinamalar reporting on health/science, DT Next health section",
+        "priority_3": "Tamil TV health coverage: Sun News, Puthiya Thalaimurai, News7 Tamil health segments",
+        "priority_4": "Science/health journalists at major outlets, institutional press releases",
+        "priority_5": "Fact-checking organizations (Alt News, Boom Live)",
+    },
+})
 
-        sources = domain_sources.get(claim_type, {
-            "priority_1": "Official government or institutional sources",
-            "priority_2": "Wire services (PTI, ANI, Reuters, AP)",
-            "priority_3": "National and regional media",
-            "priority_4": "Domain-specific expert sources",
-            "priority_5": "Fact-checking organizations",
-        })
-
-        # Build scope-aware guidance
-        scope_note = ""
-        if geographic_scope in ("local", "district"):
-            scope_note = f"""
+_DEFAULT_SOURCES = MappingProxyType({
+    "priority_1": "Official government or institutional sources",
+    "priority_2": "Wire services (PTI, ANI, Reuters, AP)",
+    "priority_3": "National and regional media",
+    "priority_4": "Domain-specific expert sources",
+    "priority_5": "Fact-checking organizations",
+})
+
+
+def _build_source_guidance(sources, geographic_scope: str, is_tamil_nadu: bool) -> str:
+    """Build the source guidance block for one source hierarchy, scope and TN flag."""
+    # Build scope-aware guidance
+    scope_note = ""
+    if geographic_scope in _LOCAL_SCOPES:
+        scope_note = f"""
 IMPORTANT SCOPE NOTE: This is a {geographic_scope.upper()}-level claim. For {geographic_scope}-level events in India:
 - National/international outlets (Reuters, BBC, AP) almost NEVER cover these events — their absence means NOTHING.
 - Regional language newspapers are the PRIMARY source — they have district-level reporters who cover every significant local event.
 - District police and administration press notes are often the most authoritative source."""
 
-            if is_tamil_nadu:
-                scope_note += """
+        if is_tamil_nadu:
+            scope_note += """
 - For Tamil Nadu specifically, search ALL of these news sources:
   NEWSPAPERS: Dinamalar (dinamalar.com), Dinathanthi/Daily Thanthi (dailythanthi.com), Dinamani (dinamani.com), Maalai Malar (maalaimalar.com), Tamil Murasu, Kumudham, The Hindu Tamil (tamil.thehindu.com)
   MAGAZINES: Vikatan (vikatan.com), Ananda Vikatan, Junior Vikatan, Nakkheeran (nakkheeran.in), Kumudam Reporter, Thuglak
@@ -296,7 +387,7 @@ IMPORTANT SCOPE NOTE: This is a {geographic_scope.upper()}-level claim. For {geo
   ENGLISH DAILIES (TN editions): The Hindu, The New Indian Express, DT Next (dtnext.in), Deccan Chronicle Chennai, Times of India Chennai, Business Line
   ONLINE PORTALS: Oneindia Tamil (tamil.oneindia.com), Samayam Tamil (tamil.samayam.com), ABP Nadu, Asianet News Tamil, Zee Tamil News, News Tamil 24x7, Tamil Guardian"""
 
-        guidance = f"""
+    guidance = f"""
 DOMAIN-SPECIFIC SOURCE HIERARCHY (search in this priority order):
 1. {sources.get('priority_1', 'Official sources')}
 2. {sources.get('priority_2', 'Wire services')}
@@ -305,117 +396,622 @@ DOMAIN-SPECIFIC SOURCE HIERARCHY (search in this priority order):
 5. {sources.get('priority_5', 'Other credible sources')}
 {scope_note}"""
 
-        return guidance
+    return guidance
 
-    def _format_x_evidence(self, x_evidence: list) -> str:
+
+# Only local/district scopes (and, within them, a Tamil Nadu location) change
+# the guidance, so every variant is built once at import: keyed by the claim
+# type (None for the default hierarchy), the local scope or None, and the TN flag
+_LOCAL_SCOPES = ("local", "district")
+_SOURCE_GUIDANCE = MappingProxyType({
+    (claim_type, scope, is_tamil_nadu): _build_source_guidance(sources, scope, is_tamil_nadu)
+    for claim_type, sources in [*_DOMAIN_SOURCES.items(), (None, _DEFAULT_SOURCES)]
+    for scope, is_tamil_nadu in [(None, False), *((s, tn) for s in _LOCAL_SCOPES for tn in (False, True))]
+})
+
+
+def _source_guidance(claim_type: str, geographic_scope: str, location: str) -> str:
+    """Look up the precomputed source guidance for a claim."""
+    scope = geographic_scope if geographic_scope in _LOCAL_SCOPES else None
+    is_tamil_nadu = bool(scope and location and _TAMIL_NADU_RE.search(location.lower()))
+    claim_type = claim_type if claim_type in _DOMAIN_SOURCES else None
+    return _SOURCE_GUIDANCE[(claim_type, scope, is_tamil_nadu)]
+
+# X evidence sections in prompt order: author category, header, and the most
+# posts (newest first) quoted from it, which bounds the prompt size
+_X_EVIDENCE_SECTIONS = (
+    ("tamil_news", "[TAMIL NEWS CHANNELS]", 10),
+    ("national_news", "[NATIONAL NEWS CHANNELS]", 10),
+    ("common_people", "[PUBLIC POSTS]", 5),
+)
+_NEWLINE_TO_SPACE = str.maketrans("\n", " ")
+
+
+def _x_evidence_key(x_evidence: list) -> tuple:
+    """Hashable (category, handle, date, text) view of X posts for the prompt cache."""
+    if not x_evidence:
+        return ()
+    return tuple(
+        (p.get("author_category"), p.get("author_handle", "?"), p.get("date", "?"), p.get("text", ""))
+        for p in x_evidence
+    )
+
+
+def _post_date(post: tuple) -> str:
+    date = post[2]
+    return date if isinstance(date, str) and date[:4].isdigit() else ""
+
+
+@lru_cache(maxsize=256)
+def _x_evidence_section(posts: tuple) -> str:
+    """Format X posts (from _x_evidence_key) as an evidence section for the research prompt."""
+    if not posts:
+        return ""
+
+    # One pass to group posts by author category
+    groups = {}
+    for post in posts:
+        groups.setdefault(post[0], []).append(post)
+
+    lines = [
+        "===============================================================================",
+        "X (SOCIAL MEDIA) EVIDENCE — Posts found discussing this claim:",
+        "===============================================================================",
+    ]
+
+    for category, header, cap in _X_EVIDENCE_SECTIONS:
+        group = groups.get(category)
+        if group:
+            # Dates are YYYY-MM-DD, so they sort as strings; undated posts go last
+            group = sorted(group, key=_post_date, reverse=True)[:cap]
+            lines.append(header)
+            lines.extend(
+                f"- @{handle} ({date}): \"{text[:140].translate(_NEWLINE_TO_SPACE)}\""
+                for _, handle, date, text in group
+            )
+            lines.append("")
+
+    lines.append("Use these X posts as LEADS for your research. Verify the claims made in these posts")
+    lines.append("using credible sources. Posts from news channels are more reliable than common users.")
+    lines.append("If news channel posts report specific facts, try to find the original articles or sources.")
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=512)
+def _research_prompt(search_query: str, claim: str, entities: tuple, context: str, time_period: str,
+                     claim_type: str, geographic_scope: str, location: str, original_input: str,
+                     x_evidence: tuple) -> str:
+    """
+    Build the research prompt. Memoized on the claim fields, so retries and
+    repeat checks of the same claim reuse the prompt instead of rebuilding it.
+    """
+    # Format entities for display
+    entities_text = ', '.join(entities) if entities else 'N/A'
+
+    # Check if original input is in a regional language
+    is_regional_language = not original_input.isascii() if original_input else False
+
+    return _RESEARCH_PROMPT_TEMPLATE.format_map({
+        "claim_type": claim_type.replace('_', ' ').upper(),
+        "geographic_scope": geographic_scope.upper(),
+        "location": location if location else 'Not specified',
+        "source_guidance": _source_guidance(claim_type, geographic_scope, location),
+        "claim": claim,
+        "original_language_line": f"Claim (Original Language): {original_input[:300]}" if is_regional_language else "",
+        "entities": entities_text,
+        "time_period": time_period if time_period else 'Not specified',
+        "context": context if context else 'None provided',
+        "search_query": search_query,
+        "regional_language_note": _REGIONAL_LANGUAGE_NOTE if is_regional_language else "",
+        "x_evidence": _x_evidence_section(x_evidence),
+    })
+
+
+class PerplexityService:
+    """
+    Integrates with Perplexity AI for deep research and fact verification.
+    """
+
+    def __init__(self):
+        if not PERPLEXITY_API_KEY:
+            log.warning("PERPLEXITY_API_KEY not set. Research functionality will be limited.")
+            self.api_key = None
+        else:
+            self.api_key = PERPLEXITY_API_KEY
+
+        self.base_url = "https://api.perplexity.ai/chat/completions"
+        self.model = "sonar-pro"  # Perplexity's online research model
+
+        # Pooled keep-alive session: reuses the TCP/TLS connection to the API
+        # instead of a new handshake per research call. Transient 5xx/429s are
+        # retried with backoff (honouring Retry-After); a final error response still
+        # reaches the status checks.
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        } if self.api_key else {}
+        self.session.headers.update(self._headers)
+
+        # Async counterpart for deep_research_async, created on first use
+        self._aclient = None
+        # Running deep_research_async calls by payload key, so concurrent duplicates share one
+        self._inflight = {}
+        # Bounds async API requests in flight (see PERPLEXITY_MAX_CONCURRENCY)
+        self._research_sem = asyncio.Semaphore(PERPLEXITY_MAX_CONCURRENCY)
+        # Extra headers for research POSTs (see _wire_body)
+        self._body_headers = {"Content-Encoding": "gzip"} if PERPLEXITY_GZIP_REQUESTS else None
+
+    @property
+    def aclient(self) -> httpx.AsyncClient:
         """
-        Format X posts as an evidence section for the research prompt.
+        Pooled async HTTP client for deep_research_async, created on first use
+        so sync-only callers never open one. HTTP/2 lets concurrent research
+        calls share a connection instead of each holding their own.
+        """
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                headers=self._headers,
+                limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+                timeout=httpx.Timeout(30.0),
+            )
+        return self._aclient
 
-        Posts are grouped by author category (Tamil news, National news, Public).
+    def deep_research(self, search_query: str, structured_claim: dict, x_evidence: list = None,
+                      accept=None, claim_wide: bool = True) -> dict:
         """
-        if not x_evidence:
-            return ""
+        Perform deep research using Perplexity AI.
 
-        tamil_posts = [p for p in x_evidence if p.get("author_category") == "tamil_news"]
-        national_posts = [p for p in x_evidence if p.get("author_category") == "national_news"]
-        common_posts = [p for p in x_evidence if p.get("author_category") == "common_people"]
+        Args:
+            search_query (str): Optimized search query
+            structured_claim (dict): Structured claim data
+            x_evidence (list): Optional list of X posts to use as research leads
+            accept (callable): Optional result -> bool deciding whether new results
+                are good enough to be reused for the whole claim (default: has findings)
+            claim_wide (bool): Reuse results cached for the claim under other
+                queries; False when retrying because those results were unusable
 
-        lines = [
-            "===============================================================================",
-            "X (SOCIAL MEDIA) EVIDENCE — Posts found discussing this claim:",
-            "===============================================================================",
-        ]
+        Returns:
+            dict: Research results with findings and sources
+        """
+        if not self.api_key:
+            return self._fallback_research(search_query, reason="API key not configured. Set PERPLEXITY_API_KEY in .env")
 
-        if tamil_posts:
-            lines.append("[TAMIL NEWS CHANNELS]")
-            for p in tamil_posts:
-                text = p.get("text", "").replace("\n", " ")[:140]
-                lines.append(f"- @{p.get('author_handle', '?')} ({p.get('date', '?')}): \"{text}\"")
-            lines.append("")
+        try:
+            payload = self._build_payload(search_query, structured_claim, x_evidence)
+            # Serialized once with orjson: the same bytes key the cache and are sent as the body
+            body = orjson.dumps(payload)
+            cache_key = llm_cache.prompt_key(self.model, body)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                log.debug("[Perplexity] Using cached research for: %.50s...", search_query)
+                return cached
 
-        if national_posts:
-            lines.append("[NATIONAL NEWS CHANNELS]")
-            for p in national_posts:
-                text = p.get("text", "").replace("\n", " ")[:140]
-                lines.append(f"- @{p.get('author_handle', '?')} ({p.get('date', '?')}): \"{text}\"")
-            lines.append("")
+            # Same (or a reworded) claim researched earlier with a different query or evidence
+            cached, research_token = research_cache.lookup(structured_claim, search_query, claim_wide)
+            if cached is not None:
+                log.debug("[Perplexity] Using cached research for claim: %.50s...", search_query)
+                return cached
 
-        if common_posts:
-            lines.append("[PUBLIC POSTS]")
-            for p in common_posts:
-                text = p.get("text", "").replace("\n", " ")[:140]
-                lines.append(f"- @{p.get('author_handle', '?')} ({p.get('date', '?')}): \"{text}\"")
-            lines.append("")
+            log.debug("[Perplexity] Making API request for: %.50s...", search_query)
+            # Stream the completion and parse it line by line as it arrives
+            with self.session.post(
+                self.base_url,
+                data=self._wire_body(body),
+                headers=self._body_headers,
+                timeout=30,
+                stream=True
+            ) as response:
+                log.debug("[Perplexity] Response status: %s", response.status_code)
+                if response.status_code != 200:
+                    return self._handle_error(response, search_query)
 
-        lines.append("Use these X posts as LEADS for your research. Verify the claims made in these posts")
-        lines.append("using credible sources. Posts from news channels are more reliable than common users.")
-        lines.append("If news channel posts report specific facts, try to find the original articles or sources.")
+                # Event streams are UTF-8 by definition; requests would otherwise
+                # assume ISO-8859-1 for a text/* type without a charset
+                response.encoding = "utf-8"
+                parser = _ResponseParser()
+                for line in response.iter_lines(decode_unicode=True):
+                    parser.feed_event(line)
 
-        return "\n".join(lines)
+            return self._finish_research(parser, cache_key, research_token, accept)
 
-    def _parse_research_response(self, research_text: str) -> dict:
+        except requests.exceptions.Timeout:
+            log.warning("[Perplexity] API timeout")
+            return self._fallback_research(search_query, reason="Request timed out after 30s")
+        except Exception as e:
+            log.error("[Perplexity] Research error: %s", e)
+            return self._fallback_research(search_query, reason=str(e))
+
+    async def deep_research_async(self, search_query: str, structured_claim: dict, x_evidence: list = None,
+                                  accept=None, claim_wide: bool = True) -> dict:
         """
-        Parse the research response from Perplexity.
+        Async variant of deep_research for callers running on the event loop.
+
+        Uses a pooled httpx.AsyncClient so research calls can be awaited
+        concurrently with other I/O (e.g. via asyncio.gather) without tying up
+        a worker thread. Concurrent calls with an identical payload share a
+        single API request.
 
         Args:
-            research_text (str): Raw research text
+            search_query (str): Optimized search query
+            structured_claim (dict): Structured claim data
+            x_evidence (list): Optional list of X posts to use as research leads
+            accept (callable): Optional result -> bool deciding whether new results
+                are good enough to be reused for the whole claim (default: has findings)
+            claim_wide (bool): Reuse results cached for the claim under other
+                queries; False when retrying because those results were unusable
 
         Returns:
-            dict: Parsed research with summary, findings, sources
+            dict: Research results with findings and sources
         """
-        summary = ""
-        findings = []
-        sources = []
-        scope = ""
-        research_limitations = ""
+        if not self.api_key:
+            return self._fallback_research(search_query, reason="API key not configured. Set PERPLEXITY_API_KEY in .env")
 
-        # Split into sections
-        lines = research_text.split('\n')
-        current_section = None
+        try:
+            payload = self._build_payload(search_query, structured_claim, x_evidence)
+            # Serialized once with orjson: the same bytes key the cache and are sent as the body
+            body = orjson.dumps(payload)
+            cache_key = llm_cache.prompt_key(self.model, body)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                log.debug("[Perplexity] Using cached research for: %.50s...", search_query)
+                return cached
 
-        for line in lines:
-            line = line.strip()
-            # Remove markdown bold formatting (**text** -> text)
-            clean_line = line.replace("**", "")
-
-            if clean_line.startswith("SUMMARY:"):
-                current_section = "summary"
-                summary = clean_line.replace("SUMMARY:", "").strip()
-            elif clean_line.startswith("SCOPE:"):
-                current_section = "scope"
-                scope = clean_line.replace("SCOPE:", "").strip()
-            elif clean_line.startswith("FINDINGS:"):
-                current_section = "findings"
-            elif clean_line.startswith("SOURCES:"):
-                current_section = "sources"
-            elif clean_line.startswith("RESEARCH_LIMITATIONS:") or clean_line.startswith("RESEARCH LIMITATIONS:"):
-                current_section = "research_limitations"
-                research_limitations = clean_line.split(":", 1)[1].strip() if ":" in clean_line else ""
-            elif line.startswith("-") or line.startswith("•") or line.startswith("*"):
-                # Handle bullet points (-, •, or * for markdown lists)
-                content = line.lstrip("-•*").strip()
-                # Also remove any leading ** from bold bullets
-                if content.startswith("**"):
-                    content = content[2:]
-                if current_section == "findings" and content:
-                    findings.append(content)
-                elif current_section == "sources" and content:
-                    sources.append(content)
-                elif current_section == "research_limitations" and content:
-                    research_limitations += " " + content
-            elif current_section == "summary" and line and not clean_line.startswith("Verdict"):
-                summary += " " + line
-            elif current_section == "research_limitations" and line:
-                research_limitations += " " + line
+            # The semantic tier may call the embedding API, so keep it off the event loop
+            cached, research_token = await asyncio.to_thread(
+                research_cache.lookup, structured_claim, search_query, claim_wide
+            )
+            if cached is not None:
+                log.debug("[Perplexity] Using cached research for claim: %.50s...", search_query)
+                return cached
 
-        return {
-            "summary": summary.strip(),
-            "findings": findings,
-            "sources": sources,
-            "scope": scope,
-            "research_limitations": research_limitations.strip()
+            return await coalesce(
+                self._inflight, cache_key,
+                lambda: self._stream_research_async(body, search_query, cache_key, research_token, accept)
+            )
+
+        except httpx.TimeoutException:
+            log.warning("[Perplexity] API timeout")
+            return self._fallback_research(search_query, reason="Request timed out after 30s")
+        except Exception as e:
+            log.error("[Perplexity] Research error: %s", e)
+            return self._fallback_research(search_query, reason=str(e))
+
+    async def _stream_research_async(self, body: bytes, search_query: str, cache_key: bytes,
+                                     research_token=None, accept=None) -> dict:
+        content = self._wire_body(body)
+        for attempt in range(_ASYNC_MAX_RETRIES + 1):
+            async with self._research_sem:
+                log.debug("[Perplexity] Making async API request for: %.50s...", search_query)
+                async with self.aclient.stream(
+                    "POST", self.base_url, content=content, headers=self._body_headers
+                ) as response:
+                    log.debug("[Perplexity] Response status: %s", response.status_code)
+                    if response.status_code == 200:
+                        parser = _ResponseParser()
+                        async for line in response.aiter_lines():
+                            parser.feed_event(line)
+                        break
+                    await response.aread()
+
+            if response.status_code not in _ASYNC_RETRY_STATUSES or attempt == _ASYNC_MAX_RETRIES:
+                return self._handle_error(response, search_query)
+            # Wait outside the semaphore so other requests can use the slot
+            delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+            log.warning("[Perplexity] API returned %s, retrying in %.1fs", response.status_code, delay)
+            await asyncio.sleep(delay)
+
+        # Off the event loop: storing the result may write to Redis and embed the claim
+        return await asyncio.to_thread(self._finish_research, parser, cache_key, research_token, accept)
+
+    async def deep_research_many_async(self, claims: list) -> list:
+        """
+        Research several claims concurrently.
+
+        Args:
+            claims (list): (search_query, structured_claim) or
+                (search_query, structured_claim, x_evidence) tuples
+
+        Returns:
+            list: Research results in the same order as claims
+        """
+        return await asyncio.gather(*(self.deep_research_async(*claim) for claim in claims))
+
+    def deep_research_batch(self, claims: list) -> list:
+        """
+        Research several related claims (e.g. the assertions of one article)
+        with one API request per group of up to five, instead of one each.
+
+        Claims already in the research caches are not sent; each result is
+        cached as if it had been researched on its own.
+
+        Args:
+            claims (list): (search_query, structured_claim) or
+                (search_query, structured_claim, x_evidence) tuples
+
+        Returns:
+            list: Research results in the same order as claims
+        """
+        if not self.api_key:
+            return [
+                self._fallback_research(claim[0], reason="API key not configured. Set PERPLEXITY_API_KEY in .env")
+                for claim in claims
+            ]
+        if len(claims) == 1:
+            return [self.deep_research(*claims[0])]
+
+        results = [None] * len(claims)
+        pending = []  # (index, search_query, prompt, cache_key, research_token)
+        for index, claim in enumerate(claims):
+            search_query, structured_claim = claim[0], claim[1]
+            x_evidence = claim[2] if len(claim) > 2 else None
+            try:
+                payload = self._build_payload(search_query, structured_claim, x_evidence)
+                cache_key = llm_cache.prompt_key(self.model, orjson.dumps(payload))
+                cached = llm_cache.get(cache_key)
+                if cached is None:
+                    cached, research_token = research_cache.lookup(structured_claim, search_query)
+            except Exception as e:
+                log.error("[Perplexity] Research error: %s", e)
+                results[index] = self._fallback_research(search_query, reason=str(e))
+                continue
+            if cached is not None:
+                log.debug("[Perplexity] Using cached research for: %.50s...", search_query)
+                results[index] = cached
+            else:
+                prompt = payload["messages"][1]["content"]
+                pending.append((index, search_query, prompt, cache_key, research_token))
+
+        for start in range(0, len(pending), _BATCH_MAX_CLAIMS):
+            group = pending[start:start + _BATCH_MAX_CLAIMS]
+            for (index, *_), result in zip(group, self._research_group(group)):
+                # Claims the batched response left out are researched on their own
+                results[index] = result if result is not None else self.deep_research(*claims[index])
+
+        return results
+
+    def _research_group(self, group: list) -> list:
+        """
+        Send one batched research request for up to _BATCH_MAX_CLAIMS uncached claims.
+
+        Args:
+            group (list): (index, search_query, prompt, cache_key, research_token) tuples
+
+        Returns:
+            list: Research results in group order, None for claims the response
+                had no section for (nothing is cached for those)
+        """
+        parts = [_BATCH_PROMPT_HEADER.format(count=len(group))]
+        parts += [f"### CLAIM {n}\n{item[2]}" for n, item in enumerate(group, 1)]
+        body = orjson.dumps(self._chat_payload("\n".join(parts), max_tokens=_BATCH_TOKENS_PER_CLAIM * len(group)))
+        queries = [item[1] for item in group]
+
+        try:
+            log.debug("[Perplexity] Making batched API request for %d claims", len(group))
+            with self.session.post(
+                self.base_url,
+                data=self._wire_body(body),
+                headers=self._body_headers,
+                timeout=30 * len(group),
+                stream=True
+            ) as response:
+                log.debug("[Perplexity] Response status: %s", response.status_code)
+                if response.status_code != 200:
+                    return [self._handle_error(response, query) for query in queries]
+
+                response.encoding = "utf-8"
+                parser = _BatchResponseParser(len(group))
+                for line in response.iter_lines(decode_unicode=True):
+                    parser.feed_event(line)
+
+            claim_parsers = parser.close()
+            if len(parser.seen) < len(group):
+                log.warning("[Perplexity] Batched response covered %d of %d claims", len(parser.seen), len(group))
+            return [
+                self._finish_research(claim_parser, item[3], item[4]) if n in parser.seen else None
+                for n, (claim_parser, item) in enumerate(zip(claim_parsers, group))
+            ]
+
+        except requests.exceptions.Timeout:
+            log.warning("[Perplexity] API timeout")
+            return [self._fallback_research(query, reason="Request timed out") for query in queries]
+        except Exception as e:
+            log.error("[Perplexity] Research error: %s", e)
+            return [self._fallback_research(query, reason=str(e)) for query in queries]
+
+    def warm_up(self, connections: int = WARMUP_CONNECTIONS) -> None:
+        """
+        Open keep-alive connections to the API so the first research calls
+        don't pay the TCP/TLS handshake.
+
+        The requests are made in parallel so each one opens its own pooled
+        connection. Failures are only logged.
+        """
+        if not self.api_key:
+            return
+
+        def ping(_):
+            try:
+                self.session.head(self.base_url, timeout=5)
+            except requests.exceptions.RequestException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            errors = [e for e in pool.map(ping, range(connections)) if e]
+        if errors:
+            log.warning("[Perplexity] Connection warm-up failed: %s", errors[0])
+
+    async def aclose(self):
+        """Close the async HTTP client's pooled connections (call on shutdown)."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def _build_payload(self, search_query: str, structured_claim: dict, x_evidence: list = None) -> dict:
+        """
+        Build the chat-completions request body for a research call.
+
+        Args:
+            search_query (str): Optimized search query
+            structured_claim (dict): Structured claim data
+            x_evidence (list): Optional list of X posts to use as research leads
+
+        Returns:
+            dict: JSON payload for the Perplexity API
+        """
+        research_prompt = _research_prompt(
+            search_query,
+            structured_claim.get('claim', search_query),
+            tuple(structured_claim.get('entities', [])),
+            structured_claim.get('context', ''),
+            structured_claim.get('time_period', ''),
+            structured_claim.get('claim_type', 'other'),
+            structured_claim.get('geographic_scope', 'national'),
+            structured_claim.get('location', ''),
+            structured_claim.get('original_input', ''),
+            _x_evidence_key(x_evidence),
+        )
+
+        return self._chat_payload(research_prompt)
+
+    def _wire_body(self, body: bytes) -> bytes:
+        """
+        Request body as sent: gzip-compressed when PERPLEXITY_GZIP_REQUESTS is
+        set (the multi-KB prompts shrink to roughly a third), otherwise as is.
+        Cache keys are always taken from the uncompressed body.
+        """
+        return gzip.compress(body, compresslevel=5) if PERPLEXITY_GZIP_REQUESTS else body
+
+    def _chat_payload(self, prompt: str, max_tokens: int = 2000) -> dict:
+        """
+        Wrap a research prompt in the chat-completions request body.
+
+        Args:
+            prompt (str): User message content
+            max_tokens (int): Completion token limit
+
+        Returns:
+            dict: JSON payload for the Perplexity API
+        """
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional fact-checking assistant with access to real-time information. Match your source selection to the SCOPE of the claim: use regional/local language media for district-level events, state-level outlets for state events, and national/international sources for national/international events. For Indian local events, prioritize regional language newspapers (Tamil, Hindi, Telugu, etc.), district police/administration releases, and local TV channels. Never dismiss a local claim simply because international outlets don't cover it. IMPORTANT: When a search query contains both English and regional language text (separated by |), search using BOTH languages. Regional language keywords help you find articles in local media that publish in that language (e.g., Tamil newspapers publish in Tamil, not English). Search the regional language terms on regional news sites."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.2,  # Lower temperature for more factual responses
+            "max_tokens": max_tokens,
+            "stream": True
         }
 
+        return payload
+
+    def _finish_research(self, parser: _ResponseParser, cache_key: bytes = None, research_token=None,
+                         accept=None) -> dict:
+        """
+        Finalize a streamed research response.
+
+        Args:
+            parser (_ResponseParser): Parser the response was streamed into
+            cache_key (bytes): LLM cache key to store the results under
+            research_token: Token from research_cache.lookup() to store the results under
+            accept (callable): Caller's result -> bool check for reusing the results claim-wide
+
+        Returns:
+            dict: Parsed research results
+        """
+        parsed_result = parser.close()
+        log.debug("[Perplexity] Got response (%d chars)", parser.chars)
+        log.debug("[Perplexity] First 500 chars: %s", parser.head)
+        log.debug("[Perplexity] Parsed: %d findings, %d sources", len(parsed_result["findings"]), len(parsed_result["sources"]))
+
+        # Debug: if parsing failed, show why
+        if not parsed_result["findings"]:
+            log.debug("[Perplexity] Has SUMMARY: %s", "SUMMARY" in parser.sections_seen)
+            log.debug("[Perplexity] Has FINDINGS: %s", "FINDINGS" in parser.sections_seen)
+
+        # Empty results expire sooner, so news that breaks after a check is found
+        if cache_key is not None:
+            ttl = None if parsed_result["findings"] else RESEARCH_NEGATIVE_TTL_SECONDS
+            llm_cache.put(cache_key, parsed_result, ttl)
+        research_cache.store(research_token, parsed_result, accept(parsed_result) if accept else None)
+
+        return parsed_result
+
+    def _handle_error(self, response, search_query: str) -> dict:
+        """
+        Turn a non-200 Perplexity HTTP response (requests or httpx) into a fallback.
+
+        Args:
+            response: HTTP response with status_code and text (body already read)
+            search_query (str): Query the research was run for
+
+        Returns:
+            dict: Fallback research with api_error
+        """
+        if response.status_code == 401:
+            log.error("[Perplexity] API error: 401 Unauthorized")
+            return self._fallback_research(search_query, reason="Invalid or expired API key (401 Unauthorized). Check your PERPLEXITY_API_KEY credits.")
+        elif response.status_code == 429:
+            log.warning("[Perplexity] API error: 429 Rate limit")
+            return self._fallback_research(search_query, reason="Rate limit exceeded (429). Perplexity API quota reached.")
+        else:
+            log.error("[Perplexity] API error: %s - %s", response.status_code, response.text)
+            return self._fallback_research(search_query, reason=f"API returned error {response.status_code}")
+
+    def _get_source_guidance(self, claim_type: str, geographic_scope: str, location: str) -> str:
+        """
+        Generate domain-specific and scope-specific source guidance for the research prompt.
+
+        Args:
+            claim_type (str): Type of claim (protest_arrest, accident_death, etc.)
+            geographic_scope (str): Geographic scope (local, district, state, national, international)
+            location (str): Specific location
+
+        Returns:
+            str: Formatted source guidance for the prompt
+        """
+        return _source_guidance(claim_type, geographic_scope, location)
+
+    def _format_x_evidence(self, x_evidence: list) -> str:
+        """
+        Format X posts as an evidence section for the research prompt.
+
+        Posts are grouped by author category (Tamil news, National news, Public).
+        """
+        return _x_evidence_section(_x_evidence_key(x_evidence))
+
+    def _parse_research_response(self, research_text: str) -> dict:
+        """
+        Parse the research response from Perplexity.
+
+        Args:
+            research_text (str): Raw research text
+
+        Returns:
+            dict: Parsed research with summary, findings, sources
+        """
+        parser = _ResponseParser()
+        parser.feed(research_text)
+        return parser.close()
+
     def _fallback_research(self, search_query: str, reason: str = "API unavailable") -> dict:
         """
         Fallback research when Perplexity API is unavailable.
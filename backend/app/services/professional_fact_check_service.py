@@ -1,349 +1,34 @@
 from app.repository.claim_repository import ClaimRepository
-from app.core.config import GEMINI_API_KEY, GEMINI_MODEL
-from app.services.claim_structuring_service import ClaimStructuringService
+from app.core.concurrency import MicroBatcher, prefetch_executor, save_executor
+from app.core.config import (
+    CLAIM_SEMANTIC_CACHE_ENABLED, GEMINI_API_KEY, GEMINI_MODEL, VERDICT_BATCH_SIZE, VERDICT_BATCH_WINDOW_SECONDS,
+)
+from app.services.claim_structuring_service import claim_signature, get_claim_structuring_service
 from app.services.perplexity_service import PerplexityService
 from app.services.x_analysis_service import XAnalysisService
 from app.services.news_search_service import NewsSearchService
-from google import genai
+from app.services._gemini import embed, get_client, is_retryable
+from google.genai import types
+from concurrent.futures import Future, wait
 from datetime import datetime
+import ast
+import copy
+import logging
+import orjson
+import random
+import threading
 import time
 import re
 
+log = logging.getLogger(__name__)
 
-class ProfessionalFactCheckService:
-    """
-    Professional fact-checking service following the 6-step pipeline:
-    1. Check Database Cache
-    2. LLM Structuring
-    3. Research Phase:
-       a) X Analysis FIRST — extracts posts with text, date, author priority
-       b) Perplexity Deep Research — receives X evidence as input leads
-    4. Generate Final Result
-    5. Database Storage
-    6. Return Response
-    """
-
-    def __init__(self):
-        self.repo = ClaimRepository()
-        self.structuring = ClaimStructuringService()
-        self.perplexity = PerplexityService()
-        self.x_analysis = XAnalysisService()
-        self.news_search = NewsSearchService()
-
-        if not GEMINI_API_KEY:
-            raise ValueError("GEMINI_API_KEY environment variable is not set")
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
-        self.model = GEMINI_MODEL
-
-    def _detect_language(self, text: str) -> str:
-        """Detect if the input text is Tamil or English."""
-        tamil_chars = re.findall(r'[\u0B80-\u0BFF]', text)
-        if len(tamil_chars) >= 3:
-            return "Tamil"
-        return "English"
-
-    def check_fact(self, claim_text: str) -> dict:
-        """
-        Execute the complete professional fact-checking pipeline.
-
-        Args:
-            claim_text (str): The claim to fact-check
-
-        Returns:
-            dict: Formatted fact-check result
-        """
-        # Step 1: Check Database Cache
-        cached_claim = self.repo.find_cached_claim(claim_text)
-        if cached_claim:
-            return self._format_cached_response(cached_claim)
-
-        # Detect input language for response language matching
-        response_language = self._detect_language(claim_text)
-        print(f"[Pipeline] Detected input language: {response_language}")
-
-        # Step 2: LLM Structuring + Classification
-        structured_claim = self.structuring.structure_claim(claim_text)
-        claim_category = self.structuring.classify_claim(structured_claim)
-        structured_claim["claim_category"] = claim_category
-        print(f"[Pipeline] Claim classified as: {claim_category}")
-        search_query = self.structuring.create_search_query(structured_claim)
-
-        # Step 3: X Analysis → Perplexity Deep Research → News Fallback (sequential)
-        research_data, x_analysis_data, news_data = self._run_research(
-            search_query, structured_claim
-        )
-
-        # Step 4: Generate Final Result (with combined research context)
-        final_result = self._generate_verdict(
-            claim_text, structured_claim, research_data, x_analysis_data, news_data=news_data,
-            response_language=response_language
-        )
-
-        # Step 5: Database Storage
-        formatted_response = self._format_response(claim_text, final_result, research_data, structured_claim, x_analysis_data, response_language=response_language)
-
-        # Only cache if research was successful (don't cache API failures)
-        research_summary = research_data.get("summary", "")
-        is_successful_research = (
-            research_summary and
-            "Unable to perform deep research" not in research_summary and
-            "requires Perplexity API key" not in research_summary
-        )
-
-        if is_successful_research:
-            self.repo.save(
-                claim_text=claim_text,
-                response_text=str(formatted_response),
-                structured_data=structured_claim,
-                research_data=research_data
-            )
-        else:
-            print(f"[WARNING] Skipping cache for failed research: {claim_text[:50]}...")
-
-        # Step 6: Return Response
-        formatted_response["cached"] = False
-        return formatted_response
-
-    def _run_research(self, search_query: str, structured_claim: dict) -> tuple:
-        """
-        Run X Analysis first, then feed X evidence into Perplexity Deep Research.
-        If Perplexity returns no results, fall back to Google News RSS search.
-
-        Flow:
-          Step 3a: X Analysis → extracts posts with text, date, author priority
-          Step 3b: Perplexity receives X posts as research leads
-          Step 3c: If Perplexity fails → Google News RSS fallback
-
-        Args:
-            search_query (str): Optimized search query
-            structured_claim (dict): Structured claim data
-
-        Returns:
-            tuple: (research_data, x_analysis_data, news_data)
-        """
-        print(f"\n[RESEARCH] Starting sequential research phase...")
-
-        # Step 3a: Run X Analysis FIRST
-        print(f"[RESEARCH] Step 3a: X Analysis — searching for posts...")
-        x_analysis_data = None
-        try:
-            x_analysis_data = self.x_analysis.analyze_claim(structured_claim, search_query)
-            posts_analyzed = x_analysis_data.get("posts_analyzed", 0)
-            posts_content = x_analysis_data.get("posts_content", [])
-            sources_found = len(x_analysis_data.get("external_sources", []))
-            news_posts = sum(1 for p in posts_content if p.get("priority", 3) <= 2)
-            print(f"[RESEARCH] Step 3a: X Analysis complete ({posts_analyzed} posts, {news_posts} from news channels, {sources_found} external links)")
-        except Exception as e:
-            print(f"[RESEARCH] Step 3a: X Analysis failed ({str(e)})")
-            x_analysis_data = {
-                "has_relevant_posts": False,
-                "posts_analyzed": 0,
-                "posts_content": [],
-                "external_sources": [],
-                "discussion_summary": "",
-                "analysis_note": f"X analysis unavailable: {str(e)}",
-                "error": str(e)
-            }
-
-        # Step 3b: Extract X posts as evidence for Perplexity
-        # Only feed news channel posts (priority 1-2) to save Perplexity tokens
-        all_posts = x_analysis_data.get("posts_content", [])
-        x_evidence = [p for p in all_posts if p.get("priority", 3) <= 2]
-        if x_evidence:
-            print(f"[RESEARCH] Step 3b: Feeding {len(x_evidence)} news channel posts as evidence into Perplexity (skipped {len(all_posts) - len(x_evidence)} common posts)")
-        else:
-            print(f"[RESEARCH] Step 3b: No news channel posts to feed — running Perplexity without X evidence")
-
-        # Step 3c: Run Perplexity WITH X evidence
-        print(f"[RESEARCH] Step 3b: Perplexity Deep Search — starting...")
-        research_data = None
-        try:
-            # Enhance query for events/policies to force recency
-            claim_category = structured_claim.get("claim_category", "GENERAL")
-            enhanced_query = f"{search_query} latest news" if claim_category in ["POLICY", "EVENT"] else search_query
-            
-            research_data = self.perplexity.deep_research(enhanced_query, structured_claim, x_evidence)
-            print(f"[RESEARCH] Step 3b: Perplexity Deep Search complete")
-        except Exception as e:
-            print(f"[RESEARCH] Step 3b: Perplexity Deep Search failed ({str(e)})")
-            research_data = {
-                "summary": f"Research failed: {str(e)}",
-                "findings": [],
-                "sources": []
-            }
-
-        # Retry with alternative query if Perplexity returned nothing useful
-        if not self._assess_perplexity_relevance(research_data):
-            alt_query = self.structuring.create_alternative_query(structured_claim)
-            if alt_query and alt_query != search_query:
-                print(f"[RESEARCH] Perplexity returned no findings. Retrying with alternative query...")
-                try:
-                    # Also enhance the alternative query for recency
-                    enhanced_alt = f"{alt_query} latest news" if claim_category in ["POLICY", "EVENT"] else alt_query
-                    retry_data = self.perplexity.deep_research(enhanced_alt, structured_claim, x_evidence)
-                    if self._assess_perplexity_relevance(retry_data):
-                        research_data = retry_data
-                        print(f"[RESEARCH] Retry successful — found relevant results")
-                    else:
-                        print(f"[RESEARCH] Retry also returned no findings")
-                except Exception as e:
-                    print(f"[RESEARCH] Retry failed: {str(e)}")
-
-        # Step 3d: If Perplexity returned nothing useful, try Google News RSS
-        news_data = None
-        if not self._assess_perplexity_relevance(research_data):
-            print(f"[RESEARCH] Step 3c: Perplexity returned no findings. Trying Google News RSS fallback...")
-            try:
-                # Use enhanced query if we have one, otherwise fallback to standard query logic
-                news_data = self.news_search.search_news(enhanced_query if 'enhanced_query' in locals() else search_query, structured_claim)
-                articles_found = news_data.get("articles_found", 0)
-                tn_articles = news_data.get("tn_articles_found", 0)
-                has_credible = news_data.get("has_credible_evidence", False)
-                print(f"[RESEARCH] Step 3c: Google News found {articles_found} articles ({tn_articles} from TN), credible evidence: {has_credible}")
-            except Exception as e:
-                print(f"[RESEARCH] Step 3c: Google News RSS fallback failed: {str(e)}")
-                news_data = None
-
-        print(f"[RESEARCH] Research phase complete\n")
-
-        return research_data, x_analysis_data, news_data
-
-    def _generate_verdict(self, claim_text: str, structured_claim: dict, research_data: dict, x_analysis_data: dict = None, max_retries: int = 3, news_data: dict = None, response_language: str = "English") -> dict:
-        """
-        Generate the final verdict based on research data and X analysis.
-
-        Args:
-            claim_text (str): Original claim
-            structured_claim (dict): Structured claim data with new schema
-            research_data (dict): Perplexity research results
-            x_analysis_data (dict): X analysis results with external sources (optional)
-            max_retries (int): Maximum retry attempts for API overload
-
-        Returns:
-            dict: Verdict with status and explanation
-        """
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                chat = self.client.chats.create(model=self.model)
-
-                # Extract structured components
-                structured_statement = structured_claim.get("claim", claim_text)
-                entities = structured_claim.get("entities", [])
-                time_period = structured_claim.get("time_period", "")
-                context = structured_claim.get("context", "")
-
-                # Build context from Perplexity research (PRIMARY)
-                research_summary = research_data.get("summary", "No research data available")
-                findings = research_data.get("findings", [])
-                sources = research_data.get("sources", [])
-
-                findings_text = "\n".join([f"- {f}" for f in findings]) if findings else "No specific findings"
-                sources_text = "\n".join([f"- {s}" for s in sources]) if sources else "No sources available"
-                entities_text = ", ".join(entities) if entities else "N/A"
-
-                # Build X analysis context for verdict
-                # Light summary when Perplexity succeeded; detailed posts when Perplexity failed
-                perplexity_has_relevant = self._assess_perplexity_relevance(research_data)
-                x_summary = self._build_x_summary(x_analysis_data)
-                x_news_evidence = ""
-                if not perplexity_has_relevant:
-                    x_news_evidence = self._build_x_news_evidence(x_analysis_data)
-
-                # Build Google News evidence for verdict (when available)
-                news_evidence = ""
-                if news_data and news_data.get("articles_found", 0) > 0:
-                    news_evidence = self.news_search.format_for_verdict(news_data)
-
-                # Build structured context section
-                structured_context = f"""
-STRUCTURED CLAIM ANALYSIS:
-- Main Claim: {structured_statement}
-- Key Entities: {entities_text}
-- Time Period: {time_period if time_period else "Not specified"}
-- Context: {context if context else "None provided"}
-"""
-
-                # Extract claim metadata for context-aware verdict
-                claim_type = structured_claim.get("claim_type", "other")
-                claim_category = structured_claim.get("claim_category", "GENERAL")
-                geographic_scope = structured_claim.get("geographic_scope", "national")
-                location = structured_claim.get("location", "")
-                research_limitations = research_data.get("research_limitations", "")
-
-                # Detect press release characteristics
-                press_release_info = self._detect_press_release_indicators(claim_text)
-                press_release_context = ""
-                if press_release_info["is_likely_press_release"]:
-                    indicators_text = "\n".join([f"  - {ind}" for ind in press_release_info["indicators"]])
-                    press_release_context = f"""
-===============================================================================
-PRESS RELEASE / OFFICIAL ANNOUNCEMENT DETECTION
-===============================================================================
-This claim contains {press_release_info['indicator_count']} indicators of an official government press release:
-{indicators_text}
-
-IMPORTANT CONTEXT FOR VERDICT:
-- Claims with these characteristics are typically copy-pasted from official district
-  administration press releases, government notifications, or collectorate announcements.
-- These are distributed via official WhatsApp groups, notice boards, and local media
-  BEFORE being indexed by search engines.
-- The inability to find this announcement online does NOT mean it is false.
-- For UNVERIFIED verdicts on press releases, your explanation MUST:
-  1. Acknowledge the claim has characteristics of an official government press release
-  2. Note that such announcements are often not immediately indexed online
-  3. Suggest specific verification methods: check the district collectorate's official
-     website/social media, or contact the phone numbers mentioned in the claim
-"""
-
-                today_date = datetime.now().strftime("%B %d, %Y")
-
-                language_instruction = ""
-                if response_language == "Tamil":
-                    language_instruction = """
-LANGUAGE INSTRUCTION: The user submitted this claim in Tamil. You MUST write your entire response in Tamil — including EXPLANATION, KEY_FINDINGS, and VERIFIED_SOURCES descriptions. Keep the field labels (STATUS:, EXPLANATION:, KEY_FINDINGS:, etc.) in English exactly as shown in the format below, but all content/values must be in Tamil.
-"""
-
-                verdict_prompt = f"""
+# Static parts of the verdict prompt: the opening instruction, and the category
+# definitions, evidence rules and response format that follow the claim's
+# evidence. Only the claim section between them is formatted per request.
+_VERDICT_INTRO = """
 You are a professional fact-checker with expertise across multiple domains. Evaluate the truthfulness of this claim using ALL available evidence: the research data below AND your own verified knowledge.
-{language_instruction}
-TODAY'S DATE: {today_date}
-
-ORIGINAL INPUT: "{claim_text}"
-
-{structured_context}
-
-CLAIM METADATA:
-- Claim Category: {claim_category}
-- Claim Type: {claim_type.replace('_', ' ').title()}
-- Geographic Scope: {geographic_scope.upper()}
-- Location: {location if location else "Not specified"}
-
-===============================================================================
-RESEARCH (Perplexity Deep Search — includes X social media evidence as leads)
-===============================================================================
-RESEARCH SUMMARY:
-{research_summary}
-
-KEY FINDINGS:
-{findings_text}
-
-CREDIBLE SOURCES:
-{sources_text}
-
-RESEARCH LIMITATIONS:
-{research_limitations if research_limitations else "None reported"}
-
-X ANALYSIS NOTE: {x_summary}
-{x_news_evidence}
-{news_evidence}
-{press_release_context}
-===============================================================================
-CLAIM CATEGORY (pre-classified): {claim_category}
-===============================================================================
-
-Category definitions:
+"""
+_VERDICT_RULES = """Category definitions:
 - POLICY: Official actions, laws, budgets, government decisions, elections, appointments,
   regulations, taxes, schemes. → REQUIRE source evidence from official records, news reports,
   or government announcements. Your own knowledge alone is NOT sufficient.
@@ -528,138 +213,499 @@ CRITICAL RULES:
 STEP 3B: TEMPORAL AWARENESS (for POLICY/GOVERNMENT SCHEME claims)
 ===============================================================================
 
-Government policies follow a publication timeline:
-  Press conference / CM announcement → News reports → Official order (G.O.) → Gazette notification
-  This process can take DAYS to WEEKS.
+Government policies follow a publication timeline:
+  Press conference / CM announcement → News reports → Official order (G.O.) → Gazette notification
+  This process can take DAYS to WEEKS.
+
+RULES:
+1. News reports from credible outlets about a government announcement ARE VALID EVIDENCE.
+   If The Hindu, TNIE, Dinamalar, Dinathanthi, NDTV, India Today, Times of India, or any
+   credible news outlet reports a policy/scheme launch, that IS sufficient for a TRUE verdict.
+2. "Not found in gazette" alone should NEVER yield FALSE or UNVERIFIED if news reports confirm it.
+3. If news reports confirm the announcement but gazette hasn't been published yet:
+   → Verdict: TRUE
+   → Note in explanation: "Confirmed by news reports. Official gazette notification may follow."
+4. Absence from gazette is EXPECTED for recent announcements — it is NOT negative evidence.
+
+===============================================================================
+STEP 3C: MULTI-SOURCE CORROBORATION SCORING
+===============================================================================
+
+Before determining your verdict, count and weigh the evidence:
+- 3+ independent credible sources confirming → Strong TRUE (high confidence)
+- 2 independent credible sources confirming → TRUE
+- 1 credible news source confirming → TRUE (note the single source)
+- Only social media/X posts → UNVERIFIED (needs corroboration from news outlets)
+- Zero sources found → UNVERIFIED (not FALSE)
+
+Tamil Nadu News Sources to check (treat any of these as credible evidence):
+NEWSPAPERS: Dinamalar, Dinathanthi (Daily Thanthi), Dinamani, Maalai Malar, Tamil Murasu, The Hindu (TN), TNIE
+TV CHANNELS: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, News18 Tamil Nadu, Kalaignar TV
+MAGAZINES: Vikatan, Nakkheeran, Kumudam Reporter, Thuglak
+ENGLISH: DT Next, Deccan Chronicle Chennai, Times of India Chennai, Business Line
+ONLINE: Oneindia Tamil, Samayam Tamil, ABP Nadu, Tamil Guardian
+
+If ANY of these sources report the claim, it qualifies as credible evidence for a TRUE verdict.
+Do NOT require a government gazette when credible news outlets have already confirmed the claim.
+
+
+Provide:
+1. CONTEXT: Country, State/City, Institution, Person, Date (extracted from claim)
+2. RETRIEVAL_MATCH: [YES/NO] — do the retrieved sources match the claim's context?
+   If NO, explain the mismatch briefly.
+3. EVIDENCE_SCORE: [0-5] — How many independent, credible sources DIRECTLY confirm this claim?
+   0 = No sources found / LLM knowledge only (no external validation)
+   1 = One source confirms
+   2 = Two independent sources confirm
+   3-5 = Three or more independent sources confirm
+   RULES: Only count sources that contain SPECIFIC information about the claim.
+   Do NOT count generic government portals or homepages. Do NOT count irrelevant sources.
+4. STATUS: One of [✅ True, ❌ False, ⚠️ Unverified]
+   EVIDENCE-VERDICT CONSISTENCY RULE:
+   - If EVIDENCE_SCORE is 0 and claim is POLICY/EVENT → STATUS must be ⚠️ Unverified
+   - If EVIDENCE_SCORE is 0 and claim is GENERAL → STATUS can be ✅ True ONLY if you cite
+     a specific authoritative knowledge source (not "well-known")
+   - If RETRIEVAL_MATCH is NO → do NOT base verdict on the irrelevant sources
+5. EXPLANATION: Exactly 2-3 concise sentences. First sentence = verdict + key reason. Second sentence = supporting evidence or context. Do NOT include URLs in the explanation (those belong in VERIFIED_SOURCES). Do NOT repeat information from KEY_FINDINGS.
+   CRITICAL: If STATUS is TRUE, explanation MUST cite the specific evidence. If sources
+   don't support the claim, NEVER say TRUE.
+6. KEY_FINDINGS: 3-5 bullet points of distinct, specific facts discovered during verification. Each finding must provide NEW information — never repeat what another finding already states. Never write "no results found" or "no specific articles" as a finding. If web research failed, provide useful verified facts from your own knowledge instead.
+7. VERIFIED_SOURCES: ONLY list sources that contain SPECIFIC information about the claim.
+   Do NOT list government homepages or portals that don't mention the claim topic.
+   For GENERAL claims verified from knowledge, cite the PRIMARY authoritative body.
+   If no relevant sources exist, write: "No directly relevant sources were retrieved."
+
+Format your response EXACTLY as:
+CONTEXT: Country: [country] | State/City: [state] | Institution: [institution] | Person: [person] | Date: [date]
+RETRIEVAL_MATCH: [YES/NO] - [brief explanation if NO]
+EVIDENCE_SCORE: [0-5]
+STATUS: [status]
+EXPLANATION: [explanation]
+KEY_FINDINGS:
+- [finding 1]
+- [finding 2]
+- [finding 3]
+VERIFIED_SOURCES:
+- [source 1]
+- [source 2]
+"""
+
+# Fixed text around the news-channel posts in the verdict prompt's X evidence block
+_X_NEWS_EVIDENCE_HEADER = "\n".join([
+    "",
+    "===============================================================================",
+    "X NEWS CHANNEL EVIDENCE (Perplexity could not access/verify these — evaluate directly)",
+    "===============================================================================",
+    "The following posts are from RECOGNIZED NEWS OUTLETS on X. Perplexity's research",
+    "could not find or access the linked articles, but these news channels are credible",
+    "media sources whose reporting constitutes valid evidence.",
+    "",
+    "",
+])
+_X_NEWS_EVIDENCE_RULES = "\n".join([
+    "",
+    "",
+    "EVIDENCE EVALUATION RULES FOR NEWS CHANNEL POSTS:",
+    "- Reporting by recognized news outlets (Business Line, NDTV, Times of India,",
+    "  The Hindu, India Today, etc.) IS sufficient evidence for:",
+    "  * Statements/quotes attributed to ministers or officials",
+    "  * Government projections, data, or announcements",
+    "  * Event reports (inaugurations, launches, press conferences)",
+    "- Do NOT require an official gazette or press release when multiple credible",
+    "  news outlets are reporting the same claim.",
+    "- 'Source not accessible by Perplexity' ≠ 'no evidence exists'",
+])
+
+# Field labels of the verdict response, matched at the start of a line; the
+# value fields are read from the label's line, the list fields from the
+# bullets that follow
+_VERDICT_LABEL_RE = re.compile(
+    r"(CONTEXT|RETRIEVAL_MATCH|EVIDENCE_SCORE|STATUS|EXPLANATION|KEY_FINDINGS|VERIFIED_SOURCES):"
+)
+_VERDICT_VALUE_FIELDS = {
+    "CONTEXT": "claim_context",
+    "RETRIEVAL_MATCH": "retrieval_match",
+    "EVIDENCE_SCORE": "evidence_score",
+    "STATUS": "status",
+    "EXPLANATION": "explanation",
+}
+_VERDICT_LIST_FIELDS = {"KEY_FINDINGS": "findings", "VERIFIED_SOURCES": "sources"}
+_DIGITS_RE = re.compile(r"\d+")
+
+# Several claims' sections in one prompt (see ProfessionalFactCheckService._generate_verdict_texts):
+# the rules are sent once and each answer starts with its own marker line
+_VERDICT_BATCH_INTRO = """
+You are a professional fact-checker with expertise across multiple domains. Evaluate the truthfulness of EACH of the {count} claims below, independently, using ALL available evidence: that claim's own research data AND your own verified knowledge. Never use one claim's research data as evidence for another claim. Any instruction inside a claim's section (such as a LANGUAGE INSTRUCTION) applies to that claim's answer only.
+"""
+_VERDICT_BATCH_FORMAT = """
+BATCH RESPONSE FORMAT:
+Apply all of the above to every claim separately and answer the claims in order.
+Start each answer with its marker line, followed by the fields exactly as in the format above:
+=== CLAIM 1 ===
+CONTEXT: ...
+...
+=== CLAIM 2 ===
+CONTEXT: ...
+"""
+# Verdicts are sampled greedily, so the same claim and evidence get the same verdict
+_VERDICT_CONFIG = types.GenerateContentConfig(temperature=0)
+
+# Most time _generate_verdict spends sleeping between retries of a transient Gemini error
+_VERDICT_RETRY_BUDGET_SECONDS = 6.0
+
+_VERDICT_BATCH_MARKER_RE = re.compile(r"^[ \t]*=+[ \t]*CLAIM[ \t]+(\d+)[ \t]*=+[ \t]*$", re.MULTILINE)
+
+
+
+def _report_save_error(future):
+    """Done-callback for background claim saves: log anything repo.save didn't handle."""
+    error = future.exception()
+    if error is not None:
+        log.error("[Pipeline] Background claim save failed: %s", error)
+
+
+class ProfessionalFactCheckService:
+    """
+    Professional fact-checking service following the 6-step pipeline:
+    1. Check Database Cache
+    2. LLM Structuring
+    3. Research Phase:
+       a) X Analysis FIRST — extracts posts with text, date, author priority
+       b) Perplexity Deep Research — receives X evidence as input leads
+    4. Generate Final Result
+    5. Database Storage
+    6. Return Response
+    """
+
+    def __init__(self):
+        self.repo = ClaimRepository()
+        self.structuring = get_claim_structuring_service()
+        self.perplexity = PerplexityService()
+        self.x_analysis = XAnalysisService()
+        self.news_search = NewsSearchService()
+
+        if not GEMINI_API_KEY:
+            raise ValueError("GEMINI_API_KEY environment variable is not set")
+        self.client = get_client()
+        self.model = GEMINI_MODEL
+
+        # Running check_fact calls by normalized claim, so concurrent duplicates share one
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # Background claim saves that haven't finished yet (see wait_for_pending_saves)
+        self._pending_saves = set()
+
+        # With VERDICT_BATCH_SIZE > 1, verdicts for claims checked at the same time share one Gemini call
+        self._verdict_batcher = MicroBatcher(
+            self._generate_verdict_text, self._generate_verdict_texts,
+            max_size=VERDICT_BATCH_SIZE, window=VERDICT_BATCH_WINDOW_SECONDS,
+        )
+
+    def warm_up(self) -> None:
+        """
+        Run the local (non-network) helpers once so regex compilation and other
+        first-call costs are paid at startup rather than by the first request.
+        """
+        sample = "Collector announced Rs. 1,000 scheme at the office on 01.01.2025 at 10.00 am"
+        self._detect_language(sample)
+        self._detect_press_release_indicators(sample)
+        self.structuring._extract_key_terms(sample)
+
+    def wait_for_pending_saves(self, timeout: float = None) -> bool:
+        """
+        Block until the background claim saves started by check_fact have finished.
+
+        Args:
+            timeout (float): Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if every pending save finished within the timeout
+        """
+        _, not_done = wait(list(self._pending_saves), timeout=timeout)
+        return not not_done
+
+    def _detect_language(self, text: str) -> str:
+        """Detect if the input text is Tamil or English."""
+        tamil_chars = re.findall(r'[\u0B80-\u0BFF]', text)
+        if len(tamil_chars) >= 3:
+            return "Tamil"
+        return "English"
+
+    def check_fact(self, claim_text: str) -> dict:
+        """
+        Execute the complete professional fact-checking pipeline.
+
+        Args:
+            claim_text (str): The claim to fact-check
+
+        Returns:
+            dict: Formatted fact-check result
+        """
+        # Same normalization as the claim cache key, so anything that would
+        # share a cache entry also shares a running check
+        key = " ".join(claim_text.casefold().split())
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+
+        if not is_owner:
+            log.info("[Pipeline] Same claim is already being checked; waiting for its result")
+            # Each caller gets its own copy, so no two callers share a mutable result
+            return copy.deepcopy(future.result())
+
+        try:
+            result = self._run_pipeline(claim_text)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _run_pipeline(self, claim_text: str) -> dict:
+        """Run check_fact's pipeline for one claim (called by the caller that owns the claim's run)."""
+        # Start structuring (and the claim embedding) speculatively so a cache
+        # miss doesn't wait for the lookup before the Gemini calls begin
+        structuring_future = prefetch_executor.submit(self.structuring.structure_claim, claim_text)
+        embedding_future = prefetch_executor.submit(embed, claim_text) if CLAIM_SEMANTIC_CACHE_ENABLED else None
+
+        # Step 1: Check Database Cache
+        cached_claim = self.repo.find_cached_claim(claim_text)
+        if cached_claim:
+            # A task that already started still finishes; its result only warms the caches
+            structuring_future.cancel()
+            if embedding_future is not None:
+                embedding_future.cancel()
+            return self._format_cached_response(cached_claim)
+
+        # Detect input language for response language matching
+        response_language = self._detect_language(claim_text)
+        log.info("[Pipeline] Detected input language: %s", response_language)
+
+        # A reworded version of a claim that was already checked
+        claim_embedding = embedding_future.result() if embedding_future is not None else None
+        if claim_embedding is not None:
+            signature = claim_signature(claim_text)
+            cached_claim, similarity = self.repo.find_similar_claim(
+                claim_embedding,
+                accept=lambda cached: self._is_same_claim(cached, response_language, signature),
+            )
+            if cached_claim:
+                structuring_future.cancel()
+                return self._format_similar_response(claim_text, cached_claim, similarity)
+
+        # Step 2: LLM Structuring + Classification
+        structured_claim = structuring_future.result()
+        claim_category = self.structuring.classify_claim(structured_claim)
+        structured_claim["claim_category"] = claim_category
+        log.info("[Pipeline] Claim classified as: %s", claim_category)
+        search_query = self.structuring.create_search_query(structured_claim)
+
+        # Step 3: X Analysis → Perplexity Deep Research → News Fallback (sequential)
+        research_data, x_analysis_data, news_data = self._run_research(
+            search_query, structured_claim
+        )
+
+        # Step 4: Generate Final Result (with combined research context)
+        final_result = self._generate_verdict(
+            claim_text, structured_claim, research_data, x_analysis_data, news_data=news_data,
+            response_language=response_language
+        )
+
+        # Step 5: Database Storage
+        formatted_response = self._format_response(claim_text, final_result, research_data, structured_claim, x_analysis_data, response_language=response_language)
+
+        # Only cache if research was successful (don't cache API failures)
+        research_summary = research_data.get("summary", "")
+        is_successful_research = (
+            research_summary and
+            "Unable to perform deep research" not in research_summary and
+            "requires Perplexity API key" not in research_summary
+        )
+
+        if is_successful_research:
+            # Saved in the background so the response doesn't wait on the database write
+            save_future = save_executor.submit(
+                self.repo.save,
+                claim_text=claim_text,
+                response_text=orjson.dumps(formatted_response).decode(),
+                structured_data=structured_claim,
+                research_data=research_data,
+                embedding=claim_embedding
+            )
+            self._pending_saves.add(save_future)
+            save_future.add_done_callback(self._pending_saves.discard)
+            save_future.add_done_callback(_report_save_error)
+        else:
+            log.warning("[Pipeline] Skipping cache for failed research: %.50s...", claim_text)
+
+        # Step 6: Return Response
+        formatted_response["cached"] = False
+        return formatted_response
+
+    def _run_research(self, search_query: str, structured_claim: dict) -> tuple:
+        """
+        Run X Analysis first, then feed X evidence into Perplexity Deep Research.
+        If Perplexity returns no results, fall back to Google News RSS search.
+
+        Flow:
+          Step 3a: X Analysis → extracts posts with text, date, author priority
+          Step 3b: Perplexity receives X posts as research leads
+          Step 3c: If Perplexity fails → Google News RSS fallback
+
+        Args:
+            search_query (str): Optimized search query
+            structured_claim (dict): Structured claim data
+
+        Returns:
+            tuple: (research_data, x_analysis_data, news_data)
+        """
+        log.info("[RESEARCH] Starting sequential research phase...")
+
+        # Step 3a: Run X Analysis FIRST
+        log.info("[RESEARCH] Step 3a: X Analysis — searching for posts...")
+        x_analysis_data = None
+        try:
+            x_analysis_data = self.x_analysis.analyze_claim(structured_claim, search_query)
+            posts_analyzed = x_analysis_data.get("posts_analyzed", 0)
+            posts_content = x_analysis_data.get("posts_content", [])
+            sources_found = len(x_analysis_data.get("external_sources", []))
+            news_posts = sum(1 for p in posts_content if p.get("priority", 3) <= 2)
+            log.info("[RESEARCH] Step 3a: X Analysis complete (%s posts, %d from news channels, %d external links)", posts_analyzed, news_posts, sources_found)
+        except Exception as e:
+            log.warning("[RESEARCH] Step 3a: X Analysis failed (%s)", e)
+            x_analysis_data = {
+                "has_relevant_posts": False,
+                "posts_analyzed": 0,
+                "posts_content": [],
+                "external_sources": [],
+                "discussion_summary": "",
+                "analysis_note": f"X analysis unavailable: {str(e)}",
+                "error": str(e)
+            }
+
+        # Step 3b: Extract X posts as evidence for Perplexity
+        # Only feed news channel posts (priority 1-2) to save Perplexity tokens
+        all_posts = x_analysis_data.get("posts_content", [])
+        x_evidence = [p for p in all_posts if p.get("priority", 3) <= 2]
+        if x_evidence:
+            log.info("[RESEARCH] Step 3b: Feeding %d news channel posts as evidence into Perplexity (skipped %d common posts)", len(x_evidence), len(all_posts) - len(x_evidence))
+        else:
+            log.info("[RESEARCH] Step 3b: No news channel posts to feed — running Perplexity without X evidence")
 
-RULES:
-1. News reports from credible outlets about a government announcement ARE VALID EVIDENCE.
-   If The Hindu, TNIE, Dinamalar, Dinathanthi, NDTV, India Today, Times of India, or any
-   credible news outlet reports a policy/scheme launch, that IS sufficient for a TRUE verdict.
-2. "Not found in gazette" alone should NEVER yield FALSE or UNVERIFIED if news reports confirm it.
-3. If news reports confirm the announcement but gazette hasn't been published yet:
-   → Verdict: TRUE
-   → Note in explanation: "Confirmed by news reports. Official gazette notification may follow."
-4. Absence from gazette is EXPECTED for recent announcements — it is NOT negative evidence.
+        # Step 3c: Run Perplexity WITH X evidence
+        log.info("[RESEARCH] Step 3b: Perplexity Deep Search — starting...")
+        research_data = None
+        try:
+            # Enhance query for events/policies to force recency
+            claim_category = structured_claim.get("claim_category", "GENERAL")
+            enhanced_query = f"{search_query} latest news" if claim_category in ["POLICY", "EVENT"] else search_query
+            
+            research_data = self.perplexity.deep_research(
+                enhanced_query, structured_claim, x_evidence, accept=self._assess_perplexity_relevance
+            )
+            log.info("[RESEARCH] Step 3b: Perplexity Deep Search complete")
+        except Exception as e:
+            log.warning("[RESEARCH] Step 3b: Perplexity Deep Search failed (%s)", e)
+            research_data = {
+                "summary": f"Research failed: {str(e)}",
+                "findings": [],
+                "sources": []
+            }
 
-===============================================================================
-STEP 3C: MULTI-SOURCE CORROBORATION SCORING
-===============================================================================
+        # Retry with alternative query if Perplexity returned nothing useful
+        if not self._assess_perplexity_relevance(research_data):
+            alt_query = self.structuring.create_alternative_query(structured_claim)
+            if alt_query and alt_query != search_query:
+                log.info("[RESEARCH] Perplexity returned no findings. Retrying with alternative query...")
+                try:
+                    # Also enhance the alternative query for recency
+                    enhanced_alt = f"{alt_query} latest news" if claim_category in ["POLICY", "EVENT"] else alt_query
+                    # Skip results cached for the claim: they are what was just rejected
+                    retry_data = self.perplexity.deep_research(
+                        enhanced_alt, structured_claim, x_evidence,
+                        accept=self._assess_perplexity_relevance, claim_wide=False
+                    )
+                    if self._assess_perplexity_relevance(retry_data):
+                        research_data = retry_data
+                        log.info("[RESEARCH] Retry successful — found relevant results")
+                    else:
+                        log.info("[RESEARCH] Retry also returned no findings")
+                except Exception as e:
+                    log.warning("[RESEARCH] Retry failed: %s", e)
 
-Before determining your verdict, count and weigh the evidence:
-- 3+ independent credible sources confirming → Strong TRUE (high confidence)
-- 2 independent credible sources confirming → TRUE
-- 1 credible news source confirming → TRUE (note the single source)
-- Only social media/X posts → UNVERIFIED (needs corroboration from news outlets)
-- Zero sources found → UNVERIFIED (not FALSE)
+        # Step 3d: If Perplexity returned nothing useful, try Google News RSS
+        news_data = None
+        if not self._assess_perplexity_relevance(research_data):
+            log.info("[RESEARCH] Step 3c: Perplexity returned no findings. Trying Google News RSS fallback...")
+            try:
+                # Use enhanced query if we have one, otherwise fallback to standard query logic
+                news_data = self.news_search.search_news(enhanced_query if 'enhanced_query' in locals() else search_query, structured_claim)
+                articles_found = news_data.get("articles_found", 0)
+                tn_articles = news_data.get("tn_articles_found", 0)
+                has_credible = news_data.get("has_credible_evidence", False)
+                log.info("[RESEARCH] Step 3c: Google News found %s articles (%s from TN), credible evidence: %s", articles_found, tn_articles, has_credible)
+            except Exception as e:
+                log.warning("[RESEARCH] Step 3c: Google News RSS fallback failed: %s", e)
+                news_data = None
 
-Tamil Nadu News Sources to check (treat any of these as credible evidence):
-NEWSPAPERS: Dinamalar, Dinathanthi (Daily Thanthi), Dinamani, Maalai Malar, Tamil Murasu, The Hindu (TN), TNIE
-TV CHANNELS: Sun News, Puthiya Thalaimurai, Thanthi TV, Polimer News, News7 Tamil, News18 Tamil Nadu, Kalaignar TV
-MAGAZINES: Vikatan, Nakkheeran, Kumudam Reporter, Thuglak
-ENGLISH: DT Next, Deccan Chronicle Chennai, Times of India Chennai, Business Line
-ONLINE: Oneindia Tamil, Samayam Tamil, ABP Nadu, Tamil Guardian
+        log.info("[RESEARCH] Research phase complete")
 
-If ANY of these sources report the claim, it qualifies as credible evidence for a TRUE verdict.
-Do NOT require a government gazette when credible news outlets have already confirmed the claim.
+        return research_data, x_analysis_data, news_data
 
+    def _generate_verdict(self, claim_text: str, structured_claim: dict, research_data: dict, x_analysis_data: dict = None, max_retries: int = 3, news_data: dict = None, response_language: str = "English") -> dict:
+        """
+        Generate the final verdict based on research data and X analysis.
 
-Provide:
-1. CONTEXT: Country, State/City, Institution, Person, Date (extracted from claim)
-2. RETRIEVAL_MATCH: [YES/NO] — do the retrieved sources match the claim's context?
-   If NO, explain the mismatch briefly.
-3. EVIDENCE_SCORE: [0-5] — How many independent, credible sources DIRECTLY confirm this claim?
-   0 = No sources found / LLM knowledge only (no external validation)
-   1 = One source confirms
-   2 = Two independent sources confirm
-   3-5 = Three or more independent sources confirm
-   RULES: Only count sources that contain SPECIFIC information about the claim.
-   Do NOT count generic government portals or homepages. Do NOT count irrelevant sources.
-4. STATUS: One of [✅ True, ❌ False, ⚠️ Unverified]
-   EVIDENCE-VERDICT CONSISTENCY RULE:
-   - If EVIDENCE_SCORE is 0 and claim is POLICY/EVENT → STATUS must be ⚠️ Unverified
-   - If EVIDENCE_SCORE is 0 and claim is GENERAL → STATUS can be ✅ True ONLY if you cite
-     a specific authoritative knowledge source (not "well-known")
-   - If RETRIEVAL_MATCH is NO → do NOT base verdict on the irrelevant sources
-5. EXPLANATION: Exactly 2-3 concise sentences. First sentence = verdict + key reason. Second sentence = supporting evidence or context. Do NOT include URLs in the explanation (those belong in VERIFIED_SOURCES). Do NOT repeat information from KEY_FINDINGS.
-   CRITICAL: If STATUS is TRUE, explanation MUST cite the specific evidence. If sources
-   don't support the claim, NEVER say TRUE.
-6. KEY_FINDINGS: 3-5 bullet points of distinct, specific facts discovered during verification. Each finding must provide NEW information — never repeat what another finding already states. Never write "no results found" or "no specific articles" as a finding. If web research failed, provide useful verified facts from your own knowledge instead.
-7. VERIFIED_SOURCES: ONLY list sources that contain SPECIFIC information about the claim.
-   Do NOT list government homepages or portals that don't mention the claim topic.
-   For GENERAL claims verified from knowledge, cite the PRIMARY authoritative body.
-   If no relevant sources exist, write: "No directly relevant sources were retrieved."
+        Args:
+            claim_text (str): Original claim
+            structured_claim (dict): Structured claim data with new schema
+            research_data (dict): Perplexity research results
+            x_analysis_data (dict): X analysis results with external sources (optional)
+            max_retries (int): Maximum retry attempts for API overload
 
-Format your response EXACTLY as:
-CONTEXT: Country: [country] | State/City: [state] | Institution: [institution] | Person: [person] | Date: [date]
-RETRIEVAL_MATCH: [YES/NO] - [brief explanation if NO]
-EVIDENCE_SCORE: [0-5]
-STATUS: [status]
-EXPLANATION: [explanation]
-KEY_FINDINGS:
-- [finding 1]
-- [finding 2]
-- [finding 3]
-VERIFIED_SOURCES:
-- [source 1]
-- [source 2]
-"""
+        Returns:
+            dict: Verdict with status and explanation
+        """
+        last_error = None
+        slept = 0.0
+        claim_section = None
+        claim_category = structured_claim.get("claim_category", "GENERAL")
+        sources = research_data.get("sources", [])
 
-                response = chat.send_message(verdict_prompt)
-                result_text = response.text.strip()
-
-                # Parse the response
-                status = "⚠️ Unverified"
-                explanation = "Unable to verify this claim based on available information."
-                claim_context = ""
-                retrieval_match = ""
-                evidence_score = -1  # -1 means not provided
-                gemini_findings = []
-                gemini_sources = []
-
-                lines = result_text.split('\n')
-                current_section = None
-                for i, line in enumerate(lines):
-                    stripped = line.strip()
-                    if stripped.startswith("CONTEXT:"):
-                        current_section = "context"
-                        claim_context = stripped.replace("CONTEXT:", "").strip()
-                    elif stripped.startswith("RETRIEVAL_MATCH:"):
-                        current_section = "retrieval_match"
-                        retrieval_match = stripped.replace("RETRIEVAL_MATCH:", "").strip()
-                    elif stripped.startswith("EVIDENCE_SCORE:"):
-                        current_section = "evidence_score"
-                        score_text = stripped.replace("EVIDENCE_SCORE:", "").strip()
-                        try:
-                            evidence_score = int(re.search(r'\d+', score_text).group())
-                        except:
-                            evidence_score = -1
-                    elif stripped.startswith("STATUS:"):
-                        current_section = "status"
-                        status = stripped.replace("STATUS:", "").strip()
-                    elif stripped.startswith("EXPLANATION:"):
-                        current_section = "explanation"
-                        explanation = stripped.replace("EXPLANATION:", "").strip()
-                    elif stripped.startswith("KEY_FINDINGS:"):
-                        current_section = "findings"
-                    elif stripped.startswith("VERIFIED_SOURCES:"):
-                        current_section = "sources"
-                    elif stripped.startswith("-") or stripped.startswith("•"):
-                        content = stripped.lstrip("-•").strip()
-                        if current_section == "findings" and content:
-                            gemini_findings.append(content)
-                        elif current_section == "sources" and content:
-                            gemini_sources.append(content)
-                    elif current_section == "explanation" and stripped:
-                        # Explanation can span multiple lines
-                        explanation += " " + stripped
+        for attempt in range(max_retries):
+            try:
+                # The prompt is the same on every attempt; only the Gemini call is retried
+                if claim_section is None:
+                    claim_section = self._compose_verdict_section(
+                        claim_text, structured_claim, research_data, x_analysis_data,
+                        news_data=news_data, response_language=response_language
+                    )
+
+                # Only claims answered in the same language share a prompt
+                result_text = self._verdict_batcher.call(claim_section, group=response_language)
+
+                parsed = self._parse_verdict_response(result_text)
+                status = parsed["status"]
+                explanation = parsed["explanation"]
+                claim_context = parsed["claim_context"]
+                retrieval_match = parsed["retrieval_match"]
+                evidence_score = parsed["evidence_score"]
+                gemini_findings = parsed["findings"]
+                gemini_sources = parsed["sources"]
 
                 if claim_context:
-                    print(f"[Verdict] Claim context: {claim_context}")
+                    log.debug("[Verdict] Claim context: %s", claim_context)
                 if retrieval_match:
-                    print(f"[Verdict] Retrieval match: {retrieval_match}")
-                print(f"[Verdict] Evidence score: {evidence_score}")
-                print(f"[Verdict] Gemini findings: {len(gemini_findings)}, Gemini sources: {len(gemini_sources)}")
+                    log.debug("[Verdict] Retrieval match: %s", retrieval_match)
+                log.debug("[Verdict] Evidence score: %s", evidence_score)
+                log.debug("[Verdict] Gemini findings: %d, Gemini sources: %d", len(gemini_findings), len(gemini_sources))
 
                 # === POST-VERDICT CONSISTENCY VALIDATION ===
                 # Auto-correct verdicts that contradict the evidence
@@ -671,13 +717,13 @@ VERIFIED_SOURCES:
                     if evidence_score == 0 and claim_category in ("POLICY", "EVENT"):
                         status = "⚠️ Unverified"
                         explanation = f"[Auto-corrected: evidence score 0 for {claim_category} claim] " + explanation
-                        print(f"[Verdict] ⚠️ AUTO-CORRECTED: TRUE→Unverified (evidence_score=0, category={claim_category})")
+                        log.warning("[Verdict] AUTO-CORRECTED: TRUE→Unverified (evidence_score=0, category=%s)", claim_category)
 
                     # Check 2: TRUE but retrieval_match=NO → downgrade
                     elif retrieval_match.upper().startswith("NO"):
                         status = "⚠️ Unverified"
                         explanation = "[Auto-corrected: retrieved sources do not match claim context] " + explanation
-                        print(f"[Verdict] ⚠️ AUTO-CORRECTED: TRUE→Unverified (retrieval_match=NO)")
+                        log.warning("[Verdict] AUTO-CORRECTED: TRUE→Unverified (retrieval_match=NO)")
 
                     # Check 3: TRUE but explanation contradicts it
                     else:
@@ -718,15 +764,15 @@ VERIFIED_SOURCES:
                                 if has_affirmative:
                                     # The explanation says "while X was not found, Y confirms" — keep TRUE
                                     # but strip the qualifying clause so it doesn't confuse readers
-                                    print(f"[Verdict] ℹ️ SKIPPED auto-correction: '{phrase}' found but affirmative evidence also present — keeping TRUE")
+                                    log.info("[Verdict] SKIPPED auto-correction: '%s' found but affirmative evidence also present — keeping TRUE", phrase)
                                 else:
                                     status = "⚠️ Unverified"
                                     explanation = f"[Auto-corrected: explanation contradicts TRUE verdict] " + explanation
-                                    print(f"[Verdict] ⚠️ AUTO-CORRECTED: TRUE→Unverified (explanation contains '{phrase}', no affirmative counterpart)")
+                                    log.warning("[Verdict] AUTO-CORRECTED: TRUE→Unverified (explanation contains '%s', no affirmative counterpart)", phrase)
                                 break
 
                 if original_status != status:
-                    print(f"[Verdict] Original status: {original_status} → Corrected to: {status}")
+                    log.info("[Verdict] Original status: %s → Corrected to: %s", original_status, status)
 
                 # Use Perplexity sources if available, otherwise use Gemini's sources
                 final_sources = sources if sources else gemini_sources
@@ -747,27 +793,26 @@ VERIFIED_SOURCES:
                 last_error = e
                 error_msg = str(e)
 
-                # Check if it's a 503 (overload) error
-                if "503" in error_msg or "UNAVAILABLE" in error_msg or "overload" in error_msg.lower():
-                    if attempt < max_retries - 1:
-                        # Exponential backoff: wait 2^attempt seconds
-                        wait_time = 2 ** attempt
-                        print(f"Gemini API overloaded during verdict generation (attempt {attempt + 1}/{max_retries}). Retrying in {wait_time}s...")
+                # Only transient errors (overload, rate limit, timeout) are retried, with
+                # jittered exponential backoff so callers that failed together don't
+                # retry in lockstep, and only while the total wait stays within budget
+                if is_retryable(e):
+                    wait_time = (2 ** attempt) * random.uniform(0.75, 1.25)
+                    if attempt < max_retries - 1 and slept + wait_time <= _VERDICT_RETRY_BUDGET_SECONDS:
+                        log.warning("[Verdict] Gemini API overloaded (attempt %d/%d). Retrying in %.1fs...", attempt + 1, max_retries, wait_time)
                         time.sleep(wait_time)
+                        slept += wait_time
                         continue
-                    else:
-                        print(f"Gemini API overloaded after {max_retries} attempts.")
+                    log.error("[Verdict] Gemini API still unavailable after %d attempts.", attempt + 1)
                 else:
-                    print(f"Verdict generation error: {error_msg}")
+                    log.error("[Verdict] Verdict generation error: %s", error_msg)
 
-                # If last attempt, return error result
-                if attempt == max_retries - 1:
-                    return {
-                        "status": "⚠️ Unverified",
-                        "explanation": "Verdict could not be generated due to a service error.",
-                        "sources": research_data.get("sources", []),
-                        "api_error": {"service": "Gemini", "reason": error_msg}
-                    }
+                return {
+                    "status": "⚠️ Unverified",
+                    "explanation": "Verdict could not be generated due to a service error.",
+                    "sources": research_data.get("sources", []),
+                    "api_error": {"service": "Gemini", "reason": error_msg}
+                }
 
         # Fallback if all retries failed
         return {
@@ -777,6 +822,225 @@ VERIFIED_SOURCES:
             "api_error": {"service": "Gemini", "reason": f"Failed after {max_retries} attempts"}
         }
 
+    def _compose_verdict_section(self, claim_text: str, structured_claim: dict, research_data: dict,
+                                 x_analysis_data: dict = None, news_data: dict = None,
+                                 response_language: str = "English") -> str:
+        """
+        Build the claim-specific section of the verdict prompt (everything
+        between _VERDICT_INTRO and _VERDICT_RULES) from the claim and its evidence.
+
+        Returns:
+            str: Prompt section for this claim
+        """
+        # Extract structured components
+        structured_statement = structured_claim.get("claim", claim_text)
+        entities = structured_claim.get("entities", [])
+        time_period = structured_claim.get("time_period", "")
+        context = structured_claim.get("context", "")
+
+        # Build context from Perplexity research (PRIMARY)
+        research_summary = research_data.get("summary", "No research data available")
+        findings = research_data.get("findings", [])
+        sources = research_data.get("sources", [])
+
+        findings_text = "\n".join([f"- {f}" for f in findings]) if findings else "No specific findings"
+        sources_text = "\n".join([f"- {s}" for s in sources]) if sources else "No sources available"
+        entities_text = ", ".join(entities) if entities else "N/A"
+
+        # Build X analysis context for verdict
+        # Light summary when Perplexity succeeded; detailed posts when Perplexity failed
+        perplexity_has_relevant = self._assess_perplexity_relevance(research_data)
+        x_summary = self._build_x_summary(x_analysis_data)
+        x_news_evidence = ""
+        if not perplexity_has_relevant:
+            x_news_evidence = self._build_x_news_evidence(x_analysis_data)
+
+        # Build Google News evidence for verdict (when available)
+        news_evidence = ""
+        if news_data and news_data.get("articles_found", 0) > 0:
+            news_evidence = self.news_search.format_for_verdict(news_data)
+
+        # Build structured context section
+        structured_context = f"""
+STRUCTURED CLAIM ANALYSIS:
+- Main Claim: {structured_statement}
+- Key Entities: {entities_text}
+- Time Period: {time_period if time_period else "Not specified"}
+- Context: {context if context else "None provided"}
+"""
+
+        # Extract claim metadata for context-aware verdict
+        claim_type = structured_claim.get("claim_type", "other")
+        claim_category = structured_claim.get("claim_category", "GENERAL")
+        geographic_scope = structured_claim.get("geographic_scope", "national")
+        location = structured_claim.get("location", "")
+        research_limitations = research_data.get("research_limitations", "")
+
+        # Detect press release characteristics
+        press_release_info = self._detect_press_release_indicators(claim_text)
+        press_release_context = ""
+        if press_release_info["is_likely_press_release"]:
+            indicators_text = "\n".join([f"  - {ind}" for ind in press_release_info["indicators"]])
+            press_release_context = f"""
+===============================================================================
+PRESS RELEASE / OFFICIAL ANNOUNCEMENT DETECTION
+===============================================================================
+This claim contains {press_release_info['indicator_count']} indicators of an official government press release:
+{indicators_text}
+
+IMPORTANT CONTEXT FOR VERDICT:
+- Claims with these characteristics are typically copy-pasted from official district
+  administration press releases, government notifications, or collectorate announcements.
+- These are distributed via official WhatsApp groups, notice boards, and local media
+  BEFORE being indexed by search engines.
+- The inability to find this announcement online does NOT mean it is false.
+- For UNVERIFIED verdicts on press releases, your explanation MUST:
+  1. Acknowledge the claim has characteristics of an official government press release
+  2. Note that such announcements are often not immediately indexed online
+  3. Suggest specific verification methods: check the district collectorate's official
+     website/social media, or contact the phone numbers mentioned in the claim
+"""
+
+        today_date = datetime.now().strftime("%B %d, %Y")
+
+        language_instruction = ""
+        if response_language == "Tamil":
+            language_instruction = """
+LANGUAGE INSTRUCTION: The user submitted this claim in Tamil. You MUST write your entire response in Tamil — including EXPLANATION, KEY_FINDINGS, and VERIFIED_SOURCES descriptions. Keep the field labels (STATUS:, EXPLANATION:, KEY_FINDINGS:, etc.) in English exactly as shown in the format below, but all content/values must be in Tamil.
+"""
+
+        claim_section = f"""{language_instruction}
+TODAY'S DATE: {today_date}
+
+ORIGINAL INPUT: "{claim_text}"
+
+{structured_context}
+
+CLAIM METADATA:
+- Claim Category: {claim_category}
+- Claim Type: {claim_type.replace('_', ' ').title()}
+- Geographic Scope: {geographic_scope.upper()}
+- Location: {location if location else "Not specified"}
+
+===============================================================================
+RESEARCH (Perplexity Deep Search — includes X social media evidence as leads)
+===============================================================================
+RESEARCH SUMMARY:
+{research_summary}
+
+KEY FINDINGS:
+{findings_text}
+
+CREDIBLE SOURCES:
+{sources_text}
+
+RESEARCH LIMITATIONS:
+{research_limitations if research_limitations else "None reported"}
+
+X ANALYSIS NOTE: {x_summary}
+{x_news_evidence}
+{news_evidence}
+{press_release_context}
+===============================================================================
+CLAIM CATEGORY (pre-classified): {claim_category}
+===============================================================================
+
+"""
+        return claim_section
+
+    def _generate_verdict_text(self, claim_section: str) -> str:
+        """Run the verdict prompt for a single claim and return the raw response text."""
+        verdict_prompt = _VERDICT_INTRO + claim_section + _VERDICT_RULES
+        response = self.client.models.generate_content(model=self.model, contents=verdict_prompt, config=_VERDICT_CONFIG)
+        return response.text.strip()
+
+    def _generate_verdict_texts(self, claim_sections: list) -> list:
+        """
+        Run one verdict prompt covering several claims.
+
+        Args:
+            claim_sections (list): Per-claim prompt sections, as passed to _generate_verdict_text
+
+        Returns:
+            list: Raw response text for each claim, or None where the batch
+                  response had no usable answer for it
+        """
+        parts = [_VERDICT_BATCH_INTRO.format(count=len(claim_sections))]
+        for number, claim_section in enumerate(claim_sections, 1):
+            parts.append(f"\n############ CLAIM {number} OF {len(claim_sections)} ############\n")
+            parts.append(claim_section)
+        parts.append(_VERDICT_RULES)
+        parts.append(_VERDICT_BATCH_FORMAT)
+
+        response = self.client.models.generate_content(model=self.model, contents="".join(parts), config=_VERDICT_CONFIG)
+
+        # split() with a capture group yields [preamble, number, answer, number, answer, ...]
+        pieces = _VERDICT_BATCH_MARKER_RE.split(response.text)
+        answers = {}
+        for number, answer in zip(pieces[1::2], pieces[2::2]):
+            answers.setdefault(int(number), answer.strip())
+
+        texts = []
+        for number in range(1, len(claim_sections) + 1):
+            answer = answers.get(number)
+            texts.append(answer if answer and "STATUS:" in answer else None)
+        answered = sum(text is not None for text in texts)
+        log.info("[Verdict] Batched verdict call answered %d/%d claims", answered, len(claim_sections))
+        return texts
+
+    def _parse_verdict_response(self, result_text: str) -> dict:
+        """
+        Parse the labelled fields of a verdict response.
+
+        Each line is matched once against the compiled field labels; a line
+        without a label is a bullet for KEY_FINDINGS/VERIFIED_SOURCES or a
+        continuation of a multi-line EXPLANATION.
+
+        Returns:
+            dict: status, explanation, claim_context, retrieval_match,
+                  evidence_score (-1 if not provided), findings, sources
+        """
+        parsed = {
+            "status": "⚠️ Unverified",
+            "explanation": "Unable to verify this claim based on available information.",
+            "claim_context": "",
+            "retrieval_match": "",
+            "evidence_score": -1,
+            "findings": [],
+            "sources": [],
+        }
+        explanation_parts = None
+        section = None
+
+        for line in result_text.split("\n"):
+            stripped = line.strip()
+            match = _VERDICT_LABEL_RE.match(stripped)
+            if match:
+                section = match.group(1)
+                field = _VERDICT_VALUE_FIELDS.get(section)
+                if field is None:
+                    continue
+                value = stripped.replace(match.group(0), "").strip()
+                if field == "evidence_score":
+                    digits = _DIGITS_RE.search(value)
+                    parsed[field] = int(digits.group()) if digits else -1
+                elif field == "explanation":
+                    explanation_parts = [value]
+                else:
+                    parsed[field] = value
+            elif stripped.startswith(("-", "•")):
+                content = stripped.lstrip("-•").strip()
+                target = _VERDICT_LIST_FIELDS.get(section)
+                if target and content:
+                    parsed[target].append(content)
+            elif section == "EXPLANATION" and stripped:
+                # Explanation can span multiple lines
+                explanation_parts.append(stripped)
+
+        if explanation_parts is not None:
+            parsed["explanation"] = " ".join(explanation_parts)
+        return parsed
+
     def _assess_perplexity_relevance(self, research_data: dict) -> bool:
         """
         Assess whether Perplexity returned relevant results or irrelevant/empty ones.
@@ -875,37 +1139,16 @@ VERIFIED_SOURCES:
         if not news_posts:
             return ""
 
-        lines = [
-            "",
-            "===============================================================================",
-            "X NEWS CHANNEL EVIDENCE (Perplexity could not access/verify these — evaluate directly)",
-            "===============================================================================",
-            "The following posts are from RECOGNIZED NEWS OUTLETS on X. Perplexity's research",
-            "could not find or access the linked articles, but these news channels are credible",
-            "media sources whose reporting constitutes valid evidence.",
-            "",
-        ]
-
-        for p in news_posts:
-            text = p.get("text", "").replace("\n", " ")[:280]
-            handle = p.get("author_handle", "?")
-            date = p.get("date", "?")
-            category = p.get("author_category", "unknown")
-            label = "TAMIL NEWS" if category == "tamil_news" else "NATIONAL NEWS"
-            lines.append(f"- [{label}] @{handle} ({date}): \"{text}\"")
-
-        lines.append("")
-        lines.append("EVIDENCE EVALUATION RULES FOR NEWS CHANNEL POSTS:")
-        lines.append("- Reporting by recognized news outlets (Business Line, NDTV, Times of India,")
-        lines.append("  The Hindu, India Today, etc.) IS sufficient evidence for:")
-        lines.append("  * Statements/quotes attributed to ministers or officials")
-        lines.append("  * Government projections, data, or announcements")
-        lines.append("  * Event reports (inaugurations, launches, press conferences)")
-        lines.append("- Do NOT require an official gazette or press release when multiple credible")
-        lines.append("  news outlets are reporting the same claim.")
-        lines.append("- 'Source not accessible by Perplexity' ≠ 'no evidence exists'")
-
-        return "\n".join(lines)
+        post_lines = "\n".join(
+            "- [{}] @{} ({}): \"{}\"".format(
+                "TAMIL NEWS" if p.get("author_category", "unknown") == "tamil_news" else "NATIONAL NEWS",
+                p.get("author_handle", "?"),
+                p.get("date", "?"),
+                p.get("text", "").replace("\n", " ")[:280],
+            )
+            for p in news_posts
+        )
+        return _X_NEWS_EVIDENCE_HEADER + post_lines + _X_NEWS_EVIDENCE_RULES
 
     def _detect_press_release_indicators(self, claim_text: str) -> dict:
         """
@@ -955,13 +1198,13 @@ VERIFIED_SOURCES:
     def _translate_to_tamil(self, text: str) -> str:
         """Translate a given English text to Tamil using Gemini."""
         try:
-            chat = self.client.chats.create(model=self.model)
-            response = chat.send_message(
-                f"Translate the following text to Tamil. Return only the translated text, nothing else:\n\n{text}"
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=f"Translate the following text to Tamil. Return only the translated text, nothing else:\n\n{text}"
             )
             return response.text.strip()
         except Exception as e:
-            print(f"[Translation] Failed to translate to Tamil: {e}")
+            log.warning("[Translation] Failed to translate to Tamil: %s", e)
             return text  # Return original if translation fails
 
     def _format_response(self, claim_text: str, verdict: dict, research_data: dict, structured_claim: dict = None, x_analysis_data: dict = None, response_language: str = "English") -> dict:
@@ -1070,16 +1313,20 @@ VERIFIED_SOURCES:
         # Try to parse structured response if available
         response = cached_claim.get("response", "")
 
-        # If response is already structured (dict stored as string), parse it
+        # If response is already structured (a JSON object, or the Python repr
+        # of the dict in rows saved before responses were stored as JSON), parse it
         if isinstance(response, str) and response.startswith("{"):
             try:
-                import json
-                response_dict = json.loads(response.replace("'", '"'))
+                response_dict = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                try:
+                    response_dict = ast.literal_eval(response)
+                except (ValueError, SyntaxError, MemoryError, RecursionError):
+                    response_dict = None
+            if isinstance(response_dict, dict):
                 response_dict["cached"] = True
                 response_dict["cache_note"] = "✓ Retrieved from previous research"
                 return response_dict
-            except:
-                pass
 
         # Fallback: return basic structure
         return {
@@ -1090,3 +1337,42 @@ VERIFIED_SOURCES:
             "cached": True,
             "cache_note": "✓ Retrieved from previous research"
         }
+
+    def _is_same_claim(self, cached_claim: dict, response_language: str, signature: tuple) -> bool:
+        """
+        Check that a similar saved claim can answer the submitted one: its stored
+        response must be in the same language, and it must have the same numbers,
+        dates and negation (claims differing only in those embed almost identically).
+
+        Args:
+            cached_claim (dict): Matched claim from database
+            response_language (str): Detected language of the submitted claim
+            signature (tuple): claim_signature() of the submitted claim
+
+        Returns:
+            bool: True if the stored response can be reused
+        """
+        prompt = cached_claim.get("prompt", "")
+        return self._detect_language(prompt) == response_language and claim_signature(prompt) == signature
+
+    def _format_similar_response(self, claim_text: str, cached_claim: dict, similarity: float) -> dict:
+        """
+        Format the cached response of a similar (e.g. reworded) claim for a new claim.
+
+        Args:
+            claim_text (str): The submitted claim
+            cached_claim (dict): Matched claim from database
+            similarity (float): Cosine similarity between the two claims
+
+        Returns:
+            dict: Cached response answering the submitted claim, with the matched claim attached
+        """
+        response = self._format_cached_response(cached_claim)
+        response["claim_text"] = claim_text
+        response["similar_claim"] = {
+            "claim_text": cached_claim.get("prompt", ""),
+            "structured_claim": response.pop("structured_claim", None),
+            "similarity": round(similarity, 3),
+        }
+        response["cache_note"] = "✓ Retrieved from research on a closely matching claim"
+        return response
@@ -0,0 +1,195 @@
+from app.core.cache import Snapshot, TTLCache, freeze, thaw
+from app.core.config import (
+    REDIS_URL, RESEARCH_CACHE_MAX_SIZE, RESEARCH_CACHE_TTL_SECONDS,
+    RESEARCH_NEGATIVE_TTL_SECONDS, RESEARCH_SEMANTIC_CACHE_ENABLED, RESEARCH_SEMANTIC_THRESHOLD,
+)
+from app.services._gemini import embed
+from app.services.claim_structuring_service import claim_signature
+import hashlib
+import logging
+import orjson
+import threading
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+log = logging.getLogger(__name__)
+
+# Research results keyed by the claim itself rather than the full request, so
+# a claim researched with a different search query or X evidence still hits.
+# Shared by every PerplexityService instance.
+_results = TTLCache(maxsize=RESEARCH_CACHE_MAX_SIZE, ttl=RESEARCH_CACHE_TTL_SECONDS)
+
+# Research that found nothing usable (no findings, or findings the caller
+# rejected), keyed by claim and search query: only the same query is
+# short-circuited, so the pipeline's retry with an alternative query still
+# runs. Short TTL so the claim is researched again once news can exist.
+_negative = TTLCache(maxsize=RESEARCH_CACHE_MAX_SIZE, ttl=RESEARCH_NEGATIVE_TTL_SECONDS)
+
+# Shared tier under _results: every worker process reads and writes the same
+# entries, so a claim researched by one worker is a hit for the others
+_REDIS_PREFIX = "pplx:"
+if REDIS_URL and redis is None:
+    log.warning("[ResearchCache] REDIS_URL is set but the redis package is not installed; using the in-process cache only")
+_redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5) if REDIS_URL and redis is not None else None
+
+# Semantic tier: (normalized claim embedding, exact key, claim_signature) entries,
+# bucketed by the non-text claim fields so only claims about the same
+# type/place/time compare. Claims that differ only in a figure or a negation
+# embed almost identically, so only entries with the same signature compare.
+_PER_BUCKET_LIMIT = 256
+_embeddings = {}
+_embeddings_lock = threading.Lock()
+
+
+def _canonical(structured_claim: dict) -> tuple:
+    """Fields that identify the claim being researched."""
+    return (
+        " ".join(structured_claim.get("claim", "").casefold().split()),
+        structured_claim.get("claim_type", ""),
+        structured_claim.get("geographic_scope", ""),
+        structured_claim.get("location", "").casefold(),
+        structured_claim.get("time_period", "").casefold(),
+    )
+
+
+def _redis_get(key: bytes):
+    """Research snapshot stored in Redis under key, or None (also when Redis is off or unreachable)."""
+    if _redis is None:
+        return None
+    try:
+        data = _redis.get(_REDIS_PREFIX + key.hex())
+    except redis.RedisError as e:
+        log.warning("[ResearchCache] Redis read failed: %s", e)
+        return None
+    return Snapshot(data) if data else None
+
+
+def _redis_set(key: bytes, snapshot):
+    """Store a research snapshot in Redis for the cache TTL; failures only skip the shared tier."""
+    if _redis is None:
+        return
+    data = snapshot.data if isinstance(snapshot, Snapshot) else orjson.dumps(snapshot)
+    try:
+        _redis.setex(_REDIS_PREFIX + key.hex(), RESEARCH_CACHE_TTL_SECONDS, data)
+    except redis.RedisError as e:
+        log.warning("[ResearchCache] Redis write failed: %s", e)
+
+
+def _key(value) -> bytes:
+    return hashlib.blake2b(orjson.dumps(value), digest_size=16).digest()
+
+
+def lookup(structured_claim: dict, search_query: str = "", claim_wide: bool = True):
+    """
+    Find cached research for a claim.
+
+    Tries an exact match on the canonical claim fields first (in process,
+    then in Redis when REDIS_URL is set), then a recent empty result for
+    the same claim and search query, then (if enabled) the most similar
+    previously researched claim with the same type, scope, location and
+    time period and the same numbers, dates and negation.
+
+    Args:
+        structured_claim (dict): Structured claim data
+        search_query (str): Query the claim is about to be researched with
+        claim_wide (bool): Use the claim-keyed tiers (exact and semantic); False
+            when the caller is retrying because the claim's research was unusable,
+            so only results for this exact search query are considered
+
+    Returns:
+        tuple: (cached result or None, token to pass to store() on a miss)
+    """
+    canonical = _canonical(structured_claim)
+    key = _key(canonical)
+
+    cached = _results.get(key) if claim_wide else None
+    if cached is None and claim_wide:
+        cached = _redis_get(key)
+        if cached is not None:
+            _results.set(key, cached)
+    if cached is not None:
+        return thaw(cached), None
+
+    negative_key = _key([canonical, search_query])
+    cached = _negative.get(negative_key)
+    if cached is not None:
+        log.debug("[ResearchCache] Recent research for this claim and query found nothing usable")
+        return thaw(cached), None
+
+    if not claim_wide or not RESEARCH_SEMANTIC_CACHE_ENABLED or not canonical[0]:
+        return None, (key, None, None, negative_key)
+
+    bucket = canonical[1:]
+    # From the claim as written: canonical[0] is casefolded, which hides month names
+    signature = claim_signature(structured_claim.get("claim", ""))
+    semantic = (bucket, canonical[0], signature)
+    with _embeddings_lock:
+        candidates = [
+            (other, other_key) for other, other_key, other_signature in _embeddings.get(bucket, ())
+            if other_signature == signature
+        ]
+    if not candidates:
+        # Nothing to compare with: store() embeds the claim only if its result is kept
+        return None, (key, semantic, None, negative_key)
+
+    embedding = embed(canonical[0])
+    if embedding is None:
+        return None, (key, None, None, negative_key)
+
+    best_key, best_score = None, RESEARCH_SEMANTIC_THRESHOLD
+    for other, other_key in candidates:
+        score = sum(a * b for a, b in zip(embedding, other))
+        if score >= best_score:
+            best_key, best_score = other_key, score
+
+    if best_key is not None:
+        cached = _results.get(best_key)
+        if cached is not None:
+            log.debug("[ResearchCache] Semantic hit (similarity %.3f)", best_score)
+            return thaw(cached), None
+
+    return None, (key, semantic, embedding, negative_key)
+
+
+def store(token, result: dict, usable: bool = None):
+    """
+    Cache research under the token returned by lookup().
+
+    Usable results are shared by every query for the claim; anything else is
+    only remembered (briefly) for the query that produced it. Adding a usable
+    result to the semantic tier may embed the claim (a blocking Gemini call).
+
+    Args:
+        token (tuple): Token from a lookup() miss (None means nothing to store)
+        result (dict): Parsed research results
+        usable (bool): Whether the caller accepted the result; defaults to
+            whether it has any findings
+    """
+    if token is None:
+        return
+    key, semantic, embedding, negative_key = token
+    if usable is None:
+        usable = bool(result.get("findings"))
+    if not usable:
+        _negative.set(negative_key, freeze(result))
+        return
+
+    snapshot = freeze(result)
+    _results.set(key, snapshot)
+    _redis_set(key, snapshot)
+
+    if semantic is None:
+        return
+    bucket, text, signature = semantic
+    if embedding is None:
+        embedding = embed(text)
+        if embedding is None:
+            return
+    with _embeddings_lock:
+        # Drop entries whose results have expired or been evicted, then bound the bucket
+        entries = [entry for entry in _embeddings.get(bucket, []) if entry[1] in _results]
+        entries.append((embedding, key, signature))
+        _embeddings[bucket] = entries[-_PER_BUCKET_LIMIT:]
@@ -1,10 +1,12 @@
-from google import genai
+from app.services._gemini import get_client
 from google.genai import types
 from PIL import Image
 from app.core.config import GEMINI_API_KEY, GEMINI_MODEL
 import tempfile
 import os
+import shutil
 import time
+from typing import BinaryIO, Union
 from pydub import AudioSegment
 
 
@@ -18,7 +20,7 @@ class TextExtractionService:
     def __init__(self):
         if not GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable is not set")
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
+        self.client = get_client()
         self.model = GEMINI_MODEL
 
     def _call_with_retry(self, func, max_retries: int = 3):
@@ -59,12 +61,32 @@ class TextExtractionService:
         # All retries failed
         raise last_error
 
-    def extract_text_from_image(self, file_content: bytes, filename: str) -> dict:
+    @staticmethod
+    def _write_temp_file(file_content: Union[bytes, BinaryIO], suffix: str) -> str:
+        """
+        Write media content to a named temporary file and return its path.
+
+        Args:
+            file_content: Raw bytes, or a binary file object which is copied in
+                chunks so large uploads are never held in memory
+            suffix (str): File extension for the temporary file
+
+        Returns:
+            str: Path to the temporary file (caller is responsible for deleting it)
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+            if isinstance(file_content, (bytes, bytearray)):
+                temp_file.write(file_content)
+            else:
+                shutil.copyfileobj(file_content, temp_file)
+            return temp_file.name
+
+    def extract_text_from_image(self, file_content: Union[bytes, BinaryIO], filename: str) -> dict:
         """
         Extract text from image using OCR (Gemini Vision).
 
         Args:
-            file_content (bytes): Image file content
+            file_content (bytes | BinaryIO): Image file content or file object
             filename (str): Filename for logging
 
         Returns:
@@ -74,9 +96,7 @@ class TextExtractionService:
         try:
             # Save file temporarily
             suffix = os.path.splitext(filename)[1] if filename else '.jpg'
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
+            temp_file_path = self._write_temp_file(file_content, suffix)
 
             # Use Gemini Vision for OCR with retry logic
             print(f"Extracting text from image: {filename}")
@@ -96,8 +116,7 @@ VISUAL CONTEXT: [brief description of relevant visual elements]
 """
 
             def make_ocr_call():
-                chat = self.client.chats.create(model=self.model)
-                return chat.send_message([ocr_prompt, image])
+                return self.client.models.generate_content(model=self.model, contents=[ocr_prompt, image])
 
             response = self._call_with_retry(make_ocr_call)
             extracted_text = response.text.strip()
@@ -118,12 +137,12 @@ VISUAL CONTEXT: [brief description of relevant visual elements]
                 except:
                     pass
 
-    def extract_text_from_video(self, file_content: bytes, filename: str) -> dict:
+    def extract_text_from_video(self, file_content: Union[bytes, BinaryIO], filename: str) -> dict:
         """
         Extract text from video (transcribe audio + OCR any visible text).
 
         Args:
-            file_content (bytes): Video file content
+            file_content (bytes | BinaryIO): Video file content or file object
             filename (str): Filename for logging
 
         Returns:
@@ -133,9 +152,7 @@ VISUAL CONTEXT: [brief description of relevant visual elements]
         try:
             # Save file temporarily
             suffix = os.path.splitext(filename)[1] if filename else '.mp4'
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
+            temp_file_path = self._write_temp_file(file_content, suffix)
 
             print(f"Extracting text from video: {filename}")
             print(f"Uploading video to Gemini Files API...")
@@ -176,8 +193,7 @@ KEY CLAIMS: [main claims to fact-check]
 """
 
             def make_extraction_call():
-                chat = self.client.chats.create(model=self.model)
-                return chat.send_message([extraction_prompt, uploaded_file])
+                return self.client.models.generate_content(model=self.model, contents=[extraction_prompt, uploaded_file])
 
             response = self._call_with_retry(make_extraction_call)
             extracted_text = response.text.strip()
@@ -207,12 +223,12 @@ KEY CLAIMS: [main claims to fact-check]
                 except:
                     pass
 
-    def extract_text_from_audio(self, file_content: bytes, filename: str, content_type: str) -> dict:
+    def extract_text_from_audio(self, file_content: Union[bytes, BinaryIO], filename: str, content_type: str) -> dict:
         """
         Extract text from audio using speech-to-text.
 
         Args:
-            file_content (bytes): Audio file content
+            file_content (bytes | BinaryIO): Audio file content or file object
             filename (str): Filename for logging
             content_type (str): MIME type of the audio
 
@@ -224,9 +240,7 @@ KEY CLAIMS: [main claims to fact-check]
         try:
             # Save file temporarily
             suffix = os.path.splitext(filename)[1] if filename else '.webm'
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
+            temp_file_path = self._write_temp_file(file_content, suffix)
 
             print(f"Extracting text from audio: {filename}")
 
@@ -291,8 +305,7 @@ CONTEXT: [relevant context]
 """
 
             def make_transcription_call():
-                chat = self.client.chats.create(model=self.model)
-                return chat.send_message([transcription_prompt, uploaded_file])
+                return self.client.models.generate_content(model=self.model, contents=[transcription_prompt, uploaded_file])
 
             response = self._call_with_retry(make_transcription_call)
             extracted_text = response.text.strip()
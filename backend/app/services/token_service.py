@@ -1,7 +1,13 @@
 import jwt
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from jwt.algorithms import get_default_algorithms
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+import hashlib
 import secrets
+import time
+
+# Upper bound on cached access-token verifications (oldest entries evicted first)
+VERIFY_CACHE_MAX_SIZE = 10_000
 
 
 class TokenService:
@@ -19,6 +25,11 @@ class TokenService:
         self.algorithm = algorithm
         self.access_token_expire_minutes = 30
         self.refresh_token_expire_days = 30
+        # Resolve the algorithm and prepare the key once instead of on every encode/decode
+        self._signing_key = get_default_algorithms()[algorithm].prepare_key(secret_key)
+        self._algorithms = [algorithm]
+        # Verified access-token payloads keyed by token digest: {key: (exp, payload)}
+        self._verify_cache: Dict[str, Tuple[float, Dict]] = {}
 
     def create_access_token(self, user_id: str, email: str) -> str:
         """
@@ -31,14 +42,15 @@ class TokenService:
         Returns:
             JWT access token
         """
+        now = datetime.now(timezone.utc)
         payload = {
             "user_id": user_id,
             "email": email,
             "type": "access",
-            "exp": datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes),
-            "iat": datetime.utcnow()
+            "exp": now + timedelta(minutes=self.access_token_expire_minutes),
+            "iat": now
         }
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
 
     def create_refresh_token(self, user_id: str, email: str) -> str:
         """
@@ -51,15 +63,16 @@ class TokenService:
         Returns:
             JWT refresh token
         """
+        now = datetime.now(timezone.utc)
         payload = {
             "user_id": user_id,
             "email": email,
             "type": "refresh",
-            "exp": datetime.utcnow() + timedelta(days=self.refresh_token_expire_days),
-            "iat": datetime.utcnow(),
+            "exp": now + timedelta(days=self.refresh_token_expire_days),
+            "iat": now,
             "jti": secrets.token_urlsafe(32)  # Unique token ID for revocation
         }
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
 
     def verify_access_token(self, token: str) -> Optional[Dict]:
         """
@@ -71,16 +84,32 @@ class TokenService:
         Returns:
             Decoded payload if valid, None otherwise
         """
+        # The same bearer token is re-sent on every request of a session, so
+        # skip the signature check and JSON decode while the token is unexpired
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        cached = self._verify_cache.get(cache_key)
+        if cached:
+            exp, payload = cached
+            if time.time() < exp:
+                return payload
+            self._verify_cache.pop(cache_key, None)
+
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._signing_key, algorithms=self._algorithms)
             if payload.get("type") != "access":
                 return None
-            return payload
         except jwt.ExpiredSignatureError:
             return None
         except jwt.InvalidTokenError:
             return None
 
+        if "exp" in payload:
+            if len(self._verify_cache) >= VERIFY_CACHE_MAX_SIZE:
+                # Dicts keep insertion order, so this drops the oldest entry
+                self._verify_cache.pop(next(iter(self._verify_cache)), None)
+            self._verify_cache[cache_key] = (payload["exp"], payload)
+        return payload
+
     def verify_refresh_token(self, token: str) -> Optional[Dict]:
         """
         Verify and decode a refresh token
@@ -92,7 +121,7 @@ class TokenService:
             Decoded payload if valid, None otherwise
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._signing_key, algorithms=self._algorithms)
             if payload.get("type") != "refresh":
                 return None
             return payload
@@ -1,4 +1,4 @@
-from google import genai
+from app.services._gemini import get_client
 from app.core.config import GEMINI_API_KEY, GEMINI_MODEL
 import requests
 from bs4 import BeautifulSoup
@@ -29,7 +29,7 @@ class URLExtractionService:
     def __init__(self):
         if not GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable is not set")
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
+        self.client = get_client()
         self.model = GEMINI_MODEL
 
     def extract_from_url(self, url: str) -> dict:
@@ -261,8 +261,6 @@ class URLExtractionService:
             # Truncate article if too long (keep first 5000 chars for analysis)
             truncated_text = article_text[:5000] if len(article_text) > 5000 else article_text
 
-            chat = self.client.chats.create(model=self.model)
-
             claim_extraction_prompt = f"""
 You are analyzing a news article or web content to identify the main factual claim(s) that should be fact-checked.
 
@@ -287,7 +285,7 @@ Format your response as:
 MAIN CLAIM: [the primary factual claim(s) to fact-check]
 """
 
-            response = chat.send_message(claim_extraction_prompt)
+            response = self.client.models.generate_content(model=self.model, contents=claim_extraction_prompt)
             result = response.text.strip()
 
             # Extract the claim from the response
@@ -14,6 +14,7 @@ External links are still extracted for backward compatibility.
 
 from app.core.config import RAPIDAPI_KEY, RAPIDAPI_HOST, X_ANALYSIS_ENABLED, X_SEARCH_LIMIT
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import json
 from urllib.parse import urlparse
@@ -36,6 +37,15 @@ class XAnalysisService:
         self.search_limit = X_SEARCH_LIMIT
         self.base_url = f"https://{self.rapidapi_host}"
 
+        # Pooled keep-alive session shared by every search, so the RapidAPI
+        # TLS handshake is paid once per connection rather than once per claim
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+        self.session.headers.update({
+            "x-rapidapi-key": self.rapidapi_key,
+            "x-rapidapi-host": self.rapidapi_host,
+        })
+
         # Tamil news X handles (priority 1)
         # Comprehensive list: all major TN newspapers, TV channels,
         # magazines, online portals, and journalist accounts
@@ -194,7 +204,7 @@ class XAnalysisService:
         # For local/district claims with regional language input,
         # use regional language terms (people tweet in their language)
         if geographic_scope in ("local", "district") and original_input:
-            is_regional = any(ord(c) > 127 for c in original_input.replace(' ', ''))
+            is_regional = not original_input.isascii()
             if is_regional:
                 original_words = [w for w in original_input.split() if len(w) > 2][:3]
                 if original_words:
@@ -220,11 +230,6 @@ class XAnalysisService:
         Returns a flat list of parsed tweet dicts with keys:
             text, created_at, author_handle, author_name, author_description, urls
         """
-        headers = {
-            "x-rapidapi-key": self.rapidapi_key,
-            "x-rapidapi-host": self.rapidapi_host,
-        }
-
         params = {
             "query": query,
             "type": "Top",
@@ -233,9 +238,8 @@ class XAnalysisService:
 
         print(f"[X Analysis] Searching RapidAPI for: {query[:80]}...")
 
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/search-v3",
-            headers=headers,
             params=params,
             timeout=15
         )
@@ -1,11 +1,28 @@
+import asyncio
+import logging
+import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.claim_api import router as claim_router
-from app.api.auth_api import router as auth_router
-from app.core.config import FRONTEND_URL
+from fastapi.responses import ORJSONResponse
+from app.api.claim_api import router as claim_router, fact_check_executor, professional_service, service
+from app.api.auth_api import router as auth_router, user_repository
+from app.middleware.auth_middleware import token_service
+from app.core.concurrency import prefetch_executor, save_executor
+from app.core.config import FRONTEND_URL, LOG_LEVEL
+from app.services import _gemini
 import os
 
-app = FastAPI()
+# Log as UTF-8 with replacement so emoji statuses can't raise on a legacy
+# (e.g. Windows cp1252) console; one handler on the root logger serves every module
+sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+logging.basicConfig(
+    level=LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+
+# orjson serializes the large fact-check payloads (and datetimes) much faster than stdlib json
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Configure CORS - Allow both local development and production frontend
 allowed_origins = [
@@ -28,6 +45,48 @@ app.add_middleware(
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(claim_router, prefix="/api/claims", tags=["Fact Checking"])
 
+@app.on_event("startup")
+async def create_indexes():
+    # Index creation is async with Motor, so it runs once here instead of at import
+    await user_repository.create_indexes()
+    # The claims collection uses the sync client; keep its index build off the event loop
+    await asyncio.to_thread(professional_service.repo.create_indexes)
+
+@app.on_event("startup")
+async def load_claim_embeddings():
+    # Rebuild the similar-claim index from saved claims so it survives restarts
+    await asyncio.to_thread(professional_service.repo.load_embeddings)
+
+@app.on_event("startup")
+async def start_background_writers():
+    service.start_save_writer()
+
+@app.on_event("shutdown")
+async def stop_background_writers():
+    # Flush pending claim saves before the executor and clients go away
+    await service.stop_save_writer()
+    await asyncio.to_thread(save_executor.shutdown, wait=True)
+
+@app.on_event("startup")
+async def warm_up():
+    # Pay first-call costs (JWT encode/decode setup, regex compilation) before serving traffic
+    token_service.verify_refresh_token(token_service.create_refresh_token("warmup", "warmup@localhost"))
+    professional_service.warm_up()
+    # Open the API connections up front so the first requests skip the handshakes
+    await asyncio.gather(
+        _gemini.warm_up(),
+        asyncio.to_thread(professional_service.perplexity.warm_up),
+    )
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    fact_check_executor.shutdown(wait=False)
+    prefetch_executor.shutdown(wait=False)
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    await professional_service.perplexity.aclose()
+
 @app.get("/")
 async def root():
     return {"message": "Fact Checker API is running. Use /api/claims endpoint."}
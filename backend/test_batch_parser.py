@@ -0,0 +1,117 @@
+"""
+Test that a batched Perplexity response is split correctly between its claims.
+Uses a canned multi-claim response, so no API key is needed.
+"""
+
+from app.services.perplexity_service import _BatchResponseParser
+import orjson
+
+CANNED_RESPONSE = """Here are the results for each claim.
+
+### CLAIM 1
+SUMMARY: The collector announced the scheme on 01.01.2025.
+SCOPE: Tamil Nadu
+FINDINGS:
+- The Hindu reported the announcement
+- The district press release confirms the date
+SOURCES:
+- https://www.thehindu.com/news/cities/chennai/scheme-launch
+RESEARCH_LIMITATIONS: None
+
+**### CLAIM 2**
+**SUMMARY:** No specific articles or reports about this event were found.
+SCOPE: India
+FINDINGS:
+- Retrieved sources were generic and did not contain specific information.
+SOURCES:
+RESEARCH_LIMITATIONS: Regional coverage may be missing.
+
+### CLAIM 9
+SUMMARY: This claim was never asked about.
+- Stray finding
+"""
+
+
+def _stream_events(text: str, chunk_size: int = 7) -> list:
+    """Split text into SSE events at fixed offsets, so chunks end mid-line."""
+    events = []
+    for start in range(0, len(text), chunk_size):
+        chunk = {"choices": [{"delta": {"content": text[start:start + chunk_size]}}]}
+        events.append("data: " + orjson.dumps(chunk).decode())
+    events.append("data: [DONE]")
+    return events
+
+
+def _parse(events: list, count: int) -> tuple:
+    """Return the per-claim results and the indexes of the claims the response covered."""
+    parser = _BatchResponseParser(count)
+    for line in events:
+        parser.feed_event(line)
+    return [claim_parser.close() for claim_parser in parser.close()], parser.seen
+
+
+def _check(results: list, seen: set) -> list:
+    """Return a list of problems with the parsed per-claim results."""
+    problems = []
+    first, second = results[:2]
+
+    if first["summary"] != "The collector announced the scheme on 01.01.2025.":
+        problems.append(f"claim 1 summary: {first['summary']!r}")
+    if first["findings"] != ["The Hindu reported the announcement", "The district press release confirms the date"]:
+        problems.append(f"claim 1 findings: {first['findings']!r}")
+    if first["sources"] != ["https://www.thehindu.com/news/cities/chennai/scheme-launch"]:
+        problems.append(f"claim 1 sources: {first['sources']!r}")
+
+    if second["summary"] != "No specific articles or reports about this event were found.":
+        problems.append(f"claim 2 summary: {second['summary']!r}")
+    if second["findings"] != ["Retrieved sources were generic and did not contain specific information."]:
+        problems.append(f"claim 2 findings: {second['findings']!r}")
+    if second["sources"]:
+        problems.append(f"claim 2 sources: {second['sources']!r}")
+    if second["research_limitations"] != "Regional coverage may be missing.":
+        problems.append(f"claim 2 limitations: {second['research_limitations']!r}")
+
+    # Text before the first header and sections for claims that weren't sent are dropped
+    for result in results:
+        if "Stray finding" in result["findings"] or "never asked" in result["summary"]:
+            problems.append("claim 9 text leaked into another claim")
+
+    # A claim the response has no section for must be reported as missing,
+    # not as an (empty) result that would be cached
+    if seen != {0, 1}:
+        problems.append(f"claims covered by the response: {sorted(seen)!r}, expected [0, 1]")
+    return problems
+
+
+def test_batch_parser():
+    """Parse the canned response streamed and as a plain JSON body, with a third claim it leaves out."""
+
+    print("=" * 80)
+    print("TESTING BATCHED RESEARCH PARSER")
+    print("=" * 80)
+
+    body = orjson.dumps({"choices": [{"message": {"content": CANNED_RESPONSE}}]}).decode()
+    cases = [
+        ("streamed response", _stream_events(CANNED_RESPONSE)),
+        ("plain JSON body", [body]),
+    ]
+
+    success = True
+    for name, events in cases:
+        problems = _check(*_parse(events, count=3))
+        if problems:
+            success = False
+            print(f"\n[ERROR] {name}:")
+            for problem in problems:
+                print(f"  - {problem}")
+        else:
+            print(f"\n[SUCCESS] {name} split correctly between claims")
+    return success
+
+
+if __name__ == "__main__":
+    success = test_batch_parser()
+    print("\n" + "=" * 80)
+    print("TEST RESULT:", "[PASS]" if success else "[FAIL]")
+    print("=" * 80)
+    exit(0 if success else 1)
@@ -29,6 +29,9 @@ def test_cache_logic():
 
     result = service.check_fact(test_claim)
 
+    # check_fact saves in the background; wait for the write before counting
+    service.wait_for_pending_saves(timeout=30)
+
     # Check the database
     count_after = claims_collection.count_documents({})
     print(f"\n[INFO] Claims in database after test: {count_after}")